@@ -1,6 +1,10 @@
 from flask import Flask
 from config import config
 from app.extensions import db, migrate, login_manager, csrf
+from app.utils.db_engines import configure_engines
+from app.utils.query_stats import init_query_stats
+from app.utils.slow_queries import init_slow_query_log
+from app.utils.request_timing import init_request_timing, phase
 import os
 
 
@@ -17,6 +21,12 @@ def create_app(config_name=None):
 
     # Initialize extensions
     db.init_app(app)
+    configure_engines(app, db)
+    if app.config.get('QUERY_STATS_ENABLED', True):
+        init_query_stats(app, db)
+    init_slow_query_log(app, db)
+    if app.config.get('REQUEST_TIMING_ENABLED', True):
+        init_request_timing(app, db)
     migrate.init_app(app, db)
     login_manager.init_app(app)
     csrf.init_app(app)
@@ -26,11 +36,15 @@ def create_app(config_name=None):
     login_manager.login_message_category = 'info'
 
     # Import models so they are registered with SQLAlchemy
-    from app.models import user, player, team, game, pitch, upload_log  # noqa: F401
+    from app.models import user, player, team, game, pitch, upload_log, data_version, player_key, data_stats, game_line  # noqa: F401
+
+    # Also registers the listeners that invalidate these caches on writes
+    from app.utils import request_cache
 
     @login_manager.user_loader
     def load_user(user_id):
-        return user.User.query.get(int(user_id))
+        with phase('auth'):
+            return request_cache.load_user(int(user_id))
 
     # Team branding context processor
     @app.context_processor
@@ -69,4 +83,7 @@ def create_app(config_name=None):
     from app.games import bp as games_bp
     app.register_blueprint(games_bp, url_prefix='/games')
 
+    from app.admin import bp as admin_bp
+    app.register_blueprint(admin_bp, url_prefix='/admin')
+
     return app
@@ -0,0 +1,93 @@
+"""Admin pages: runtime diagnostics."""
+from datetime import datetime, timezone
+
+from flask import render_template, redirect, url_for, flash, abort, current_app
+from flask_login import login_required
+
+from app.admin import bp
+from app.utils.decorators import admin_required
+from app.utils.query_stats import get_query_stats
+from app.utils.slow_queries import get_slow_query_log
+from app.utils.request_timing import get_latency_stats
+
+
+@bp.route('/queries')
+@login_required
+@admin_required
+def queries():
+    """SQL query count and DB time per endpoint since the last reset."""
+    stats = get_query_stats()
+    if stats is None:
+        abort(404)
+    return render_template(
+        'admin/queries.html',
+        endpoints=stats.endpoints(),
+        since=datetime.fromtimestamp(stats.since, timezone.utc),
+    )
+
+
+@bp.route('/queries/reset', methods=['POST'])
+@login_required
+@admin_required
+def reset_queries():
+    stats = get_query_stats()
+    if stats is None:
+        abort(404)
+    stats.reset()
+    flash('Query statistics reset.', 'info')
+    return redirect(url_for('admin.queries'))
+
+
+@bp.route('/slow-queries')
+@login_required
+@admin_required
+def slow_queries():
+    """Recent statements over SLOW_QUERY_MS, with their plans."""
+    slow_log = get_slow_query_log()
+    if slow_log is None:
+        abort(404)
+    return render_template(
+        'admin/slow_queries.html',
+        entries=slow_log.entries(),
+        threshold_ms=current_app.config['SLOW_QUERY_MS'],
+        log_path=current_app.config.get('SLOW_QUERY_LOG'),
+    )
+
+
+@bp.route('/slow-queries/clear', methods=['POST'])
+@login_required
+@admin_required
+def clear_slow_queries():
+    slow_log = get_slow_query_log()
+    if slow_log is None:
+        abort(404)
+    slow_log.clear()
+    flash('Slow query list cleared (the log file is kept).', 'info')
+    return redirect(url_for('admin.slow_queries'))
+
+
+@bp.route('/latency')
+@login_required
+@admin_required
+def latency():
+    """p50/p95/p99 request latency and mean phase times per endpoint."""
+    stats = get_latency_stats()
+    if stats is None:
+        abort(404)
+    return render_template(
+        'admin/latency.html',
+        endpoints=stats.endpoints(),
+        since=datetime.fromtimestamp(stats.since, timezone.utc),
+    )
+
+
+@bp.route('/latency/reset', methods=['POST'])
+@login_required
+@admin_required
+def reset_latency():
+    stats = get_latency_stats()
+    if stats is None:
+        abort(404)
+    stats.reset()
+    flash('Latency histograms reset.', 'info')
+    return redirect(url_for('admin.latency'))
@@ -1,11 +1,50 @@
-from flask import render_template
+from flask import render_template, request, current_app, abort
 from flask_login import login_required
+from sqlalchemy import or_
 from app.games import bp
+from app.extensions import db
 from app.models.game import Game
+from app.games.services.box_score import get_box_score
+from app.utils.pagination import keyset_paginate, InvalidCursor
 
 
 @bp.route('/')
 @login_required
 def index():
-    games = Game.query.order_by(Game.date.desc()).all()
-    return render_template('games/index.html', games=games)
+    filters = {
+        'team': request.args.get('team', '').strip().upper(),
+        'level': request.args.get('level', '').strip(),
+        'verified': request.args.get('verified', ''),
+    }
+
+    q = Game.query
+    if filters['team']:
+        q = q.filter(or_(Game.home_team == filters['team'],
+                         Game.away_team == filters['team']))
+    if filters['level']:
+        q = q.filter(Game.level == filters['level'])
+    if filters['verified'] in ('1', '0'):
+        q = q.filter(Game.is_verified == (filters['verified'] == '1'))
+
+    try:
+        page = keyset_paginate(
+            q, Game.date, Game.id, current_app.config['ITEMS_PER_PAGE'],
+            after=request.args.get('after'), before=request.args.get('before'))
+    except InvalidCursor:
+        abort(400)
+
+    levels = [level for (level,) in db.session.query(Game.level).filter(
+        Game.level.isnot(None)).distinct().order_by(Game.level)]
+
+    return render_template('games/index.html', games=page.items, page=page,
+                           filters=filters, levels=levels)
+
+
+@bp.route('/<game_id>')
+@login_required
+def detail(game_id):
+    """Box score from the lines stored at import."""
+    box = get_box_score(game_id)
+    if box is None:
+        abort(404)
+    return render_template('games/detail.html', game=box['game'], teams=box['teams'])
@@ -0,0 +1,253 @@
+"""Box scores and player game logs, precomputed at import time.
+
+Each game's pitches are read once, in pitch order, and folded into one
+line per pitcher (batters faced, pitches, strikes, whiffs, K, BB, HBP,
+H, HR, max and fastball velocity) and one line per batter (PA, AB, H,
+2B/3B/HR, BB, HBP, K, exit velocity). The lines are stored in
+game_pitcher_lines / game_batter_lines in the same transaction as the
+import, so the box score and game log pages read a handful of rows by
+key instead of aggregating pitches.
+
+The importer calls summarize_games() for every game an upload touched;
+existing databases are filled with ``flask ingest rebuild-game-lines``.
+"""
+
+import logging
+from collections import defaultdict
+
+from app.extensions import db
+from app.models.game import Game
+from app.models.game_line import GamePitcherLine, GameBatterLine
+from app.models.pitch import Pitch
+from app.models.player_key import PlayerKey
+from app.utils.pitch_metrics import STRIKE_CALLS
+
+logger = logging.getLogger(__name__)
+
+# Games per transaction when rebuilding every game
+REBUILD_BATCH_SIZE = 50
+
+SCAN_COLUMNS = (
+    Pitch.date, Pitch.pitcher_key, Pitch.pitcher_id, Pitch.pitcher,
+    Pitch.pitcher_team, Pitch.batter_key, Pitch.batter_id, Pitch.batter,
+    Pitch.batter_team, Pitch.pitch_call, Pitch.pitch_group, Pitch.rel_speed,
+    Pitch.exit_speed, Pitch.is_whiff, Pitch.is_bip, Pitch.pa_ended,
+    Pitch.play_result, Pitch.k_or_bb,
+)
+
+# role -> (line model, Pitch attribute prefix, counting columns)
+ROLES = {
+    'pitcher': (GamePitcherLine, 'pitcher',
+                ('batters_faced', 'pitches', 'strikes', 'whiffs',
+                 'k', 'bb', 'hbp', 'h', 'hr')),
+    'batter': (GameBatterLine, 'batter',
+               ('pa', 'ab', 'h', 'doubles', 'triples', 'hr',
+                'bb', 'hbp', 'k', 'batted_balls')),
+}
+
+HIT_RESULTS = {'Single': None, 'Double': 'doubles', 'Triple': 'triples', 'HomeRun': 'hr'}
+
+
+def summarize_games(game_ids):
+    """Recompute the stored lines of the given games (caller commits).
+
+    Game IDs without a games row are skipped (lines reference the game).
+    """
+    game_ids = set(game_ids)
+    known = {g for (g,) in db.session.query(Game.game_id).filter(Game.game_id.in_(game_ids))}
+    for game_id in sorted(game_ids & known):
+        rows = db.session.query(*SCAN_COLUMNS).filter(
+            Pitch.game_id == game_id,
+        ).order_by(Pitch.pitch_no, Pitch.id).all()
+
+        GamePitcherLine.query.filter_by(game_id=game_id).delete()
+        GameBatterLine.query.filter_by(game_id=game_id).delete()
+        pitchers, batters = fold_game(game_id, rows)
+        db.session.add_all(pitchers + batters)
+
+
+def rebuild_game_lines(batch_size=REBUILD_BATCH_SIZE):
+    """Recompute the lines of every game, batch_size games per commit.
+
+    Returns:
+        Number of games summarized.
+    """
+    GamePitcherLine.query.delete()
+    GameBatterLine.query.delete()
+    db.session.commit()
+
+    game_ids = [g for (g,) in db.session.query(Game.game_id).order_by(Game.game_id)]
+    for start in range(0, len(game_ids), batch_size):
+        summarize_games(game_ids[start:start + batch_size])
+        db.session.commit()
+        logger.info("Summarized %d of %d games", min(start + batch_size, len(game_ids)),
+                    len(game_ids))
+    return len(game_ids)
+
+
+def fold_game(game_id, rows):
+    """Unsaved pitcher and batter lines from one game's pitches.
+
+    Args:
+        game_id: The game's ID.
+        rows: The game's pitches (SCAN_COLUMNS) in pitch order.
+
+    Returns:
+        (pitcher lines, batter lines), each in order of appearance.
+    """
+    lines = {role: {} for role in ROLES}
+    velos = defaultdict(list)
+    fb_velos = defaultdict(list)
+    exit_speeds = defaultdict(list)
+
+    for row in rows:
+        pitcher = _line(lines, 'pitcher', game_id, row)
+        if pitcher is not None:
+            pitcher.pitches += 1
+            pitcher.strikes += row.pitch_call in STRIKE_CALLS
+            pitcher.whiffs += row.is_whiff or 0
+            if row.rel_speed is not None:
+                velos[row.pitcher_key].append(row.rel_speed)
+                if row.pitch_group == 'Fastball':
+                    fb_velos[row.pitcher_key].append(row.rel_speed)
+
+        batter = _line(lines, 'batter', game_id, row)
+        if batter is not None and row.is_bip and row.exit_speed is not None:
+            batter.batted_balls += 1
+            exit_speeds[row.batter_key].append(row.exit_speed)
+
+        if row.pa_ended:
+            if pitcher is not None:
+                pitcher.batters_faced += 1
+                _add_result(pitcher, row)
+            if batter is not None:
+                batter.pa += 1
+                _add_result(batter, row)
+                if row.k_or_bb != 'Walk' and row.play_result not in ('HitByPitch', 'Sacrifice'):
+                    batter.ab += 1
+
+    pitchers = list(lines['pitcher'].values())
+    for line in pitchers:
+        line.max_velo = _round(max(velos[line.player_key], default=None))
+        line.fb_velo = _mean(fb_velos[line.player_key])
+    batters = list(lines['batter'].values())
+    for line in batters:
+        line.avg_ev = _mean(exit_speeds[line.player_key])
+        line.max_ev = _round(max(exit_speeds[line.player_key], default=None))
+    return pitchers, batters
+
+
+def get_box_score(game_id):
+    """Stored lines of one game, grouped by team.
+
+    Returns:
+        Dict with 'game' and 'teams' (away team first), each team a dict
+        with 'team', 'batters', 'pitchers', 'batting_totals' and
+        'pitching_totals'; None if the game does not exist.
+    """
+    game = Game.query.filter_by(game_id=game_id).first()
+    if game is None:
+        return None
+
+    by_team = defaultdict(lambda: {'batters': [], 'pitchers': []})
+    for line in GameBatterLine.query.filter_by(game_id=game_id).order_by(GameBatterLine.seq):
+        by_team[line.team]['batters'].append(line)
+    for line in GamePitcherLine.query.filter_by(game_id=game_id).order_by(GamePitcherLine.seq):
+        by_team[line.team]['pitchers'].append(line)
+
+    order = [t for t in (game.away_team, game.home_team) if t in by_team]
+    order += sorted((t for t in by_team if t not in order), key=lambda t: t or '')
+
+    teams = []
+    for team in order:
+        side = by_team[team]
+        teams.append({
+            'team': team,
+            'batters': side['batters'],
+            'pitchers': side['pitchers'],
+            'batting_totals': _totals(side['batters'], ROLES['batter'][2]),
+            'pitching_totals': _totals(side['pitchers'], ROLES['pitcher'][2]),
+        })
+    return {'game': game, 'teams': teams}
+
+
+def get_game_log(role, trackman_id=None, name=None):
+    """A player's stored game lines, newest first.
+
+    Args:
+        role: 'pitcher' or 'batter'.
+        trackman_id: Trackman ID, for players that have one.
+        name: Player name, for players without a Trackman ID.
+
+    Returns:
+        List of dicts with 'line', 'game' (the Game) and 'opponent'.
+    """
+    key = PlayerKey.lookup(trackman_id=trackman_id, name=name)
+    if key is None:
+        return []
+
+    model = ROLES[role][0]
+    rows = db.session.query(model, Game).join(Game, Game.game_id == model.game_id).filter(
+        model.player_key == key,
+    ).order_by(model.date.desc(), model.game_id.desc()).all()
+
+    log = []
+    for line, game in rows:
+        if line.team == game.home_team:
+            opponent = game.away_team
+        elif line.team == game.away_team:
+            opponent = '@' + game.home_team if game.home_team else None
+        else:
+            opponent = None
+        log.append({'line': line, 'game': game, 'opponent': opponent})
+    return log
+
+
+def _line(lines, role, game_id, row):
+    """The role's line for this row's player, created on first sight."""
+    model, prefix, counters = ROLES[role]
+    player_key = getattr(row, f'{prefix}_key')
+    if player_key is None:
+        return None
+    line = lines[role].get(player_key)
+    if line is None:
+        line = model(
+            game_id=game_id,
+            player_key=player_key,
+            date=row.date,
+            trackman_id=getattr(row, f'{prefix}_id'),
+            name=getattr(row, prefix),
+            team=getattr(row, f'{prefix}_team'),
+            seq=len(lines[role]) + 1,
+            **dict.fromkeys(counters, 0),
+        )
+        lines[role][player_key] = line
+    return line
+
+
+def _add_result(line, row):
+    """Count a plate appearance's outcome on a pitcher or batter line."""
+    if row.k_or_bb == 'Strikeout':
+        line.k += 1
+    elif row.k_or_bb == 'Walk':
+        line.bb += 1
+    if row.play_result == 'HitByPitch':
+        line.hbp += 1
+    elif row.play_result in HIT_RESULTS:
+        line.h += 1
+        # Pitcher lines only count home runs among extra-base hits
+        extra = HIT_RESULTS[row.play_result]
+        if extra is not None and hasattr(line, extra):
+            setattr(line, extra, getattr(line, extra) + 1)
+
+
+def _totals(lines, counters):
+    return {c: sum(getattr(line, c) for line in lines) for c in counters}
+
+
+def _mean(values):
+    return round(sum(values) / len(values), 1) if values else None
+
+
+def _round(value):
+    return round(value, 1) if value is not None else None
@@ -3,6 +3,7 @@ from flask import render_template
 from flask_login import login_required
 from app.hitters import bp
 from app.hitters.services.hitter_stats import HitterStatsService
+from app.games.services.box_score import get_game_log
 
 
 @bp.route('/')
@@ -24,7 +25,8 @@ def detail(batter_id):
     return render_template(
         'hitters/detail.html',
         title=player['name'],
-        player=player
+        player=player,
+        game_log=get_game_log('batter', trackman_id=batter_id)
     )
 
 
@@ -41,5 +43,6 @@ def detail_by_name(batter_name):
         'hitters/detail_by_name.html',
         title=player['name'],
         player=player,
-        batter_name=batter_name
+        batter_name=batter_name,
+        game_log=get_game_log('batter', name=batter_name)
     )
@@ -1,18 +1,27 @@
 """Aggregate pitch-level data into batting statistics."""
 
-from sqlalchemy import func, case, distinct
+import pandas as pd
+from sqlalchemy import func, case, distinct, select
 from app.extensions import db
 from app.models.pitch import Pitch
 from app.utils.baseball_metrics import (
     calculate_batting_average, calculate_obp, calculate_slg, calculate_ops,
     calculate_iso, calculate_hard_hit_pct, calculate_contact_pct, pct
 )
+from app.utils.distributions import grouped_quantiles, round_quantiles
+from app.utils.grid_model import sql_pct, sql_rate
+from app.utils.player_filters import batter_filter
+from app.utils.plate_discipline import (
+    plate_discipline_columns, plate_discipline_rates,
+    plate_discipline_sort_columns,
+)
+from app.utils.seasons import date_range_clauses
 
-
-def _effective_batter_key():
-    """SQL expression: coalesce batter_id with batter name for batters
-    that have no Trackman ID."""
-    return func.coalesce(Pitch.batter_id, Pitch.batter)
+# Leaderboard row key (the leaderboard query's GROUP BY; the key
+# determines batter_id)
+LEADERBOARD_KEY = ['batter_key', 'batter', 'batter_side', 'batter_team']
+EV_QUANTILES = (0.50, 0.90)
+EV_FIELDS = ('ev_p50', 'ev_p90')
 
 
 class HitterStatsService:
@@ -22,28 +31,35 @@ class HitterStatsService:
         """Return hitter leaderboard data for AG Grid.
 
         Each row = one batter with aggregated stats.
-        Groups by coalesce(batter_id, batter_name) so batters with
-        null batter_id still appear.
+        Groups by the surrogate batter_key so batters with null
+        batter_id still appear.
         """
-        filters = filters or {}
+        rows = HitterStatsService.leaderboard_query(filters).all()
+        distributions = HitterStatsService.leaderboard_distributions(filters)
+        result = [HitterStatsService.leaderboard_row(row, distributions)
+                  for row in rows]
+
+        # Filter out batters with < 1 PA
+        result = [r for r in result if r['pa'] >= 1]
+        return result
 
-        batter_key = _effective_batter_key()
+    @staticmethod
+    def leaderboard_query(filters=None):
+        """Grouped aggregate query behind the hitting leaderboard.
 
+        Returns an unexecuted query so callers can wrap it as a subquery
+        for server-side sorting and paging.
+        """
         # Base query: group by batter key
         q = db.session.query(
+            Pitch.batter_key,
             Pitch.batter_id,
             Pitch.batter,
             Pitch.batter_side,
             Pitch.batter_team,
             func.count(distinct(Pitch.game_id)).label('games'),
             # PA = completed plate appearances
-            func.sum(case((
-                (Pitch.play_result.isnot(None)) &
-                (Pitch.play_result != 'Undefined') |
-                (Pitch.k_or_bb.isnot(None)) &
-                (Pitch.k_or_bb != 'Undefined'),
-                1
-            ), else_=0)).label('pa'),
+            func.sum(Pitch.pa_ended).label('pa'),
             # Walks, HBP, SF for AB calculation
             func.sum(case((Pitch.k_or_bb == 'Walk', 1),
                           else_=0)).label('bb'),
@@ -69,307 +85,202 @@ class HitterStatsService:
             func.max(Pitch.exit_speed).label('max_ev'),
             func.avg(case((Pitch.angle.isnot(None), Pitch.angle))
                      ).label('avg_la'),
-            func.sum(case((Pitch.exit_speed >= 95, 1),
-                          else_=0)).label('hard_hits'),
-            func.sum(case((Pitch.pitch_call == 'InPlay', 1),
-                          else_=0)).label('bip'),
+            func.sum(Pitch.is_hard_hit).label('hard_hits'),
+            func.sum(Pitch.is_bip).label('bip'),
             # Swing metrics
-            func.sum(case((Pitch.pitch_call.in_([
-                'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
-                'FoulBallFieldable', 'InPlay', 'FoulTip'
-            ]), 1), else_=0)).label('swings'),
-            func.sum(case((Pitch.pitch_call == 'StrikeSwinging', 1),
-                          else_=0)).label('whiffs'),
-        ).group_by(batter_key, Pitch.batter,
+            func.sum(Pitch.is_swing).label('swings'),
+            func.sum(Pitch.is_whiff).label('whiffs'),
+            # Zone / out-of-zone swing and contact counts
+            *plate_discipline_columns(),
+        ).group_by(Pitch.batter_key, Pitch.batter_id, Pitch.batter,
                    Pitch.batter_side, Pitch.batter_team)
 
-        # Apply filters
+        return q.filter(*HitterStatsService._leaderboard_clauses(filters))
+
+    @staticmethod
+    def _leaderboard_clauses(filters=None):
+        """WHERE clauses for the leaderboard's team/date/game filters."""
+        filters = filters or {}
+        clauses = list(date_range_clauses(filters))
         if filters.get('team'):
-            q = q.filter(Pitch.batter_team == filters['team'])
-        if filters.get('start_date'):
-            q = q.filter(Pitch.date >= filters['start_date'])
-        if filters.get('end_date'):
-            q = q.filter(Pitch.date <= filters['end_date'])
+            clauses.append(Pitch.batter_team == filters['team'])
         if filters.get('game_id'):
-            q = q.filter(Pitch.game_id == filters['game_id'])
+            clauses.append(Pitch.game_id == filters['game_id'])
+        return clauses
 
-        rows = q.all()
-        result = []
-
-        for row in rows:
-            ab = row.pa - row.bb - row.hbp - row.sf
-            h = row.singles + row.doubles + row.triples + row.hr
-            tb = (row.singles + (2 * row.doubles) +
-                  (3 * row.triples) + (4 * row.hr))
-
-            avg = calculate_batting_average(h, ab)
-            obp = calculate_obp(h, row.bb, row.hbp, ab, row.sf)
-            slg = calculate_slg(tb, ab)
-            ops_val = calculate_ops(obp, slg)
-
-            result.append({
-                'batter_id': row.batter_id,
-                'name': row.batter,
-                'bats': row.batter_side,
-                'team': row.batter_team,
-                'g': row.games,
-                'pa': row.pa,
-                'ab': ab,
-                'h': h,
-                '1b': row.singles,
-                '2b': row.doubles,
-                '3b': row.triples,
-                'hr': row.hr,
-                'bb': row.bb,
-                'k': row.k,
-                'avg': avg,
-                'obp': obp,
-                'slg': slg,
-                'ops': ops_val,
-                'iso': calculate_iso(slg, avg),
-                'k_pct': pct(row.k, row.pa),
-                'bb_pct': pct(row.bb, row.pa),
-                'hard_hit_pct': calculate_hard_hit_pct(
-                    row.hard_hits, row.bip),
-                'contact_pct': calculate_contact_pct(row.swings, row.whiffs),
-                'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
-                'max_ev': round(row.max_ev, 1) if row.max_ev else None,
-                'avg_la': round(row.avg_la, 1) if row.avg_la else None,
-            })
+    @staticmethod
+    def leaderboard_distributions(filters=None, batter_keys=None):
+        """Exit-velocity percentiles on balls in play for each leaderboard row.
 
-        # Filter out batters with < 1 PA
-        result = [r for r in result if r['pa'] >= 1]
-        return result
+        Args:
+            filters: Same filters as leaderboard_query.
+            batter_keys: Only compute these batters (a grid page).
 
-    @staticmethod
-    def get_batter_summary(batter_id):
-        """Get basic summary info for a batter by ID."""
-        # Query for player info from most recent pitch
-        row = db.session.query(
-            Pitch.batter_id,
-            Pitch.batter,
-            Pitch.batter_side,
-            Pitch.batter_team,
-            func.count(distinct(Pitch.game_id)).label('games'),
-            func.count(Pitch.id).label('pitch_count'),
-        ).filter(
-            Pitch.batter_id == batter_id
-        ).group_by(
-            Pitch.batter_id,
-            Pitch.batter,
-            Pitch.batter_side,
-            Pitch.batter_team
-        ).first()
+        Returns:
+            Dict keyed by LEADERBOARD_KEY tuples, of dicts with ev_p50
+            and ev_p90.
+        """
+        stmt = select(
+            *[Pitch.__table__.c[name] for name in LEADERBOARD_KEY],
+            Pitch.exit_speed,
+        ).where(
+            Pitch.is_bip == 1,
+            Pitch.exit_speed.isnot(None),
+            *HitterStatsService._leaderboard_clauses(filters),
+        )
+        if batter_keys is not None:
+            stmt = stmt.where(Pitch.batter_key.in_(batter_keys))
 
-        if not row:
-            return None
+        df = pd.DataFrame.from_records(db.session.execute(stmt).all(),
+                                       columns=LEADERBOARD_KEY + ['exit_speed'])
+        ev = grouped_quantiles(df, LEADERBOARD_KEY, 'exit_speed', EV_QUANTILES)
+        return {key: round_quantiles(EV_FIELDS, quantiles)
+                for key, quantiles in ev.items()}
 
-        return {
-            'trackman_id': row.batter_id,
+    @staticmethod
+    def leaderboard_row(row, distributions=None):
+        """Format one leaderboard aggregate row for the grid.
+
+        distributions is leaderboard_distributions() output; its
+        percentile fields are None for rows it does not cover.
+        """
+        ab = row.pa - row.bb - row.hbp - row.sf
+        h = row.singles + row.doubles + row.triples + row.hr
+        tb = (row.singles + (2 * row.doubles) +
+              (3 * row.triples) + (4 * row.hr))
+
+        avg = calculate_batting_average(h, ab)
+        obp = calculate_obp(h, row.bb, row.hbp, ab, row.sf)
+        slg = calculate_slg(tb, ab)
+        ops_val = calculate_ops(obp, slg)
+
+        row_data = {
+            'batter_id': row.batter_id,
             'name': row.batter,
             'bats': row.batter_side,
             'team': row.batter_team,
-            'game_count': row.games,
-            'pitch_count': row.pitch_count,
+            'g': row.games,
+            'pa': row.pa,
+            'ab': ab,
+            'h': h,
+            '1b': row.singles,
+            '2b': row.doubles,
+            '3b': row.triples,
+            'hr': row.hr,
+            'bb': row.bb,
+            'k': row.k,
+            'avg': avg,
+            'obp': obp,
+            'slg': slg,
+            'ops': ops_val,
+            'iso': calculate_iso(slg, avg),
+            'k_pct': pct(row.k, row.pa),
+            'bb_pct': pct(row.bb, row.pa),
+            'hard_hit_pct': calculate_hard_hit_pct(
+                row.hard_hits, row.bip),
+            'contact_pct': calculate_contact_pct(row.swings, row.whiffs),
+            'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
+            'max_ev': round(row.max_ev, 1) if row.max_ev else None,
+            'avg_la': round(row.avg_la, 1) if row.avg_la else None,
         }
+        row_data.update(plate_discipline_rates(row))
+        key = tuple(getattr(row, name) for name in LEADERBOARD_KEY)
+        row_data.update((distributions or {}).get(key, dict.fromkeys(EV_FIELDS)))
+        return row_data
 
     @staticmethod
-    def get_batter_summary_by_name(batter_name):
-        """Get basic summary info for a batter by name (no Trackman ID)."""
-        row = db.session.query(
-            Pitch.batter,
-            Pitch.batter_side,
-            Pitch.batter_team,
-            func.count(distinct(Pitch.game_id)).label('games'),
-            func.count(Pitch.id).label('pitch_count'),
-        ).filter(
-            Pitch.batter == batter_name,
-            Pitch.batter_id.is_(None)
-        ).group_by(
-            Pitch.batter,
-            Pitch.batter_side,
-            Pitch.batter_team
-        ).first()
-
-        if not row:
-            return None
-
+    def leaderboard_sort_columns(c):
+        """Map grid field names to SQL expressions over leaderboard_query()
+        columns (``c`` is the subquery's column collection)."""
+        ab = c.pa - c.bb - c.hbp - c.sf
+        h = c.singles + c.doubles + c.triples + c.hr
+        tb = c.singles + 2 * c.doubles + 3 * c.triples + 4 * c.hr
+        avg = sql_rate(h, ab)
+        obp = sql_rate(h + c.bb + c.hbp, ab + c.bb + c.hbp + c.sf)
+        slg = sql_rate(tb, ab)
         return {
-            'name': row.batter,
-            'bats': row.batter_side,
-            'team': row.batter_team,
-            'game_count': row.games,
-            'pitch_count': row.pitch_count,
+            'name': c.batter,
+            'bats': c.batter_side,
+            'team': c.batter_team,
+            'g': c.games,
+            'pa': c.pa,
+            'ab': ab,
+            'h': h,
+            '1b': c.singles,
+            '2b': c.doubles,
+            '3b': c.triples,
+            'hr': c.hr,
+            'bb': c.bb,
+            'k': c.k,
+            'avg': avg,
+            'obp': obp,
+            'slg': slg,
+            'ops': obp + slg,
+            'iso': slg - avg,
+            'k_pct': sql_pct(c.k, c.pa),
+            'bb_pct': sql_pct(c.bb, c.pa),
+            'hard_hit_pct': sql_pct(c.hard_hits, c.bip),
+            'contact_pct': sql_pct(c.swings - c.whiffs, c.swings),
+            'avg_ev': c.avg_ev,
+            'max_ev': c.max_ev,
+            'avg_la': c.avg_la,
+            **plate_discipline_sort_columns(c),
         }
 
     @staticmethod
-    def get_batter_splits(batter_id, filters=None):
-        """Get batting stats split by pitcher handedness (vs LHP, vs RHP)."""
-        filters = filters or {}
+    def get_batter_summary(batter_id):
+        """Get header info for a batter by ID (see player_header)."""
+        from app.stats.services.player_header import get_player_header
+        return get_player_header('batter', trackman_id=batter_id)
 
-        splits = {}
-        for hand in ['Left', 'Right']:
-            q = db.session.query(
-                func.sum(case((
-                    (Pitch.play_result.isnot(None)) &
-                    (Pitch.play_result != 'Undefined') |
-                    (Pitch.k_or_bb.isnot(None)) &
-                    (Pitch.k_or_bb != 'Undefined'),
-                    1
-                ), else_=0)).label('pa'),
-                func.sum(case((Pitch.k_or_bb == 'Walk', 1),
-                              else_=0)).label('bb'),
-                func.sum(case((Pitch.play_result == 'HitByPitch', 1),
-                              else_=0)).label('hbp'),
-                func.sum(case((Pitch.play_result == 'Sacrifice', 1),
-                              else_=0)).label('sf'),
-                func.sum(case((Pitch.play_result == 'Single', 1),
-                              else_=0)).label('singles'),
-                func.sum(case((Pitch.play_result == 'Double', 1),
-                              else_=0)).label('doubles'),
-                func.sum(case((Pitch.play_result == 'Triple', 1),
-                              else_=0)).label('triples'),
-                func.sum(case((Pitch.play_result == 'HomeRun', 1),
-                              else_=0)).label('hr'),
-                func.sum(case((Pitch.k_or_bb == 'Strikeout', 1),
-                              else_=0)).label('k'),
-                func.avg(case((Pitch.exit_speed.isnot(None),
-                               Pitch.exit_speed))).label('avg_ev'),
-            ).filter(
-                Pitch.batter_id == batter_id,
-                Pitch.pitcher_throws == hand
-            )
-
-            if filters.get('game_id'):
-                q = q.filter(Pitch.game_id == filters['game_id'])
-
-            row = q.first()
-            if row and row.pa:
-                ab = row.pa - row.bb - row.hbp - row.sf
-                h = row.singles + row.doubles + row.triples + row.hr
-                tb = (row.singles + (2 * row.doubles) +
-                      (3 * row.triples) + (4 * row.hr))
-
-                avg = calculate_batting_average(h, ab)
-                obp = calculate_obp(h, row.bb, row.hbp, ab, row.sf)
-                slg = calculate_slg(tb, ab)
-
-                splits[hand] = {
-                    'pa': row.pa,
-                    'ab': ab,
-                    'h': h,
-                    'hr': row.hr,
-                    'bb': row.bb,
-                    'k': row.k,
-                    'avg': avg,
-                    'obp': obp,
-                    'slg': slg,
-                    'ops': calculate_ops(obp, slg),
-                    'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
-                }
+    @staticmethod
+    def get_batter_summary_by_name(batter_name):
+        """Get header info for a batter by name (no Trackman ID)."""
+        from app.stats.services.player_header import get_player_header
+        return get_player_header('batter', name=batter_name)
 
-        return {'vs_lhp': splits.get('Left'), 'vs_rhp': splits.get('Right')}
+    @staticmethod
+    def _build_batter_filter(batter_id=None, batter_name=None):
+        """Return a list of SQLAlchemy filter clauses for identifying a batter."""
+        return batter_filter(batter_id=batter_id, batter_name=batter_name)
+
+    @staticmethod
+    def get_batter_splits(batter_id, filters=None):
+        """Get batting stats split by pitcher handedness (vs LHP, vs RHP)."""
+        return HitterStatsService._get_hand_splits(
+            HitterStatsService._build_batter_filter(batter_id=batter_id), filters)
 
     @staticmethod
     def get_batter_splits_by_name(batter_name, filters=None):
         """Get batting splits for name-identified batter."""
-        filters = filters or {}
+        return HitterStatsService._get_hand_splits(
+            HitterStatsService._build_batter_filter(batter_name=batter_name), filters)
 
-        splits = {}
-        for hand in ['Left', 'Right']:
-            q = db.session.query(
-                func.sum(case((
-                    (Pitch.play_result.isnot(None)) &
-                    (Pitch.play_result != 'Undefined') |
-                    (Pitch.k_or_bb.isnot(None)) &
-                    (Pitch.k_or_bb != 'Undefined'),
-                    1
-                ), else_=0)).label('pa'),
-                func.sum(case((Pitch.k_or_bb == 'Walk', 1),
-                              else_=0)).label('bb'),
-                func.sum(case((Pitch.play_result == 'HitByPitch', 1),
-                              else_=0)).label('hbp'),
-                func.sum(case((Pitch.play_result == 'Sacrifice', 1),
-                              else_=0)).label('sf'),
-                func.sum(case((Pitch.play_result == 'Single', 1),
-                              else_=0)).label('singles'),
-                func.sum(case((Pitch.play_result == 'Double', 1),
-                              else_=0)).label('doubles'),
-                func.sum(case((Pitch.play_result == 'Triple', 1),
-                              else_=0)).label('triples'),
-                func.sum(case((Pitch.play_result == 'HomeRun', 1),
-                              else_=0)).label('hr'),
-                func.sum(case((Pitch.k_or_bb == 'Strikeout', 1),
-                              else_=0)).label('k'),
-                func.avg(case((Pitch.exit_speed.isnot(None),
-                               Pitch.exit_speed))).label('avg_ev'),
-            ).filter(
-                Pitch.batter == batter_name,
-                Pitch.batter_id.is_(None),
-                Pitch.pitcher_throws == hand
-            )
-
-            if filters.get('game_id'):
-                q = q.filter(Pitch.game_id == filters['game_id'])
-
-            row = q.first()
-            if row and row.pa:
-                ab = row.pa - row.bb - row.hbp - row.sf
-                h = row.singles + row.doubles + row.triples + row.hr
-                tb = (row.singles + (2 * row.doubles) +
-                      (3 * row.triples) + (4 * row.hr))
-
-                avg = calculate_batting_average(h, ab)
-                obp = calculate_obp(h, row.bb, row.hbp, ab, row.sf)
-                slg = calculate_slg(tb, ab)
-
-                splits[hand] = {
-                    'pa': row.pa,
-                    'ab': ab,
-                    'h': h,
-                    'hr': row.hr,
-                    'bb': row.bb,
-                    'k': row.k,
-                    'avg': avg,
-                    'obp': obp,
-                    'slg': slg,
-                    'ops': calculate_ops(obp, slg),
-                    'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
-                }
+    @staticmethod
+    def _get_hand_splits(batter_filters, filters=None):
+        """vs LHP / vs RHP lines from a single split-engine query."""
+        from app.stats.services.split_engine import compute_splits
+
+        rows = compute_splits(batter_filters, ['pitcher_throws'], filters)
+        splits = {r['split']['pitcher_throws']: r for r in rows if r['pa']}
 
         return {'vs_lhp': splits.get('Left'), 'vs_rhp': splits.get('Right')}
 
     @staticmethod
     def get_batter_contact_quality(batter_id, filters=None):
         """Get exit velocity and launch angle data for charts."""
-        filters = filters or {}
-
-        q = db.session.query(
-            Pitch.exit_speed,
-            Pitch.angle,
-            Pitch.play_result,
-            Pitch.tagged_hit_type,
-        ).filter(
-            Pitch.batter_id == batter_id,
-            Pitch.exit_speed.isnot(None),
-            Pitch.angle.isnot(None)
-        )
-
-        if filters.get('game_id'):
-            q = q.filter(Pitch.game_id == filters['game_id'])
-
-        rows = q.all()
-
-        return [{
-            'exit_speed': row.exit_speed,
-            'launch_angle': row.angle,
-            'result': row.play_result,
-            'hit_type': row.tagged_hit_type,
-        } for row in rows]
+        return HitterStatsService._get_contact_quality(
+            HitterStatsService._build_batter_filter(batter_id=batter_id), filters)
 
     @staticmethod
     def get_batter_contact_quality_by_name(batter_name, filters=None):
         """Get contact quality data for name-identified batter."""
+        return HitterStatsService._get_contact_quality(
+            HitterStatsService._build_batter_filter(batter_name=batter_name), filters)
+
+    @staticmethod
+    def _get_contact_quality(batter_filters, filters=None):
+        """Exit velocity / launch angle points for one batter."""
         filters = filters or {}
 
         q = db.session.query(
@@ -378,8 +289,7 @@ class HitterStatsService:
             Pitch.play_result,
             Pitch.tagged_hit_type,
         ).filter(
-            Pitch.batter == batter_name,
-            Pitch.batter_id.is_(None),
+            *batter_filters,
             Pitch.exit_speed.isnot(None),
             Pitch.angle.isnot(None)
         )
@@ -2,4 +2,4 @@ from flask import Blueprint
 
 bp = Blueprint('ingest', __name__, template_folder='templates')
 
-from app.ingest import routes  # noqa: F401, E402
+from app.ingest import routes, commands  # noqa: F401, E402
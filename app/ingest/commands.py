@@ -0,0 +1,51 @@
+"""CLI commands for maintaining imported pitch data."""
+
+import click
+
+from app.ingest import bp
+
+
+@bp.cli.command('backfill-derived')
+@click.option('--chunk-size', default=5000, show_default=True,
+              help='Rows to recompute per transaction.')
+def backfill_derived(chunk_size):
+    """Recompute derived per-pitch columns for existing rows."""
+    from app.ingest.services.derived_columns import backfill_derived_columns
+
+    updated = backfill_derived_columns(chunk_size=chunk_size)
+    click.echo(f'Backfilled derived columns for {updated} pitches.')
+
+
+@bp.cli.command('backfill-player-keys')
+@click.option('--chunk-size', default=5000, show_default=True,
+              help='Rows to update per transaction.')
+def backfill_player_keys(chunk_size):
+    """Assign pitcher/batter/catcher player keys to existing rows."""
+    from app.ingest.services.player_keys import backfill_player_keys as backfill
+
+    updated = backfill(chunk_size=chunk_size)
+    click.echo(f'Backfilled player keys for {updated} pitches.')
+
+
+@bp.cli.command('rebuild-stats')
+def rebuild_stats():
+    """Recompute the dashboard summary table from stored data."""
+    from app.ingest.services.data_stats import rebuild_data_stats
+
+    stats = rebuild_data_stats()
+    if stats is None:
+        click.echo('No data loaded.')
+    else:
+        click.echo(f'{stats.games} games, {stats.pitches} pitches, '
+                   f'{stats.pitchers} pitchers, {stats.batters} batters.')
+
+
+@bp.cli.command('rebuild-game-lines')
+@click.option('--batch-size', default=50, show_default=True,
+              help='Games to summarize per transaction.')
+def rebuild_game_lines(batch_size):
+    """Recompute box score / game log lines for every game."""
+    from app.games.services.box_score import rebuild_game_lines as rebuild
+
+    games = rebuild(batch_size=batch_size)
+    click.echo(f'Summarized {games} games.')
@@ -1,16 +1,21 @@
 import os
 import json
-from flask import render_template, request, jsonify, Response, current_app, stream_with_context
+from flask import render_template, request, jsonify, Response, current_app, stream_with_context, abort
 from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
 from app.ingest import bp
 from app.extensions import csrf
 from app.models.upload_log import UploadLog
+from app.utils.pagination import keyset_paginate, InvalidCursor
+
+UPLOAD_STATUSES = ['processing', 'done', 'skipped', 'error']
 
 
 @bp.route('/')
 @login_required
 def index():
-    history = UploadLog.query.order_by(UploadLog.created_at.desc()).limit(20).all()
+    history = UploadLog.query.order_by(
+        UploadLog.created_at.desc().nulls_last(), UploadLog.id.desc()).limit(20).all()
     return render_template('ingest/upload.html', history=history)
 
 
@@ -56,5 +61,18 @@ csrf.exempt(upload)
 @bp.route('/history')
 @login_required
 def history():
-    logs = UploadLog.query.order_by(UploadLog.created_at.desc()).all()
-    return render_template('ingest/history.html', logs=logs)
+    status = request.args.get('status', '')
+
+    q = UploadLog.query.options(joinedload(UploadLog.uploaded_by))
+    if status:
+        q = q.filter(UploadLog.status == status)
+
+    try:
+        page = keyset_paginate(
+            q, UploadLog.created_at, UploadLog.id, current_app.config['ITEMS_PER_PAGE'],
+            after=request.args.get('after'), before=request.args.get('before'))
+    except InvalidCursor:
+        abort(400)
+
+    return render_template('ingest/history.html', logs=page.items, page=page,
+                           status=status, statuses=UPLOAD_STATUSES)
@@ -9,13 +9,27 @@ from app.models.pitch import Pitch
 from app.models.game import Game
 from app.models.player import Player
 from app.models.upload_log import UploadLog
+from app.models.data_version import DataVersion
 from app.ingest.services.csv_parser import parse_trackman_csv
 from app.ingest.services.csv_validator import coerce_types
+from app.ingest.services.derived_columns import add_derived_columns
+from app.ingest.services.player_keys import assign_player_keys
+from app.ingest.services.data_stats import record_pitches, record_game
+from app.ingest.services.partitions import ensure_season_partitions
+from app.ingest.services.pg_copy import copy_supported, copy_pitches
+from app.games.services.box_score import summarize_games
 
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 500
 
+# (Trackman ID, name, throws, team) columns of each player role
+PLAYER_FIELDS = (
+    ('pitcher_id', 'pitcher', 'pitcher_throws', 'pitcher_team'),
+    ('batter_id', 'batter', None, 'batter_team'),
+    ('catcher_id', 'catcher', 'catcher_throws', 'catcher_team'),
+)
+
 
 def compute_file_hash(filepath):
     """Compute SHA-256 hash of a file."""
@@ -72,12 +86,15 @@ def import_csv(filepath, filename, user_id=None):
 
         yield {'step': 'validating', 'message': 'Validating and coercing types...'}
         df = coerce_types(df)
+        df = add_derived_columns(df)
+        df = assign_player_keys(df)
 
         total_rows = len(df)
         log.rows_total = total_rows
         imported = 0
         skipped = 0
         errors = 0
+        touched_games = set()
 
         # Extract game info from first row
         if total_rows > 0:
@@ -89,36 +106,23 @@ def import_csv(filepath, filename, user_id=None):
 
         yield {'step': 'importing', 'message': f'Importing {total_rows} pitches...', 'total': total_rows}
 
+        # PostgreSQL: COPY each chunk through a staging table
+        use_copy = copy_supported(db.engine)
+
         # Process in chunks
         for chunk_start in range(0, total_rows, CHUNK_SIZE):
             chunk = df.iloc[chunk_start:chunk_start + CHUNK_SIZE]
-            batch = []
-
-            for _, row in chunk.iterrows():
-                pitch_uid = row.get('pitch_uid')
-                if not pitch_uid:
-                    errors += 1
-                    continue
-
-                # Skip if pitch already exists
-                if Pitch.query.filter_by(pitch_uid=pitch_uid).first():
-                    skipped += 1
-                    continue
-
-                # Auto-create players
-                _ensure_player(row, 'pitcher_id', 'pitcher', 'pitcher_throws', 'pitcher_team')
-                _ensure_player(row, 'batter_id', 'batter', None, 'batter_team')
-                if row.get('catcher_id'):
-                    _ensure_player(row, 'catcher_id', 'catcher', 'catcher_throws', 'catcher_team')
-
-                # Build pitch record
-                pitch_data = {col: row.get(col) for col in row.index if hasattr(Pitch, col)}
-                pitch_data['upload_log_id'] = log.id
-                batch.append(Pitch(**pitch_data))
-                imported += 1
-
-            if batch:
-                db.session.bulk_save_objects(batch)
+            if use_copy:
+                inserted, chunk_skipped, chunk_errors = _copy_chunk(chunk, log.id)
+            else:
+                inserted, chunk_skipped, chunk_errors = _insert_chunk(chunk, log.id)
+            imported += len(inserted)
+            skipped += chunk_skipped
+            errors += chunk_errors
+
+            if inserted:
+                record_pitches(inserted)
+                touched_games.update(p.game_id for p in inserted if p.game_id)
                 db.session.commit()
 
             yield {
@@ -143,6 +147,9 @@ def import_csv(filepath, filename, user_id=None):
         log.rows_error = errors
         log.status = 'done'
         log.completed_at = datetime.now(timezone.utc)
+        if imported:
+            summarize_games(touched_games)
+            DataVersion.bump()
         db.session.commit()
 
         yield {
@@ -164,6 +171,64 @@ def import_csv(filepath, filename, user_id=None):
         return log
 
 
+def _insert_chunk(chunk, upload_log_id):
+    """Insert a chunk through the ORM, skipping stored pitch_uids.
+
+    Returns:
+        (inserted Pitch objects, skipped count, error count).
+    """
+    batch = []
+    new_rows = []
+    seen = set()
+    skipped = 0
+    errors = 0
+
+    for _, row in chunk.iterrows():
+        pitch_uid = row.get('pitch_uid')
+        if not pitch_uid:
+            errors += 1
+            continue
+
+        # Skip if pitch already exists (stored, or earlier in this chunk)
+        if pitch_uid in seen or Pitch.query.filter_by(pitch_uid=pitch_uid).first():
+            skipped += 1
+            continue
+
+        seen.add(pitch_uid)
+        new_rows.append(row)
+
+        # Build pitch record
+        pitch_data = {col: row.get(col) for col in row.index if hasattr(Pitch, col)}
+        pitch_data['upload_log_id'] = upload_log_id
+        batch.append(Pitch(**pitch_data))
+
+    if batch:
+        _ensure_players(new_rows)
+        ensure_season_partitions({p.season for p in batch})
+        db.session.bulk_save_objects(batch)
+    return batch, skipped, errors
+
+
+def _copy_chunk(chunk, upload_log_id):
+    """Insert a chunk with COPY + merge (PostgreSQL).
+
+    Returns:
+        (inserted rows as namedtuples, skipped count, error count).
+    """
+    if 'pitch_uid' not in chunk.columns:
+        return [], 0, len(chunk)
+    valid = chunk[chunk['pitch_uid'].notna() & (chunk['pitch_uid'] != '')]
+
+    ensure_season_partitions(set(valid['season'].dropna()))
+    uids = copy_pitches(valid, upload_log_id)
+
+    new = valid[valid['pitch_uid'].isin(uids)].drop_duplicates('pitch_uid')
+    _ensure_players(new.to_dict('records'))
+    inserted = list(new.itertuples(index=False, name='Row'))
+    errors = len(chunk) - len(valid)
+    return inserted, len(valid) - len(inserted), errors
+
+
 def _ensure_game(row):
     """Create or update a Game record from a pitch row."""
     game_id = row.get('game_id')
@@ -183,38 +248,54 @@ def _ensure_game(row):
             league=row.get('league'),
         )
         db.session.add(game)
+        record_game(game)
         db.session.commit()
 
 
-def _ensure_player(row, id_field, name_field, throws_field, team_field):
-    """Create or update a Player record."""
-    trackman_id = row.get(id_field)
-    if not trackman_id:
-        return
+def _ensure_players(rows):
+    """Create or update the pitchers, batters and catchers of rows (caller commits).
 
-    try:
-        trackman_id = int(float(trackman_id))
-    except (ValueError, TypeError):
+    Rows are first folded into one entry per Trackman ID, where later
+    rows' non-empty name / throws / team win. Then every player is loaded
+    with one query and the changes are flushed together.
+    """
+    players = {}
+    for row in rows:
+        for id_field, name_field, throws_field, team_field in PLAYER_FIELDS:
+            trackman_id = _trackman_id(row.get(id_field))
+            if trackman_id is None:
+                continue
+            info = players.setdefault(trackman_id, {})
+            for attr, field in (('name', name_field), ('throws', throws_field),
+                                ('team', team_field)):
+                value = row.get(field) if field else None
+                if isinstance(value, str) and value:
+                    info[attr] = value
+    if not players:
         return
 
-    player = Player.query.filter_by(trackman_id=trackman_id).first()
-    name = row.get(name_field) if name_field else None
-
-    if player is None:
-        player = Player(
-            trackman_id=trackman_id,
-            name=name or f'Unknown ({trackman_id})',
-            throws=row.get(throws_field) if throws_field else None,
-            team=row.get(team_field) if team_field else None,
-        )
-        db.session.add(player)
-        db.session.commit()
-    else:
-        # Update with latest info
-        if name:
-            player.name = name
-        if throws_field and row.get(throws_field):
-            player.throws = row.get(throws_field)
-        if team_field and row.get(team_field):
-            player.team = row.get(team_field)
-        db.session.commit()
+    existing = {p.trackman_id: p for p in
+                Player.query.filter(Player.trackman_id.in_(players))}
+    for trackman_id, info in players.items():
+        player = existing.get(trackman_id)
+        if player is None:
+            db.session.add(Player(
+                trackman_id=trackman_id,
+                name=info.get('name') or f'Unknown ({trackman_id})',
+                throws=info.get('throws'),
+                team=info.get('team'),
+            ))
+        else:
+            # Update with latest info
+            for attr, value in info.items():
+                if getattr(player, attr) != value:
+                    setattr(player, attr, value)
+
+
+def _trackman_id(value):
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
+        return None
@@ -0,0 +1,151 @@
+"""Keep the data_stats summary table in step with imported data.
+
+The importer calls record_pitches() / record_game() before committing
+the rows they describe, so the totals change in the same transaction.
+Counters are incremented in SQL (``SET pitches = pitches + n``), like
+DataVersion.bump(), so concurrent importers never lose an update.
+Distinct pitcher and batter counts are maintained through the
+data_stats_players membership table: a player increments a season's
+count only the first time they appear in it.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from sqlalchemy import extract, update
+
+from app.extensions import db
+from app.models.data_stats import DataStats, DataStatsPlayer, ALL_SEASONS
+from app.models.game import Game
+from app.models.pitch import Pitch
+from app.models.upload_log import UploadLog
+
+logger = logging.getLogger(__name__)
+
+# role -> (Pitch key attribute, DataStats counter)
+ROLES = {
+    'pitcher': ('pitcher_key', 'pitchers'),
+    'batter': ('batter_key', 'batters'),
+}
+
+
+def record_pitches(pitches):
+    """Add newly inserted Pitch objects to the totals (caller commits)."""
+    if not pitches:
+        return
+
+    counts = defaultdict(int)
+    keys = defaultdict(set)
+    for pitch in pitches:
+        for season in _seasons(pitch.date):
+            counts[season] += 1
+            for role, (attr, _) in ROLES.items():
+                key = getattr(pitch, attr, None)
+                if key is not None:
+                    keys[(season, role)].add(key)
+
+    now = datetime.now(timezone.utc)
+    for season, count in counts.items():
+        increments = {'pitches': count}
+        for role, (_, counter) in ROLES.items():
+            increments[counter] = _add_members(season, role, keys.get((season, role), set()))
+        _increment(season, **increments)
+        _stats_row(season).last_import_at = now
+
+
+def record_game(game):
+    """Count a newly created Game (caller commits)."""
+    for season in _seasons(game.date):
+        _increment(season, games=1)
+
+
+def rebuild_data_stats():
+    """Recompute data_stats from scratch (e.g. after deleting data).
+
+    Returns:
+        The all-seasons DataStats row.
+    """
+    DataStatsPlayer.query.delete()
+    DataStats.query.delete()
+
+    season_col = extract('year', Pitch.date)
+    for season, count in db.session.query(season_col, db.func.count(Pitch.id)).group_by(season_col):
+        _add_totals(season, pitches=count)
+
+    game_season = extract('year', Game.date)
+    for season, count in db.session.query(game_season, db.func.count(Game.id)).group_by(game_season):
+        _add_totals(season, games=count)
+
+    for role, (attr, counter) in ROLES.items():
+        key_col = getattr(Pitch, attr)
+        pairs = db.session.query(season_col, key_col).filter(key_col.isnot(None)).distinct()
+        members = defaultdict(set)
+        for season, key in pairs:
+            for s in _seasons_from_year(season):
+                members[s].add(key)
+        for season, season_keys in members.items():
+            db.session.add_all(DataStatsPlayer(season=season, role=role, player_key=k)
+                               for k in season_keys)
+            setattr(_stats_row(season), counter, len(season_keys))
+
+    # Per-season import times are not recoverable; keep the overall one
+    last_import = db.session.query(db.func.max(UploadLog.completed_at)).filter(
+        UploadLog.status == 'done').scalar()
+    if last_import is not None:
+        _stats_row(ALL_SEASONS).last_import_at = last_import
+
+    db.session.commit()
+    logger.info("Rebuilt data_stats")
+    return DataStats.get()
+
+
+def _add_totals(season, pitches=0, games=0):
+    for s in _seasons_from_year(season):
+        _increment(s, pitches=pitches, games=games)
+
+
+def _seasons(date):
+    """Rows a pitch/game on this date counts toward."""
+    return _seasons_from_year(date.year if date is not None else None)
+
+
+def _seasons_from_year(year):
+    if year is None:
+        return [ALL_SEASONS]
+    return [ALL_SEASONS, int(year)]
+
+
+def _stats_row(season):
+    stats = db.session.get(DataStats, season)
+    if stats is None:
+        stats = DataStats(season=season, games=0, pitches=0, pitchers=0, batters=0)
+        db.session.add(stats)
+        # Flush so later session.get() calls in this transaction find it
+        db.session.flush()
+    return stats
+
+
+def _increment(season, **counts):
+    """Add counts to a season row's counters with a SQL-side increment."""
+    counts = {name: n for name, n in counts.items() if n}
+    _stats_row(season)
+    if counts:
+        db.session.execute(update(DataStats).where(DataStats.season == season).values(
+            {getattr(DataStats, name): getattr(DataStats, name) + n
+             for name, n in counts.items()}))
+
+
+def _add_members(season, role, keys):
+    """Insert unseen (season, role, key) members; return how many were new."""
+    if not keys:
+        return 0
+    seen = {k for (k,) in db.session.query(DataStatsPlayer.player_key).filter(
+        DataStatsPlayer.season == season,
+        DataStatsPlayer.role == role,
+        DataStatsPlayer.player_key.in_(keys),
+    )}
+    new = keys - seen
+    db.session.add_all(DataStatsPlayer(season=season, role=role, player_key=k)
+                       for k in new)
+    return len(new)
@@ -0,0 +1,156 @@
+"""Per-pitch columns derived from raw Trackman fields at ingest time.
+
+These are computed once per row, vectorized over the whole DataFrame,
+so that stats queries can filter, group and index on plain columns
+instead of re-evaluating CASE expressions on every request.
+"""
+
+import logging
+
+import pandas as pd
+
+from app.extensions import db
+from app.models.pitch import Pitch
+from app.models.data_version import DataVersion
+from app.utils.seasons import season_of
+from app.utils.pitch_metrics import (
+    PITCH_TYPE_TO_GROUP, ZONE_LEFT, ZONE_RIGHT, ZONE_BOTTOM, ZONE_TOP,
+    SWING_CALLS, WHIFF_CALLS, CSW_CALLS, BIP_CALLS, HARD_HIT_EV,
+)
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 5000
+
+# Raw columns the derivation reads (used to select rows for backfill).
+SOURCE_COLUMNS = [
+    'tagged_pitch_type',
+    'auto_pitch_type',
+    'pitch_call',
+    'play_result',
+    'k_or_bb',
+    'plate_loc_side',
+    'plate_loc_height',
+    'exit_speed',
+    'date',
+]
+
+# Columns written by add_derived_columns().
+DERIVED_COLUMNS = [
+    'effective_pitch_type',
+    'pitch_group',
+    'is_swing',
+    'is_whiff',
+    'is_csw',
+    'is_in_zone',
+    'is_bip',
+    'pa_ended',
+    'is_hard_hit',
+    'season',
+]
+
+
+def add_derived_columns(df):
+    """Add derived per-pitch columns to a coerced Trackman DataFrame.
+
+    Flags are stored as 0/1 integers so aggregates reduce to SUM(flag).
+    is_in_zone is None when the pitch has no plate location, so
+    COUNT(is_in_zone) gives the number of located pitches.
+
+    Args:
+        df: DataFrame with snake_case columns and Python-native values
+            (as returned by coerce_types).
+
+    Returns:
+        The same DataFrame with DERIVED_COLUMNS added.
+    """
+    tagged = _column(df, 'tagged_pitch_type')
+    auto = _column(df, 'auto_pitch_type')
+
+    # Prefer tagged_pitch_type, fall back to auto_pitch_type.
+    ept = tagged.where(_is_defined(tagged), auto)
+    ept = ept.where(_is_defined(ept), None)
+    df['effective_pitch_type'] = ept
+
+    group = ept.map(PITCH_TYPE_TO_GROUP).where(ept.notna(), None)
+    df['pitch_group'] = group.where(group.notna() | ept.isna(), 'Unknown')
+
+    # Pitch call classes
+    call = _column(df, 'pitch_call')
+    df['is_swing'] = _flag(call.isin(SWING_CALLS))
+    df['is_whiff'] = _flag(call.isin(WHIFF_CALLS))
+    df['is_csw'] = _flag(call.isin(CSW_CALLS))
+    df['is_bip'] = _flag(call.isin(BIP_CALLS))
+
+    # Strike zone (None when location is missing)
+    side = pd.to_numeric(_column(df, 'plate_loc_side'), errors='coerce')
+    height = pd.to_numeric(_column(df, 'plate_loc_height'), errors='coerce')
+    in_zone = side.between(ZONE_LEFT, ZONE_RIGHT) & height.between(ZONE_BOTTOM, ZONE_TOP)
+    df['is_in_zone'] = _flag(in_zone).where(side.notna() & height.notna(), None)
+
+    # Plate appearance ended on this pitch
+    df['pa_ended'] = _flag(
+        _is_defined(_column(df, 'play_result')) | _is_defined(_column(df, 'k_or_bb'))
+    )
+
+    exit_speed = pd.to_numeric(_column(df, 'exit_speed'), errors='coerce')
+    df['is_hard_hit'] = _flag(exit_speed >= HARD_HIT_EV)
+
+    # Season (the partition key; see app.utils.seasons)
+    df['season'] = _column(df, 'date').map(season_of).astype(object)
+
+    return df
+
+
+def backfill_derived_columns(chunk_size=BACKFILL_CHUNK_SIZE):
+    """Recompute DERIVED_COLUMNS for every stored pitch.
+
+    Walks the pitches table in primary-key order so memory stays bounded.
+
+    Returns:
+        Number of rows updated.
+    """
+    updated = 0
+    last_id = 0
+    source = [getattr(Pitch, col) for col in SOURCE_COLUMNS]
+
+    while True:
+        rows = db.session.query(Pitch.id, *source).filter(
+            Pitch.id > last_id,
+        ).order_by(Pitch.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        df = pd.DataFrame(rows, columns=['id'] + SOURCE_COLUMNS).astype(object)
+        df = df.where(df.notna(), None)
+        df = add_derived_columns(df)
+
+        mappings = df[['id'] + DERIVED_COLUMNS].to_dict('records')
+        db.session.bulk_update_mappings(Pitch, mappings)
+        db.session.commit()
+
+        updated += len(mappings)
+        last_id = rows[-1].id
+        logger.info("Backfilled derived columns for %d pitches", updated)
+
+    if updated:
+        DataVersion.bump()
+        db.session.commit()
+
+    return updated
+
+
+def _column(df, name):
+    """Return df[name], or an all-None Series if the CSV lacked the column."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _is_defined(series):
+    return series.notna() & (series != 'Undefined')
+
+
+def _flag(mask):
+    """Boolean Series -> Series of Python ints (0/1) safe for DB binding."""
+    return mask.fillna(False).astype(int).astype(object)
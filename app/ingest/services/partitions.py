@@ -0,0 +1,68 @@
+"""Per-season partitions of the pitches table (PostgreSQL).
+
+Migration a3f8c61d2e95 turns ``pitches`` into a table LIST-partitioned
+on ``season``, with one partition per season (``pitches_<season>``) and
+a default partition for undated rows. The importer calls
+ensure_season_partitions() before inserting a batch so each new season
+gets its own partition instead of landing in the default one.
+
+On other databases (SQLite) the table is not partitioned and these
+functions do nothing; the season column and date indexes provide the
+pruning there.
+"""
+
+import logging
+
+from sqlalchemy import text
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+# engine url -> whether pitches is partitioned there
+_partitioned = {}
+
+
+def is_partitioned(connection):
+    """Whether pitches is a partitioned table on this connection."""
+    if connection.dialect.name != 'postgresql':
+        return False
+    url = str(connection.engine.url)
+    if url not in _partitioned:
+        _partitioned[url] = connection.execute(text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass('pitches')")).first() is not None
+    return _partitioned[url]
+
+
+def ensure_season_partitions(seasons):
+    """Create missing pitches_<season> partitions (caller commits).
+
+    Args:
+        seasons: Iterable of season years; None is ignored (undated rows
+            go to the default partition).
+    """
+    connection = db.session.connection()
+    if not is_partitioned(connection):
+        return
+
+    for season in sorted({s for s in seasons if s is not None}):
+        create_season_partition(connection, season)
+
+
+def create_season_partition(connection, season):
+    """Create pitches_<season> with its primary key and pitch_uid index."""
+    name = f'pitches_{int(season)}'
+    exists = connection.execute(
+        text('SELECT to_regclass(:name)'), {'name': name}).scalar()
+    if exists:
+        return
+
+    logger.info("Creating partition %s", name)
+    connection.execute(text(
+        f'CREATE TABLE {name} PARTITION OF pitches FOR VALUES IN ({int(season)})'))
+    # Unique constraints on a partitioned table must include the
+    # partition key, so id and pitch_uid are enforced per partition.
+    connection.execute(text(f'ALTER TABLE {name} ADD PRIMARY KEY (id)'))
+    connection.execute(text(
+        f'CREATE UNIQUE INDEX ix_{name}_pitch_uid ON {name} (pitch_uid)'))
@@ -0,0 +1,102 @@
+"""COPY-based bulk insert of pitch rows (PostgreSQL).
+
+Instead of one ORM INSERT per pitch, each import chunk is streamed with
+``COPY ... FROM STDIN`` into a temporary staging table and merged into
+``pitches`` with a single INSERT ... SELECT that skips pitch_uids already
+stored.
+
+Works with psycopg2 (``copy_expert``) and psycopg 3 (``cursor.copy``);
+the driver is only touched through SQLAlchemy's raw connection.
+"""
+
+import io
+from datetime import datetime, timezone
+
+import pandas as pd
+from sqlalchemy import Integer, text
+
+from app.extensions import db
+from app.models.pitch import Pitch
+
+STAGING_TABLE = 'pitch_staging'
+
+
+def copy_supported(bind):
+    return bind.dialect.name == 'postgresql'
+
+
+def copy_pitches(df, upload_log_id):
+    """Insert the rows of df whose pitch_uid is not stored yet.
+
+    Args:
+        df: Import chunk (coerced, with derived columns and player keys).
+        upload_log_id: UploadLog the rows belong to.
+
+    Returns:
+        Set of pitch_uids actually inserted. The caller commits.
+    """
+    table = Pitch.__table__
+    columns = [c for c in df.columns if c in table.columns and c != 'id']
+    df = df[columns].assign(upload_log_id=upload_log_id,
+                            created_at=datetime.now(timezone.utc))
+    columns = list(df.columns)
+    int_columns = {c for c in columns if isinstance(table.columns[c].type, Integer)}
+
+    connection = db.session.connection()
+    column_list = ', '.join(columns)
+    connection.execute(text(
+        f'CREATE TEMP TABLE {STAGING_TABLE} AS '
+        f'SELECT {column_list} FROM pitches WITH NO DATA'))
+
+    _copy_rows(connection, f'COPY {STAGING_TABLE} ({column_list}) FROM STDIN WITH (FORMAT csv)',
+               _csv_buffer(df, columns, int_columns))
+
+    # DISTINCT ON drops duplicate rows within the file itself
+    inserted = connection.execute(text(
+        f'INSERT INTO pitches ({column_list}) '
+        f'SELECT DISTINCT ON (s.pitch_uid) {", ".join("s." + c for c in columns)} '
+        f'FROM {STAGING_TABLE} s '
+        f'WHERE NOT EXISTS (SELECT 1 FROM pitches p WHERE p.pitch_uid = s.pitch_uid) '
+        f'RETURNING pitch_uid'))
+    uids = {row.pitch_uid for row in inserted}
+
+    connection.execute(text(f'DROP TABLE {STAGING_TABLE}'))
+    return uids
+
+
+def _csv_buffer(df, columns, int_columns):
+    """Rows as COPY csv: NULL is an unquoted empty field and every string
+    is quoted, so an empty string stays an empty string."""
+    int_flags = [c in int_columns for c in columns]
+    buf = io.StringIO()
+    for values in df.itertuples(index=False, name=None):
+        buf.write(','.join(_csv_field(v, is_int) for v, is_int in zip(values, int_flags)))
+        buf.write('\n')
+    buf.seek(0)
+    return buf
+
+
+def _csv_field(value, is_int):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if hasattr(value, 'item'):  # numpy scalar
+        value = value.item()
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, float)):
+        return str(int(value)) if is_int else repr(float(value))
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_rows(connection, statement, buf):
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        if hasattr(cursor, 'copy_expert'):  # psycopg2
+            cursor.copy_expert(statement, buf)
+        else:  # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(buf.getvalue())
+    finally:
+        cursor.close()
@@ -0,0 +1,123 @@
+"""Assign surrogate integer player keys to pitch rows.
+
+Every pitcher, batter and catcher gets a PlayerKey: keyed by Trackman ID
+when the CSV has one, otherwise by name. Keys are resolved in bulk per
+DataFrame (one lookup per role, inserts only for new players) and stored
+on each pitch as pitcher_key / batter_key / catcher_key.
+"""
+
+import logging
+
+import pandas as pd
+
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.models.pitch import Pitch
+from app.models.player_key import PlayerKey
+
+logger = logging.getLogger(__name__)
+
+# role -> (Trackman ID column, name column)
+ROLES = {
+    'pitcher': ('pitcher_id', 'pitcher'),
+    'batter': ('batter_id', 'batter'),
+    'catcher': ('catcher_id', 'catcher'),
+}
+
+KEY_COLUMNS = [f'{role}_key' for role in ROLES]
+
+BACKFILL_CHUNK_SIZE = 5000
+
+
+def assign_player_keys(df):
+    """Add pitcher_key, batter_key and catcher_key columns to df.
+
+    Creates PlayerKey rows for players not seen before (flushed, not
+    committed). Rows with neither an ID nor a name get a None key.
+    """
+    identities = {role: _identities(df, id_col, name_col)
+                  for role, (id_col, name_col) in ROLES.items()}
+
+    ids = {i for ident in identities.values() for kind, i in ident.dropna() if kind == 'id'}
+    names = {n for ident in identities.values() for kind, n in ident.dropna() if kind == 'name'}
+    keys = _resolve_keys(ids, names)
+
+    for role, ident in identities.items():
+        df[f'{role}_key'] = ident.map(lambda v: keys.get(v) if v is not None else None).astype(object)
+    return df
+
+
+def backfill_player_keys(chunk_size=BACKFILL_CHUNK_SIZE):
+    """Assign player keys to every stored pitch, in primary-key order.
+
+    Returns:
+        Number of rows updated.
+    """
+    source = [col for pair in ROLES.values() for col in pair]
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = db.session.query(Pitch.id, *[getattr(Pitch, c) for c in source]).filter(
+            Pitch.id > last_id,
+        ).order_by(Pitch.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        df = pd.DataFrame(rows, columns=['id'] + source).astype(object)
+        df = df.where(df.notna(), None)
+        df = assign_player_keys(df)
+
+        db.session.bulk_update_mappings(Pitch, df[['id'] + KEY_COLUMNS].to_dict('records'))
+        db.session.commit()
+
+        updated += len(df)
+        last_id = rows[-1].id
+        logger.info("Backfilled player keys for %d pitches", updated)
+
+    if updated:
+        DataVersion.bump()
+        db.session.commit()
+
+    return updated
+
+
+def _identities(df, id_col, name_col):
+    """Series of ('id', trackman_id) / ('name', name) / None per row."""
+    ids = df[id_col] if id_col in df.columns else pd.Series(None, index=df.index, dtype=object)
+    names = df[name_col] if name_col in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+    def identity(trackman_id, name):
+        if trackman_id is not None and not pd.isna(trackman_id):
+            return ('id', int(trackman_id))
+        if name is not None and not pd.isna(name) and name != '':
+            return ('name', name)
+        return None
+
+    return pd.Series([identity(i, n) for i, n in zip(ids, names)],
+                     index=df.index, dtype=object)
+
+
+def _resolve_keys(ids, names):
+    """Map ('id', x) / ('name', x) identities to PlayerKey ids, creating
+    missing keys."""
+    keys = {}
+    if ids:
+        for key, trackman_id in db.session.query(PlayerKey.id, PlayerKey.trackman_id).filter(
+                PlayerKey.trackman_id.in_(ids)):
+            keys[('id', trackman_id)] = key
+    if names:
+        for key, name in db.session.query(PlayerKey.id, PlayerKey.name_only).filter(
+                PlayerKey.name_only.in_(names)):
+            keys[('name', name)] = key
+
+    new = [PlayerKey(trackman_id=i) for i in ids if ('id', i) not in keys]
+    new += [PlayerKey(name_only=n) for n in names if ('name', n) not in keys]
+    if new:
+        db.session.add_all(new)
+        db.session.flush()
+        for pk in new:
+            keys[('id', pk.trackman_id) if pk.trackman_id is not None
+                 else ('name', pk.name_only)] = pk.id
+
+    return keys
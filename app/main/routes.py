@@ -1,11 +1,7 @@
 from flask import render_template
 from flask_login import login_required
 from app.main import bp
-from app.extensions import db
-from app.models.pitch import Pitch
-from app.models.game import Game
-from app.models.player import Player
-from sqlalchemy import func, distinct
+from app.models.data_stats import DataStats
 
 
 @bp.route('/')
@@ -16,17 +12,12 @@ def index():
 @bp.route('/dashboard')
 @login_required
 def dashboard():
-    game_count = Game.query.count()
-    pitch_count = Pitch.query.count()
-    pitcher_count = db.session.query(func.count(distinct(
-        func.coalesce(Pitch.pitcher_id, Pitch.pitcher)
-    ))).scalar()
-    batter_count = db.session.query(func.count(distinct(
-        func.coalesce(Pitch.batter_id, Pitch.batter)
-    ))).scalar()
+    totals = DataStats.get()
 
     return render_template('dashboard.html',
-                           game_count=game_count,
-                           pitch_count=pitch_count,
-                           pitcher_count=pitcher_count,
-                           batter_count=batter_count)
+                           game_count=totals.games if totals else 0,
+                           pitch_count=totals.pitches if totals else 0,
+                           pitcher_count=totals.pitchers if totals else 0,
+                           batter_count=totals.batters if totals else 0,
+                           last_import_at=totals.last_import_at if totals else None,
+                           seasons=DataStats.recent_seasons())
@@ -0,0 +1,45 @@
+from app.extensions import db
+
+# DataStats.season value for the all-seasons totals row
+ALL_SEASONS = 0
+
+
+class DataStats(db.Model):
+    """Running totals of loaded data, one row per season plus an
+    all-seasons row (season = ALL_SEASONS).
+
+    Maintained by the importer in the same transaction as the pitches it
+    counts, so the dashboard reads a row by primary key instead of
+    scanning the pitches table.
+    """
+    __tablename__ = 'data_stats'
+
+    season = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    games = db.Column(db.Integer, nullable=False, default=0)
+    pitches = db.Column(db.Integer, nullable=False, default=0)
+    pitchers = db.Column(db.Integer, nullable=False, default=0)
+    batters = db.Column(db.Integer, nullable=False, default=0)
+    last_import_at = db.Column(db.DateTime)
+
+    @staticmethod
+    def get(season=ALL_SEASONS):
+        """Totals for one season (or all seasons); None if nothing loaded."""
+        return db.session.get(DataStats, season)
+
+    @staticmethod
+    def recent_seasons(limit=5):
+        """Per-season rows, most recent first."""
+        return DataStats.query.filter(DataStats.season != ALL_SEASONS).order_by(
+            DataStats.season.desc()).limit(limit).all()
+
+    def __repr__(self):
+        return f'<DataStats {self.season or "all"}: {self.pitches} pitches>'
+
+
+class DataStatsPlayer(db.Model):
+    """Players already counted in a season's distinct pitcher/batter totals."""
+    __tablename__ = 'data_stats_players'
+
+    season = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    role = db.Column(db.String(10), primary_key=True)
+    player_key = db.Column(db.Integer, primary_key=True, autoincrement=False)
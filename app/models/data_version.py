@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from app.extensions import db
+
+
+class DataVersion(db.Model):
+    """Single-row counter bumped whenever stored pitch data or the team
+    branding (TeamConfig) changes.
+
+    Used to build ETags for stats, heatmap and report responses.
+    """
+    __tablename__ = 'data_version'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    ROW_ID = 1
+
+    @staticmethod
+    def current():
+        """Return the current data version (0 if never bumped)."""
+        row = db.session.get(DataVersion, DataVersion.ROW_ID)
+        return row.version if row else 0
+
+    @staticmethod
+    def bump():
+        """Increment the version within the current transaction.
+
+        The caller is responsible for committing.
+        """
+        row = db.session.get(DataVersion, DataVersion.ROW_ID)
+        if row is None:
+            db.session.add(DataVersion(id=DataVersion.ROW_ID, version=1))
+            return
+        # SQL-side increment so concurrent importers never lose a bump
+        row.version = DataVersion.version + 1
+        row.updated_at = datetime.now(timezone.utc)
+
+    def __repr__(self):
+        return f'<DataVersion {self.version}>'
@@ -4,6 +4,14 @@ from app.extensions import db
 
 class Game(db.Model):
     __tablename__ = 'games'
+    # Keyset pagination of the games list, newest first, per filter
+    __table_args__ = (
+        db.Index('ix_games_date_id', 'date', 'id'),
+        db.Index('ix_games_home_team_date', 'home_team', 'date', 'id'),
+        db.Index('ix_games_away_team_date', 'away_team', 'date', 'id'),
+        db.Index('ix_games_level_date', 'level', 'date', 'id'),
+        db.Index('ix_games_verified_date', 'is_verified', 'date', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     game_id = db.Column(db.String(100), unique=True, nullable=False, index=True)
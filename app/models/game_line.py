@@ -0,0 +1,74 @@
+from app.extensions import db
+
+
+class GamePitcherLine(db.Model):
+    """One pitcher's line in one game, computed at import time from the
+    game's pitches (see app.games.services.box_score)."""
+    __tablename__ = 'game_pitcher_lines'
+    # Player game logs, newest first
+    __table_args__ = (
+        db.Index('ix_game_pitcher_lines_player_date', 'player_key', 'date'),
+    )
+
+    game_id = db.Column(db.String(100), db.ForeignKey('games.game_id'), primary_key=True)
+    player_key = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    date = db.Column(db.Date)
+    trackman_id = db.Column(db.Integer)
+    name = db.Column(db.String(100))
+    team = db.Column(db.String(50))
+    # Order of appearance within the game
+    seq = db.Column(db.Integer, nullable=False)
+
+    batters_faced = db.Column(db.Integer, nullable=False, default=0)
+    pitches = db.Column(db.Integer, nullable=False, default=0)
+    strikes = db.Column(db.Integer, nullable=False, default=0)
+    whiffs = db.Column(db.Integer, nullable=False, default=0)
+    k = db.Column(db.Integer, nullable=False, default=0)
+    bb = db.Column(db.Integer, nullable=False, default=0)
+    hbp = db.Column(db.Integer, nullable=False, default=0)
+    h = db.Column(db.Integer, nullable=False, default=0)
+    hr = db.Column(db.Integer, nullable=False, default=0)
+    max_velo = db.Column(db.Float)
+    # Mean fastball velocity
+    fb_velo = db.Column(db.Float)
+
+    def __repr__(self):
+        return f'<GamePitcherLine {self.game_id} {self.name}>'
+
+
+class GameBatterLine(db.Model):
+    """One batter's line in one game, computed at import time from the
+    game's pitches (see app.games.services.box_score)."""
+    __tablename__ = 'game_batter_lines'
+    __table_args__ = (
+        db.Index('ix_game_batter_lines_player_date', 'player_key', 'date'),
+    )
+
+    game_id = db.Column(db.String(100), db.ForeignKey('games.game_id'), primary_key=True)
+    player_key = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    date = db.Column(db.Date)
+    trackman_id = db.Column(db.Integer)
+    name = db.Column(db.String(100))
+    team = db.Column(db.String(50))
+    # Order of first plate appearance within the game
+    seq = db.Column(db.Integer, nullable=False)
+
+    pa = db.Column(db.Integer, nullable=False, default=0)
+    ab = db.Column(db.Integer, nullable=False, default=0)
+    h = db.Column(db.Integer, nullable=False, default=0)
+    doubles = db.Column(db.Integer, nullable=False, default=0)
+    triples = db.Column(db.Integer, nullable=False, default=0)
+    hr = db.Column(db.Integer, nullable=False, default=0)
+    bb = db.Column(db.Integer, nullable=False, default=0)
+    hbp = db.Column(db.Integer, nullable=False, default=0)
+    k = db.Column(db.Integer, nullable=False, default=0)
+    batted_balls = db.Column(db.Integer, nullable=False, default=0)
+    avg_ev = db.Column(db.Float)
+    max_ev = db.Column(db.Float)
+
+    @property
+    def xbh(self):
+        return self.doubles + self.triples + self.hr
+
+    def __repr__(self):
+        return f'<GameBatterLine {self.game_id} {self.name}>'
@@ -16,8 +16,18 @@ class Pitch(db.Model):
         db.Index('ix_pitches_pitcher_date', 'pitcher_id', 'date'),
         db.Index('ix_pitches_batter_date', 'batter_id', 'date'),
         db.Index('ix_pitches_game_inning', 'game_id', 'inning', 'top_bottom'),
-        db.Index('ix_pitches_pitcher_pitch_type', 'pitcher_id', 'tagged_pitch_type'),
         db.Index('ix_pitches_pitcher_team_date', 'pitcher_team', 'date'),
+        db.Index('ix_pitches_batter_team_date', 'batter_team', 'date'),
+        # Player lookups go through the surrogate keys (see PlayerKey)
+        db.Index('ix_pitches_pitcher_key_date', 'pitcher_key', 'date'),
+        db.Index('ix_pitches_batter_key_date', 'batter_key', 'date'),
+        db.Index('ix_pitches_catcher_key', 'catcher_key'),
+        db.Index('ix_pitches_pitcher_key_effective_type', 'pitcher_key', 'effective_pitch_type'),
+        # Covering indexes for the hand-split heatmap location queries
+        db.Index('ix_pitches_pitcher_side_loc', 'pitcher_key', 'batter_side',
+                 'plate_loc_side', 'plate_loc_height'),
+        db.Index('ix_pitches_batter_hand_loc', 'batter_key', 'pitcher_throws',
+                 'plate_loc_side', 'plate_loc_height'),
     )
 
     # ── Primary key & metadata ────────────────────────────────────
@@ -28,6 +38,8 @@ class Pitch(db.Model):
     # ── Game context ──────────────────────────────────────────────
     pitch_no = db.Column(db.Integer)
     date = db.Column(db.Date, index=True)
+    # Year of date; the partition key on PostgreSQL (see app.utils.seasons)
+    season = db.Column(db.Integer)
     time = db.Column(db.String(20))
     pa_of_inning = db.Column(db.Integer)
     pitch_of_pa = db.Column(db.Integer)
@@ -252,5 +264,19 @@ class Pitch(db.Model):
     catcher_throw_release_confidence = db.Column(db.Float)
     catcher_throw_location_confidence = db.Column(db.Float)
 
+    # ── Derived at ingest ─────────────────────────────────────────
+    effective_pitch_type = db.Column(db.String(30))
+    pitch_group = db.Column(db.String(20))
+    is_swing = db.Column(db.SmallInteger, default=0)
+    is_whiff = db.Column(db.SmallInteger, default=0)
+    is_csw = db.Column(db.SmallInteger, default=0)
+    is_in_zone = db.Column(db.SmallInteger)  # NULL when location is missing
+    is_bip = db.Column(db.SmallInteger, default=0)
+    pa_ended = db.Column(db.SmallInteger, default=0)
+    is_hard_hit = db.Column(db.SmallInteger, default=0)
+    pitcher_key = db.Column(db.Integer, db.ForeignKey('player_keys.id'))
+    batter_key = db.Column(db.Integer, db.ForeignKey('player_keys.id'))
+    catcher_key = db.Column(db.Integer, db.ForeignKey('player_keys.id'))
+
     def __repr__(self):
         return f'<Pitch {self.pitch_uid}: {self.pitcher} #{self.pitch_no}>'
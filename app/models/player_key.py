@@ -0,0 +1,36 @@
+from app.extensions import db
+
+
+class PlayerKey(db.Model):
+    """Stable integer key for every player seen in pitch data.
+
+    Players with a Trackman ID are keyed by that ID; players without one
+    are keyed by name (``name_only``). Pitch rows carry the key in
+    pitcher_key / batter_key / catcher_key, so stats queries group and
+    filter on a single indexed integer for both kinds of player.
+    """
+    __tablename__ = 'player_keys'
+
+    id = db.Column(db.Integer, primary_key=True)
+    trackman_id = db.Column(db.Integer, unique=True)
+    # Set only for players without a Trackman ID
+    name_only = db.Column(db.String(100), unique=True)
+
+    @staticmethod
+    def lookup(trackman_id=None, name=None):
+        """Return the key for a Trackman ID, or for a name-only player.
+
+        Returns None if the player has never appeared in pitch data.
+        """
+        if trackman_id is not None:
+            q = db.session.query(PlayerKey.id).filter(
+                PlayerKey.trackman_id == trackman_id)
+        elif name:
+            q = db.session.query(PlayerKey.id).filter(
+                PlayerKey.name_only == name)
+        else:
+            return None
+        return q.scalar()
+
+    def __repr__(self):
+        return f'<PlayerKey {self.id} ({self.trackman_id or self.name_only})>'
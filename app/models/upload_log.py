@@ -4,6 +4,11 @@ from app.extensions import db
 
 class UploadLog(db.Model):
     __tablename__ = 'upload_logs'
+    # Keyset pagination of the upload history, newest first
+    __table_args__ = (
+        db.Index('ix_upload_logs_created_id', 'created_at', 'id'),
+        db.Index('ix_upload_logs_status_created', 'status', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     filename = db.Column(db.String(255), nullable=False)
@@ -1,44 +1,57 @@
 """Pitch movement profile data for visualization."""
 
-from sqlalchemy import case, and_
+import math
+
+import numpy as np
+
 from app.extensions import db
 from app.models.pitch import Pitch
+from app.utils.columnar import to_columnar
+from app.utils.distributions import sorted_group_quantiles
+from app.utils.player_filters import pitcher_filter
+from app.utils.seasons import date_range_clauses
 
+PROFILE_FIELDS = ['pitch_type', 'horz_break', 'induced_vert_break',
+                  'rel_speed', 'spin_rate']
 
-def _effective_pitch_type():
-    """Prefer tagged_pitch_type, fall back to auto_pitch_type."""
-    return case(
-        (and_(
-            Pitch.tagged_pitch_type.isnot(None),
-            Pitch.tagged_pitch_type != 'Undefined',
-        ), Pitch.tagged_pitch_type),
-        else_=Pitch.auto_pitch_type,
-    )
+SPLIT_SIDES = {'overall': None, 'vs_rhh': 'Right', 'vs_lhh': 'Left'}
+
+# Share of a pitch type's movement covered by its summary ellipse. For a
+# bivariate normal the squared Mahalanobis radius is chi-square with 2 dof,
+# whose quantile has the closed form -2 ln(1 - p).
+ELLIPSE_CONFIDENCE = 0.90
+ELLIPSE_SCALE = math.sqrt(-2 * math.log(1 - ELLIPSE_CONFIDENCE))
+
+PERCENTILES = (10, 50, 90)
+QUANTILES = tuple(p / 100 for p in PERCENTILES)
 
 
-def get_pitch_profiles(pitcher_id=None, pitcher_name=None, filters=None):
+def get_pitch_profiles(pitcher_id=None, pitcher_name=None, filters=None,
+                       columnar=False, sample=None, summary=False):
     """
     Get pitch movement data for profile plots (HB vs IVB).
 
     Returns dict with 'overall', 'vs_rhh', 'vs_lhh' keys,
     each containing a list of pitch dicts with:
     pitch_type, horz_break, induced_vert_break, rel_speed.
+
+    With columnar=True, every pitch is sent once as a columnar table under
+    'pitches' (overall), and 'vs_rhh' / 'vs_lhh' are lists of row indices
+    into that table.
+
+    With summary=True, per-pitch-type summaries are returned under
+    'summary' instead of the individual pitches; pass sample as well to
+    get both. sample=N caps the pitches sent to N per pitch type (see
+    sample_pitch_profiles), so the payload stops growing with workload.
     """
     filters = filters or {}
 
-    if pitcher_id is not None:
-        pitcher_filters = [Pitch.pitcher_id == pitcher_id]
-    else:
-        pitcher_filters = [
-            Pitch.pitcher == pitcher_name,
-            Pitch.pitcher_id.is_(None)
-        ]
-
-    ept = _effective_pitch_type()
+    pitcher_filters = pitcher_filter(pitcher_id=pitcher_id,
+                                     pitcher_name=pitcher_name)
 
     # Query all pitches with movement data
     q = db.session.query(
-        ept.label('pitch_type'),
+        Pitch.effective_pitch_type.label('pitch_type'),
         Pitch.horz_break,
         Pitch.induced_vert_break,
         Pitch.rel_speed,
@@ -46,8 +59,7 @@ def get_pitch_profiles(pitcher_id=None, pitcher_name=None, filters=None):
         Pitch.batter_side,
     ).filter(
         *pitcher_filters,
-        ept.isnot(None),
-        ept != 'Undefined',
+        Pitch.effective_pitch_type.isnot(None),
         Pitch.horz_break.isnot(None),
         Pitch.induced_vert_break.isnot(None),
         Pitch.rel_speed.isnot(None),
@@ -55,12 +67,41 @@ def get_pitch_profiles(pitcher_id=None, pitcher_name=None, filters=None):
 
     if filters.get('game_id'):
         q = q.filter(Pitch.game_id == filters['game_id'])
-    if filters.get('start_date'):
-        q = q.filter(Pitch.date >= filters['start_date'])
-    if filters.get('end_date'):
-        q = q.filter(Pitch.date <= filters['end_date'])
+    q = q.filter(*date_range_clauses(filters))
+
+    return format_pitch_profiles(q.all(), columnar=columnar, sample=sample,
+                                 summary=summary)
+
 
-    rows = q.all()
+def format_pitch_profiles(rows, columnar=False, sample=None, summary=False):
+    """Organize profile rows (PROFILE_FIELDS plus batter_side) by split.
+
+    See get_pitch_profiles for the columnar / sample / summary options.
+    """
+    result = {}
+    if summary:
+        result['summary'] = {
+            split: summarize_pitch_profiles(
+                [r for r in rows if side is None or r.batter_side == side])
+            for split, side in SPLIT_SIDES.items()
+        }
+        if sample is None:
+            return result
+
+    if sample is not None:
+        rows = sample_pitch_profiles(rows, sample)
+
+    result.update(_profile_points(rows, columnar))
+    return result
+
+
+def _profile_points(rows, columnar):
+    if columnar:
+        return {
+            'pitches': to_columnar([row._asdict() for row in rows], PROFILE_FIELDS),
+            'vs_rhh': [i for i, row in enumerate(rows) if row.batter_side == 'Right'],
+            'vs_lhh': [i for i, row in enumerate(rows) if row.batter_side == 'Left'],
+        }
 
     # Organize by split
     result = {
@@ -85,3 +126,100 @@ def get_pitch_profiles(pitcher_id=None, pitcher_name=None, filters=None):
             result['vs_lhh'].append(pitch_data)
 
     return result
+
+
+def sample_pitch_profiles(rows, per_type):
+    """Stratified sample: at most per_type pitches of each pitch type.
+
+    Pitches are taken at evenly spaced positions within each type, so the
+    sample spans the whole date range and is deterministic for a given
+    data set (which keeps ETag-cached responses stable). Types with fewer
+    pitches are kept whole; original row order is preserved.
+    """
+    if per_type is None or not rows:
+        return rows
+
+    types = np.array([r.pitch_type for r in rows], dtype=object)
+    keep = np.zeros(len(rows), dtype=bool)
+    for pitch_type in set(types):
+        positions = np.flatnonzero(types == pitch_type)
+        if len(positions) > per_type:
+            positions = positions[np.linspace(0, len(positions) - 1,
+                                              per_type).round().astype(int)]
+        keep[positions] = True
+
+    return [rows[i] for i in np.flatnonzero(keep)]
+
+
+def summarize_pitch_profiles(rows):
+    """Per-pitch-type movement summaries, most-thrown first.
+
+    Each entry has the pitch count, mean HB/IVB/velo/spin, the HB/IVB
+    covariance matrix, the ELLIPSE_CONFIDENCE ellipse it implies
+    (semi-axes in inches, angle in degrees from the HB axis) and
+    PERCENTILES of velocity and spin.
+    """
+    if not rows:
+        return []
+
+    types = np.array([r.pitch_type for r in rows], dtype=object)
+    hb = np.array([r.horz_break for r in rows], dtype=float)
+    ivb = np.array([r.induced_vert_break for r in rows], dtype=float)
+    velo = np.array([r.rel_speed for r in rows], dtype=float)
+    spin = np.array([r.spin_rate for r in rows], dtype=float)
+
+    labels, inverse = np.unique(types, return_inverse=True)
+    counts = np.bincount(inverse)
+
+    mean_hb = np.bincount(inverse, weights=hb) / counts
+    mean_ivb = np.bincount(inverse, weights=ivb) / counts
+    mean_velo = np.bincount(inverse, weights=velo) / counts
+    spin_valid = ~np.isnan(spin)
+    spin_n = np.bincount(inverse, weights=spin_valid, minlength=len(labels))
+    spin_sum = np.bincount(inverse, weights=np.where(spin_valid, spin, 0.0),
+                           minlength=len(labels))
+
+    # Sample covariance of (HB, IVB) per type
+    dx = hb - mean_hb[inverse]
+    dy = ivb - mean_ivb[inverse]
+    dof = np.maximum(counts - 1, 1)
+    cov_xx = np.bincount(inverse, weights=dx * dx) / dof
+    cov_xy = np.bincount(inverse, weights=dx * dy) / dof
+    cov_yy = np.bincount(inverse, weights=dy * dy) / dof
+
+    # Closed-form eigen-decomposition of each 2x2 covariance matrix
+    half_trace = (cov_xx + cov_yy) / 2
+    spread = np.sqrt(((cov_xx - cov_yy) / 2) ** 2 + cov_xy ** 2)
+    major = ELLIPSE_SCALE * np.sqrt(np.maximum(half_trace + spread, 0))
+    minor = ELLIPSE_SCALE * np.sqrt(np.maximum(half_trace - spread, 0))
+    angle = np.degrees(0.5 * np.arctan2(2 * cov_xy, cov_xx - cov_yy))
+
+    velo_pcts = sorted_group_quantiles(inverse, velo, len(labels), QUANTILES)
+    spin_pcts = sorted_group_quantiles(inverse, spin, len(labels), QUANTILES)
+
+    result = []
+    for k, pitch_type in enumerate(labels):
+        entry = {
+            'pitch_type': pitch_type,
+            'count': int(counts[k]),
+            'avg_hb': round(float(mean_hb[k]), 1),
+            'avg_ivb': round(float(mean_ivb[k]), 1),
+            'avg_velo': round(float(mean_velo[k]), 1),
+            'avg_spin': round(float(spin_sum[k] / spin_n[k]), 0) if spin_n[k] else None,
+            'cov': [[round(float(cov_xx[k]), 2), round(float(cov_xy[k]), 2)],
+                    [round(float(cov_xy[k]), 2), round(float(cov_yy[k]), 2)]],
+            'ellipse': {
+                'major': round(float(major[k]), 2),
+                'minor': round(float(minor[k]), 2),
+                'angle': round(float(angle[k]), 1),
+            } if counts[k] >= 3 else None,
+        }
+        for p, value in zip(PERCENTILES, velo_pcts[k]):
+            entry[f'velo_p{p}'] = None if np.isnan(value) else round(float(value), 1)
+        for p, value in zip(PERCENTILES, spin_pcts[k]):
+            entry[f'spin_p{p}'] = None if np.isnan(value) else round(float(value), 0)
+        result.append(entry)
+
+    result.sort(key=lambda x: x['count'], reverse=True)
+    return result
+
@@ -0,0 +1,147 @@
+"""Everything a pitcher detail page needs, derived from a single scan.
+
+The page used to issue separate arsenal, usage-by-hand and pitch-profile
+requests, each re-filtering the same pitcher's rows. Here the pitcher's
+relevant columns are fetched once and every view is aggregated in pandas
+from that one result set. Formatting is shared with PitcherStatsService /
+pitch_profiles so the bundle and the individual endpoints return
+identical shapes.
+"""
+
+import pandas as pd
+
+from app.extensions import db
+from app.models.pitch import Pitch
+from app.pitchers.services.pitcher_stats import PitcherStatsService
+from app.pitchers.services.pitch_profiles import format_pitch_profiles
+from app.utils.seasons import date_range_clauses
+
+BUNDLE_COLUMNS = [
+    'batter_side', 'pitch_type', 'pitch_group',
+    'rel_speed', 'spin_rate', 'induced_vert_break', 'horz_break',
+    'extension', 'rel_height', 'exit_speed',
+    'is_in_zone', 'is_swing', 'is_whiff', 'is_csw', 'is_bip',
+]
+
+NUMERIC_COLUMNS = BUNDLE_COLUMNS[3:]
+
+
+def get_pitcher_bundle(pitcher_id=None, pitcher_name=None, filters=None,
+                       columnar=False, sample=None, summary=False):
+    """Arsenal, usage by hand and pitch profiles in one query.
+
+    Args:
+        pitcher_id: Trackman pitcher ID.
+        pitcher_name: Pitcher name, for pitchers without a Trackman ID.
+        filters: Optional game_id / start_date / end_date, applied to
+            every section.
+        columnar, sample, summary: Pitch profile options, as for
+            get_pitch_profiles.
+
+    Returns:
+        Dict with 'arsenal', 'usage_by_hand' and 'pitch_profiles'. Sections are empty if nothing matched.
+    """
+    filters = filters or {}
+    pitcher_filters = PitcherStatsService._build_pitcher_filter(
+        pitcher_id=pitcher_id, pitcher_name=pitcher_name)
+
+    q = db.session.query(
+        Pitch.batter_side,
+        Pitch.effective_pitch_type.label('pitch_type'),
+        Pitch.pitch_group,
+        Pitch.rel_speed,
+        Pitch.spin_rate,
+        Pitch.induced_vert_break,
+        Pitch.horz_break,
+        Pitch.extension,
+        Pitch.rel_height,
+        Pitch.exit_speed,
+        Pitch.is_in_zone,
+        Pitch.is_swing,
+        Pitch.is_whiff,
+        Pitch.is_csw,
+        Pitch.is_bip,
+    ).filter(*pitcher_filters)
+
+    if filters.get('game_id'):
+        q = q.filter(Pitch.game_id == filters['game_id'])
+    q = q.filter(*date_range_clauses(filters))
+
+    df = pd.DataFrame.from_records(q.all(), columns=BUNDLE_COLUMNS)
+    df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].astype(float)
+
+    typed = df[df['pitch_type'].notna()]
+
+    return {
+        'arsenal': _arsenal(typed),
+        'usage_by_hand': _usage_by_hand(typed),
+        'pitch_profiles': _pitch_profiles(typed, columnar, sample, summary),
+    }
+
+
+def _arsenal(typed):
+    """Same aggregates as PitcherStatsService._get_arsenal, in pandas."""
+    if typed.empty:
+        return []
+
+    zone = typed['is_in_zone']
+    out_zone = (zone == 0).astype(float)
+    work = typed.assign(
+        ev_bip=typed['exit_speed'].where(typed['is_bip'] == 1),
+        pd_o_pitches=out_zone,
+        pd_z_swings=zone * typed['is_swing'],
+        pd_o_swings=out_zone * typed['is_swing'],
+        pd_z_whiffs=zone * typed['is_whiff'],
+        pd_o_whiffs=out_zone * typed['is_whiff'],
+    )
+
+    agg = work.groupby(['pitch_type', 'pitch_group'], dropna=False).agg(
+        count=('pitch_type', 'size'),
+        avg_velo=('rel_speed', 'mean'),
+        min_velo=('rel_speed', 'min'),
+        max_velo=('rel_speed', 'max'),
+        avg_spin=('spin_rate', 'mean'),
+        avg_ivb=('induced_vert_break', 'mean'),
+        avg_hb=('horz_break', 'mean'),
+        avg_extension=('extension', 'mean'),
+        avg_rel_height=('rel_height', 'mean'),
+        in_zone=('is_in_zone', 'sum'),
+        with_location=('is_in_zone', 'count'),
+        swings=('is_swing', 'sum'),
+        whiffs=('is_whiff', 'sum'),
+        csw=('is_csw', 'sum'),
+        bip=('is_bip', 'sum'),
+        avg_ev=('ev_bip', 'mean'),
+        pd_z_pitches=('is_in_zone', 'sum'),
+        pd_o_pitches=('pd_o_pitches', 'sum'),
+        pd_z_swings=('pd_z_swings', 'sum'),
+        pd_o_swings=('pd_o_swings', 'sum'),
+        pd_z_whiffs=('pd_z_whiffs', 'sum'),
+        pd_o_whiffs=('pd_o_whiffs', 'sum'),
+    ).reset_index()
+
+    return PitcherStatsService.arsenal_result(
+        list(_records(agg)), PitcherStatsService.arsenal_distributions(typed))
+
+
+def _usage_by_hand(typed):
+    counts = (typed[typed['batter_side'].notna()]
+              .groupby(['batter_side', 'pitch_type'])
+              .size().rename('count').reset_index())
+    return PitcherStatsService.usage_by_hand_result(list(_records(counts)))
+
+
+def _pitch_profiles(typed, columnar, sample, summary):
+    with_movement = typed.dropna(
+        subset=['horz_break', 'induced_vert_break', 'rel_speed'])
+    fields = ['pitch_type', 'horz_break', 'induced_vert_break',
+              'rel_speed', 'spin_rate', 'batter_side']
+    return format_pitch_profiles(list(_records(with_movement[fields])),
+                                 columnar=columnar, sample=sample,
+                                 summary=summary)
+
+
+def _records(df):
+    """Iterate a frame as namedtuples of plain Python values (NaN -> None)."""
+    clean = df.astype(object).where(df.notna(), None)
+    return clean.itertuples(index=False, name='Row')
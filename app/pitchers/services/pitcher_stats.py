@@ -1,30 +1,30 @@
 """Aggregate pitch-level data into pitcher statistics."""
 
-from sqlalchemy import func, case, distinct, and_
+import pandas as pd
+from sqlalchemy import func, case, distinct, select
 from app.extensions import db
 from app.models.pitch import Pitch
-from app.pitchers.services.pitch_metrics import (
-    is_in_zone, ZONE_LEFT, ZONE_RIGHT, ZONE_BOTTOM, ZONE_TOP,
-    PITCH_TYPE_GROUPS, get_pitch_group,
-)
 from app.utils.baseball_metrics import pct, rate
+from app.utils.distributions import grouped_quantiles, round_quantiles
+from app.utils.grid_model import sql_pct
+from app.utils.player_filters import pitcher_filter
+from app.utils.plate_discipline import (
+    plate_discipline_columns, plate_discipline_rates,
+    plate_discipline_sort_columns,
+)
+from app.utils.seasons import date_range_clauses
 
-
-def _effective_pitch_type():
-    """SQL expression: prefer tagged_pitch_type, fall back to auto_pitch_type."""
-    return case(
-        (and_(
-            Pitch.tagged_pitch_type.isnot(None),
-            Pitch.tagged_pitch_type != 'Undefined',
-        ), Pitch.tagged_pitch_type),
-        else_=Pitch.auto_pitch_type,
-    )
-
-
-def _effective_pitcher_key():
-    """SQL expression: coalesce pitcher_id with a hash of pitcher name for
-    pitchers that have no Trackman ID."""
-    return func.coalesce(Pitch.pitcher_id, Pitch.pitcher)
+# Leaderboard row key (the leaderboard query's GROUP BY; the key
+# determines pitcher_id)
+LEADERBOARD_KEY = ['pitcher_key', 'pitcher', 'pitcher_throws', 'pitcher_team']
+VELO_QUANTILES = (0.10, 0.50, 0.90)
+VELO_FIELDS = ('velo_p10', 'velo_p50', 'velo_p90')
+# "Max-effort" velo: 95th percentile of fastball velocity, a steadier
+# read of top-end velo than the single hardest pitch
+MAX_EFFORT_QUANTILE = 0.95
+EV_QUANTILE = 0.90
+LEADERBOARD_DISTRIBUTION_FIELDS = VELO_FIELDS + ('max_effort_velo',)
+ARSENAL_DISTRIBUTION_FIELDS = LEADERBOARD_DISTRIBUTION_FIELDS + ('ev_p90',)
 
 
 class PitcherStatsService:
@@ -34,54 +34,47 @@ class PitcherStatsService:
         """Return pitcher leaderboard data for AG Grid.
 
         Each row = one pitcher with aggregated stats.
-        Groups by coalesce(pitcher_id, pitcher_name) so pitchers with
-        null pitcher_id still appear.
+        Groups by the surrogate pitcher_key so pitchers with null
+        pitcher_id still appear.
         """
-        filters = filters or {}
+        rows = PitcherStatsService.leaderboard_query(filters).all()
+        distributions = PitcherStatsService.leaderboard_distributions(filters)
+        return [PitcherStatsService.leaderboard_row(row, distributions) for row in rows]
 
-        pitcher_key = _effective_pitcher_key()
+    @staticmethod
+    def leaderboard_query(filters=None):
+        """Grouped aggregate query behind the pitching leaderboard.
 
+        Returns an unexecuted query so callers can wrap it as a subquery
+        for server-side sorting and paging.
+        """
         # Base query: group by pitcher key
         q = db.session.query(
+            Pitch.pitcher_key,
             Pitch.pitcher_id,
             Pitch.pitcher,
             Pitch.pitcher_throws,
             Pitch.pitcher_team,
             func.count(Pitch.id).label('total_pitches'),
             func.count(distinct(Pitch.game_id)).label('games'),
-            # Batters faced: count pitches where play_result or k_or_bb is set (PA ended)
-            func.sum(case((
-                (Pitch.play_result.isnot(None)) & (Pitch.play_result != 'Undefined') |
-                (Pitch.k_or_bb.isnot(None)) & (Pitch.k_or_bb != 'Undefined'),
-                1
-            ), else_=0)).label('bf_count'),
+            # Batters faced: pitches on which the PA ended
+            func.sum(Pitch.pa_ended).label('bf_count'),
             # Strikeouts (K)
             func.sum(case((Pitch.k_or_bb == 'Strikeout', 1), else_=0)).label('strikeouts'),
             # Walks (BB)
             func.sum(case((Pitch.k_or_bb == 'Walk', 1), else_=0)).label('walks'),
             # Balls in play
-            func.sum(case((Pitch.pitch_call == 'InPlay', 1), else_=0)).label('bip'),
-            # Called strikes
-            func.sum(case((Pitch.pitch_call == 'StrikeCalled', 1), else_=0)).label('called_strikes'),
+            func.sum(Pitch.is_bip).label('bip'),
+            # Called strikes + whiffs
+            func.sum(Pitch.is_csw).label('csw'),
             # Swinging strikes
-            func.sum(case((Pitch.pitch_call == 'StrikeSwinging', 1), else_=0)).label('swinging_strikes'),
-            # Fouls
-            func.sum(case((Pitch.pitch_call.in_(['FoulBall', 'FoulBallNotFieldable', 'FoulBallFieldable', 'FoulTip']), 1), else_=0)).label('fouls'),
+            func.sum(Pitch.is_whiff).label('swinging_strikes'),
             # Swings (all types)
-            func.sum(case((Pitch.pitch_call.in_([
-                'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
-                'FoulBallFieldable', 'InPlay', 'FoulTip'
-            ]), 1), else_=0)).label('swings'),
+            func.sum(Pitch.is_swing).label('swings'),
             # In zone pitches
-            func.sum(case((and_(
-                Pitch.plate_loc_side.between(ZONE_LEFT, ZONE_RIGHT),
-                Pitch.plate_loc_height.between(ZONE_BOTTOM, ZONE_TOP),
-            ), 1), else_=0)).label('in_zone'),
-            # Pitches with valid location
-            func.sum(case((and_(
-                Pitch.plate_loc_side.isnot(None),
-                Pitch.plate_loc_height.isnot(None),
-            ), 1), else_=0)).label('with_location'),
+            func.sum(Pitch.is_in_zone).label('in_zone'),
+            # Pitches with valid location (is_in_zone is NULL without one)
+            func.count(Pitch.is_in_zone).label('with_location'),
             # Ground balls
             func.sum(case((Pitch.tagged_hit_type == 'GroundBall', 1), else_=0)).label('ground_balls'),
             # Fly balls
@@ -96,64 +89,142 @@ class PitcherStatsService:
             func.max(Pitch.rel_speed).label('max_velo'),
             # Avg spin rate
             func.avg(case((Pitch.spin_rate.isnot(None), Pitch.spin_rate))).label('avg_spin'),
-        ).group_by(pitcher_key, Pitch.pitcher, Pitch.pitcher_throws, Pitch.pitcher_team)
+            # Zone / out-of-zone swing and contact counts
+            *plate_discipline_columns(),
+        ).group_by(Pitch.pitcher_key, Pitch.pitcher_id, Pitch.pitcher,
+                   Pitch.pitcher_throws, Pitch.pitcher_team)
+
+        return q.filter(*PitcherStatsService._leaderboard_clauses(filters))
 
-        # Apply filters
+    @staticmethod
+    def _leaderboard_clauses(filters=None):
+        """WHERE clauses for the leaderboard's team/date/game filters."""
+        filters = filters or {}
+        clauses = list(date_range_clauses(filters))
         if filters.get('team'):
-            q = q.filter(Pitch.pitcher_team == filters['team'])
-        if filters.get('start_date'):
-            q = q.filter(Pitch.date >= filters['start_date'])
-        if filters.get('end_date'):
-            q = q.filter(Pitch.date <= filters['end_date'])
+            clauses.append(Pitch.pitcher_team == filters['team'])
         if filters.get('game_id'):
-            q = q.filter(Pitch.game_id == filters['game_id'])
+            clauses.append(Pitch.game_id == filters['game_id'])
+        return clauses
 
-        rows = q.all()
-        result = []
+    @staticmethod
+    def leaderboard_distributions(filters=None, pitcher_keys=None):
+        """Velocity percentiles for each leaderboard row.
 
-        for row in rows:
-            total = row.total_pitches
-            swings = row.swings or 0
-            bip = row.bip or 0
-            in_zone = row.in_zone or 0
-            with_loc = row.with_location or 0
-            csw = (row.called_strikes or 0) + (row.swinging_strikes or 0)
-
-            # BF from completed PAs
-            bf = row.bf_count or 0
-
-            # K% and BB% calculated as percentage of batters faced, not total pitches
-            k_pct = pct(row.strikeouts, bf) if bf else None
-            bb_pct = pct(row.walks, bf) if bf else None
-            k_bb_diff = (k_pct - bb_pct) if (k_pct is not None and bb_pct is not None) else None
-
-            result.append({
-                'pitcher_id': row.pitcher_id,
-                'name': row.pitcher,
-                'throws': row.pitcher_throws,
-                'team': row.pitcher_team,
-                'g': row.games,
-                'bf': bf,
-                'p': total,
-                'k': row.strikeouts,
-                'bb': row.walks,
-                'k_pct': k_pct,
-                'bb_pct': bb_pct,
-                'k_bb_diff': k_bb_diff,
-                'csw_pct': pct(csw, total),
-                'in_zone_pct': pct(in_zone, with_loc),
-                'whiff_pct': pct(row.swinging_strikes, swings),
-                'chase_pct': None,  # Requires separate subquery
-                'gb_pct': pct(row.ground_balls, bip) if bip else None,
-                'fb_pct': pct(row.fly_balls, bip) if bip else None,
-                'hr': row.home_runs,
-                'avg_velo': round(row.avg_velo, 1) if row.avg_velo else None,
-                'max_velo': round(row.max_velo, 1) if row.max_velo else None,
-                'avg_spin': round(row.avg_spin, 0) if row.avg_spin else None,
-                'strike_pct': pct(csw + (row.fouls or 0) + bip, total),
-            })
+        Args:
+            filters: Same filters as leaderboard_query.
+            pitcher_keys: Only compute these pitchers (a grid page).
 
-        return result
+        Returns:
+            Dict keyed by LEADERBOARD_KEY tuples, of dicts with velo_p10,
+            velo_p50, velo_p90 and max_effort_velo.
+        """
+        stmt = select(
+            *[Pitch.__table__.c[name] for name in LEADERBOARD_KEY],
+            Pitch.rel_speed,
+            case((Pitch.pitch_group == 'Fastball', 1), else_=0).label('fastball'),
+        ).where(
+            Pitch.rel_speed.isnot(None),
+            *PitcherStatsService._leaderboard_clauses(filters),
+        )
+        if pitcher_keys is not None:
+            stmt = stmt.where(Pitch.pitcher_key.in_(pitcher_keys))
+
+        df = pd.DataFrame.from_records(db.session.execute(stmt).all(),
+                                       columns=LEADERBOARD_KEY + ['rel_speed', 'fastball'])
+        velo = grouped_quantiles(df, LEADERBOARD_KEY, 'rel_speed', VELO_QUANTILES)
+        max_effort = grouped_quantiles(df[df['fastball'] == 1], LEADERBOARD_KEY,
+                                       'rel_speed', (MAX_EFFORT_QUANTILE,))
+        return {
+            key: {
+                **round_quantiles(VELO_FIELDS, quantiles),
+                **round_quantiles(('max_effort_velo',), max_effort.get(key)),
+            }
+            for key, quantiles in velo.items()
+        }
+
+    @staticmethod
+    def leaderboard_row(row, distributions=None):
+        """Format one leaderboard aggregate row for the grid.
+
+        distributions is leaderboard_distributions() output; its
+        percentile fields are None for rows it does not cover.
+        """
+        total = row.total_pitches
+        swings = row.swings or 0
+        bip = row.bip or 0
+        in_zone = row.in_zone or 0
+        with_loc = row.with_location or 0
+        whiffs = row.swinging_strikes or 0
+        csw = row.csw or 0
+
+        # BF from completed PAs
+        bf = row.bf_count or 0
+
+        # K% and BB% calculated as percentage of batters faced, not total pitches
+        k_pct = pct(row.strikeouts, bf) if bf else None
+        bb_pct = pct(row.walks, bf) if bf else None
+        k_bb_diff = (k_pct - bb_pct) if (k_pct is not None and bb_pct is not None) else None
+
+        row_data = {
+            'pitcher_id': row.pitcher_id,
+            'name': row.pitcher,
+            'throws': row.pitcher_throws,
+            'team': row.pitcher_team,
+            'g': row.games,
+            'bf': bf,
+            'p': total,
+            'k': row.strikeouts,
+            'bb': row.walks,
+            'k_pct': k_pct,
+            'bb_pct': bb_pct,
+            'k_bb_diff': k_bb_diff,
+            'csw_pct': pct(csw, total),
+            'in_zone_pct': pct(in_zone, with_loc),
+            'whiff_pct': pct(whiffs, swings),
+            'gb_pct': pct(row.ground_balls, bip) if bip else None,
+            'fb_pct': pct(row.fly_balls, bip) if bip else None,
+            'hr': row.home_runs,
+            'avg_velo': round(row.avg_velo, 1) if row.avg_velo else None,
+            'max_velo': round(row.max_velo, 1) if row.max_velo else None,
+            'avg_spin': round(row.avg_spin, 0) if row.avg_spin else None,
+            # Strikes = called + swinging + fouls + in play = CSW + non-whiff swings
+            'strike_pct': pct(csw + swings - whiffs, total),
+        }
+        row_data.update(plate_discipline_rates(row))
+        key = tuple(getattr(row, name) for name in LEADERBOARD_KEY)
+        row_data.update((distributions or {}).get(
+            key, dict.fromkeys(LEADERBOARD_DISTRIBUTION_FIELDS)))
+        return row_data
+
+    @staticmethod
+    def leaderboard_sort_columns(c):
+        """Map grid field names to SQL expressions over leaderboard_query()
+        columns (``c`` is the subquery's column collection)."""
+        return {
+            'name': c.pitcher,
+            'throws': c.pitcher_throws,
+            'team': c.pitcher_team,
+            'g': c.games,
+            'bf': c.bf_count,
+            'p': c.total_pitches,
+            'k': c.strikeouts,
+            'bb': c.walks,
+            'k_pct': sql_pct(c.strikeouts, c.bf_count),
+            'bb_pct': sql_pct(c.walks, c.bf_count),
+            'k_bb_diff': sql_pct(c.strikeouts - c.walks, c.bf_count),
+            'csw_pct': sql_pct(c.csw, c.total_pitches),
+            'in_zone_pct': sql_pct(c.in_zone, c.with_location),
+            'whiff_pct': sql_pct(c.swinging_strikes, c.swings),
+            'gb_pct': sql_pct(c.ground_balls, c.bip),
+            'fb_pct': sql_pct(c.fly_balls, c.bip),
+            'hr': c.home_runs,
+            'avg_velo': c.avg_velo,
+            'max_velo': c.max_velo,
+            'avg_spin': c.avg_spin,
+            'strike_pct': sql_pct(c.csw + c.swings - c.swinging_strikes, c.total_pitches),
+            **plate_discipline_sort_columns(c),
+        }
 
     @staticmethod
     def get_pitcher_arsenal(pitcher_id, filters=None):
@@ -164,9 +235,7 @@ class PitcherStatsService:
     @staticmethod
     def _build_pitcher_filter(pitcher_id=None, pitcher_name=None):
         """Return a list of SQLAlchemy filter clauses for identifying a pitcher."""
-        if pitcher_id is not None:
-            return [Pitch.pitcher_id == pitcher_id]
-        return [Pitch.pitcher == pitcher_name, Pitch.pitcher_id.is_(None)]
+        return pitcher_filter(pitcher_id=pitcher_id, pitcher_name=pitcher_name)
 
     @staticmethod
     def get_pitcher_usage_by_hand(pitcher_id, filters=None):
@@ -194,24 +263,24 @@ class PitcherStatsService:
         """
         filters = filters or {}
 
-        ept = _effective_pitch_type()
-
         q = db.session.query(
             Pitch.batter_side,
-            ept.label('pitch_type'),
+            Pitch.effective_pitch_type.label('pitch_type'),
             func.count(Pitch.id).label('count'),
         ).filter(
             *pitcher_filters,
-            ept.isnot(None),
-            ept != 'Undefined',
+            Pitch.effective_pitch_type.isnot(None),
             Pitch.batter_side.isnot(None),
-        ).group_by(Pitch.batter_side, ept)
+        ).group_by(Pitch.batter_side, Pitch.effective_pitch_type)
 
         if filters.get('game_id'):
             q = q.filter(Pitch.game_id == filters['game_id'])
 
-        rows = q.all()
+        return PitcherStatsService.usage_by_hand_result(q.all())
 
+    @staticmethod
+    def usage_by_hand_result(rows):
+        """Format (batter_side, pitch_type, count) rows as usage % per hand."""
         usage = {'Left': {}, 'Right': {}}
         totals = {'Left': 0, 'Right': 0}
 
@@ -238,10 +307,9 @@ class PitcherStatsService:
         """Per-pitch-type breakdown using effective pitch type."""
         filters = filters or {}
 
-        ept = _effective_pitch_type()
-
         q = db.session.query(
-            ept.label('pitch_type'),
+            Pitch.effective_pitch_type.label('pitch_type'),
+            Pitch.pitch_group,
             func.count(Pitch.id).label('count'),
             func.avg(Pitch.rel_speed).label('avg_velo'),
             func.min(Pitch.rel_speed).label('min_velo'),
@@ -251,43 +319,83 @@ class PitcherStatsService:
             func.avg(Pitch.horz_break).label('avg_hb'),
             func.avg(Pitch.extension).label('avg_extension'),
             func.avg(Pitch.rel_height).label('avg_rel_height'),
-            func.sum(case((and_(
-                Pitch.plate_loc_side.between(ZONE_LEFT, ZONE_RIGHT),
-                Pitch.plate_loc_height.between(ZONE_BOTTOM, ZONE_TOP),
-            ), 1), else_=0)).label('in_zone'),
-            func.sum(case((and_(
-                Pitch.plate_loc_side.isnot(None),
-                Pitch.plate_loc_height.isnot(None),
-            ), 1), else_=0)).label('with_location'),
-            func.sum(case((Pitch.pitch_call.in_([
-                'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
-                'FoulBallFieldable', 'InPlay', 'FoulTip'
-            ]), 1), else_=0)).label('swings'),
-            func.sum(case((Pitch.pitch_call == 'StrikeSwinging', 1), else_=0)).label('whiffs'),
-            func.sum(case((Pitch.pitch_call.in_(['StrikeCalled', 'StrikeSwinging']), 1), else_=0)).label('csw'),
-            func.sum(case((Pitch.pitch_call == 'InPlay', 1), else_=0)).label('bip'),
-            func.avg(case((Pitch.pitch_call == 'InPlay', Pitch.exit_speed))).label('avg_ev'),
+            func.sum(Pitch.is_in_zone).label('in_zone'),
+            func.count(Pitch.is_in_zone).label('with_location'),
+            func.sum(Pitch.is_swing).label('swings'),
+            func.sum(Pitch.is_whiff).label('whiffs'),
+            func.sum(Pitch.is_csw).label('csw'),
+            func.sum(Pitch.is_bip).label('bip'),
+            func.avg(case((Pitch.is_bip == 1, Pitch.exit_speed))).label('avg_ev'),
+            *plate_discipline_columns(),
         ).filter(
             *pitcher_filters,
-            ept.isnot(None),
-            ept != 'Undefined',
-        ).group_by(ept)
-
-        if filters.get('start_date'):
-            q = q.filter(Pitch.date >= filters['start_date'])
-        if filters.get('end_date'):
-            q = q.filter(Pitch.date <= filters['end_date'])
+            Pitch.effective_pitch_type.isnot(None),
+        ).group_by(Pitch.effective_pitch_type, Pitch.pitch_group)
+
+        clauses = list(date_range_clauses(filters))
         if filters.get('game_id'):
-            q = q.filter(Pitch.game_id == filters['game_id'])
+            clauses.append(Pitch.game_id == filters['game_id'])
+        q = q.filter(*clauses)
+
+        values = db.session.query(
+            Pitch.effective_pitch_type.label('pitch_type'),
+            Pitch.pitch_group,
+            Pitch.rel_speed,
+            Pitch.exit_speed,
+            Pitch.is_bip,
+        ).filter(
+            *pitcher_filters,
+            *clauses,
+            Pitch.effective_pitch_type.isnot(None),
+        )
+        frame = pd.DataFrame.from_records(
+            values.all(), columns=['pitch_type', 'pitch_group', 'rel_speed',
+                                   'exit_speed', 'is_bip'])
+
+        return PitcherStatsService.arsenal_result(
+            q.all(), PitcherStatsService.arsenal_distributions(frame))
+
+    @staticmethod
+    def arsenal_distributions(frame):
+        """Velocity and exit-velocity percentiles per pitch type.
+
+        Args:
+            frame: DataFrame of the pitcher's typed pitches with
+                pitch_type, pitch_group, rel_speed, exit_speed and is_bip.
 
-        rows = q.all()
+        Returns:
+            Dict keyed by (pitch_type, pitch_group) of dicts with
+            velo_p10, velo_p50, velo_p90, max_effort_velo and ev_p90
+            (balls in play).
+        """
+        key = ['pitch_type', 'pitch_group']
+        frame = frame.astype({'rel_speed': float, 'exit_speed': float})
+        velo = grouped_quantiles(frame, key, 'rel_speed',
+                                 VELO_QUANTILES + (MAX_EFFORT_QUANTILE,))
+        ev = grouped_quantiles(frame[frame['is_bip'] == 1], key, 'exit_speed',
+                               (EV_QUANTILE,))
+        return {
+            k: {
+                **round_quantiles(LEADERBOARD_DISTRIBUTION_FIELDS, velo.get(k)),
+                **round_quantiles(('ev_p90',), ev.get(k)),
+            }
+            for k in velo.keys() | ev.keys()
+        }
+
+    @staticmethod
+    def arsenal_result(rows, distributions=None):
+        """Format per-pitch-type aggregate rows, most-thrown first.
+
+        Rows carry the labels produced by _get_arsenal's query;
+        distributions is arsenal_distributions() output.
+        """
         total_pitches = sum(r.count for r in rows)
 
         result = []
         for row in rows:
-            result.append({
+            row_data = {
                 'pitch_type': row.pitch_type,
-                'group': get_pitch_group(row.pitch_type),
+                'group': row.pitch_group,
                 'count': row.count,
                 'pct': pct(row.count, total_pitches),
                 'avg_velo': round(row.avg_velo, 1) if row.avg_velo else None,
@@ -301,7 +409,12 @@ class PitcherStatsService:
                 'whiff_pct': pct(row.whiffs, row.swings),
                 'csw_pct': pct(row.csw, row.count),
                 'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
-            })
+            }
+            row_data.update(plate_discipline_rates(row))
+            row_data.update((distributions or {}).get(
+                (row.pitch_type, row.pitch_group),
+                dict.fromkeys(ARSENAL_DISTRIBUTION_FIELDS)))
+            result.append(row_data)
 
         result.sort(key=lambda x: x['count'], reverse=True)
         return result
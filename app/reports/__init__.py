@@ -1,5 +1,9 @@
 from flask import Blueprint
+from app.utils.db_engines import use_reader_engine
 
 bp = Blueprint('reports', __name__, template_folder='templates')
 
+# Read-only analytics: query through the reader engine
+bp.before_request(use_reader_engine)
+
 from app.reports import routes  # noqa: F401, E402
@@ -2,6 +2,8 @@ from flask import render_template, request, send_file, abort
 from flask_login import login_required
 from app.reports import bp
 from app.models.player import Player
+from app.utils.conditional import conditional_get
+from app.utils.request_timing import phase
 
 
 @bp.route('/')
@@ -12,6 +14,7 @@ def index():
 
 @bp.route('/pitcher/<int:pitcher_id>/heatmap/<split>')
 @login_required
+@conditional_get
 def pitcher_heatmap(pitcher_id, split):
     """Serve a pitcher heatmap image as PNG."""
     from app.reports.services.heatmap_generator import HeatmapGenerator
@@ -33,6 +36,7 @@ def pitcher_heatmap(pitcher_id, split):
 
 @bp.route('/pitcher/by-name/<path:pitcher_name>/heatmap/<split>')
 @login_required
+@conditional_get
 def pitcher_heatmap_by_name(pitcher_name, split):
     """Serve a heatmap for a pitcher identified by name."""
     from app.reports.services.heatmap_generator import HeatmapGenerator
@@ -54,6 +58,7 @@ def pitcher_heatmap_by_name(pitcher_name, split):
 
 @bp.route('/pitcher/<int:pitcher_id>/pdf')
 @login_required
+@conditional_get
 def pitcher_pdf(pitcher_id):
     """Generate and serve a pitcher scouting report PDF."""
     from app.reports.services.pdf_generator import PitcherReportPDF
@@ -68,7 +73,8 @@ def pitcher_pdf(pitcher_id):
     filters = {k: v for k, v in filters.items() if v}
 
     pdf_gen = PitcherReportPDF(pitcher_id, player.name, filters)
-    pdf_buf = pdf_gen.generate()
+    with phase('pdf'):
+        pdf_buf = pdf_gen.generate()
     pdf_buf.seek(0)
 
     filename = f"Pitcher_Report_{player.name.replace(' ', '_').replace(',', '')}.pdf"
@@ -80,6 +86,7 @@ def pitcher_pdf(pitcher_id):
 
 @bp.route('/batter/<int:batter_id>/heatmap')
 @login_required
+@conditional_get
 def batter_heatmap(batter_id):
     """Serve a batter heatmap image as PNG."""
     from app.reports.services.hitter_heatmap_generator import \
@@ -105,6 +112,7 @@ def batter_heatmap(batter_id):
 
 @bp.route('/batter/by-name/<path:batter_name>/heatmap')
 @login_required
+@conditional_get
 def batter_heatmap_by_name(batter_name):
     """Serve a heatmap for a batter identified by name."""
     from app.reports.services.hitter_heatmap_generator import \
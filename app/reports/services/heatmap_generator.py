@@ -18,6 +18,9 @@ from scipy.stats import gaussian_kde
 
 from app.extensions import db
 from app.models.pitch import Pitch
+from app.utils.player_filters import pitcher_filter
+from app.utils.request_timing import phase
+from app.utils.seasons import date_range_clauses
 
 
 class HeatmapGenerator:
@@ -72,13 +75,14 @@ class HeatmapGenerator:
         n = len(data)
         title = f"{self._build_title(split)} (n={n})"
 
-        if n < self.MIN_DATA_POINTS:
-            return self._render_no_data(title)
+        with phase('render'):
+            if n < self.MIN_DATA_POINTS:
+                return self._render_no_data(title)
 
-        x_data = [d[0] for d in data]
-        y_data = [d[1] for d in data]
+            x_data = [d[0] for d in data]
+            y_data = [d[1] for d in data]
 
-        return self._render_heatmap(x_data, y_data, title)
+            return self._render_heatmap(x_data, y_data, title)
 
     def _get_pitch_data(self, split):
         """
@@ -90,17 +94,9 @@ class HeatmapGenerator:
         Returns:
             List of (plate_loc_side, plate_loc_height) tuples.
         """
-        if self.pitcher_id is not None:
-            pitcher_filter = Pitch.pitcher_id == self.pitcher_id
-        else:
-            from sqlalchemy import and_
-            pitcher_filter = and_(
-                Pitch.pitcher == self.pitcher_name,
-                Pitch.pitcher_id.is_(None),
-            )
-
         query = Pitch.query.filter(
-            pitcher_filter,
+            *pitcher_filter(pitcher_id=self.pitcher_id,
+                            pitcher_name=self.pitcher_name),
             Pitch.plate_loc_side.isnot(None),
             Pitch.plate_loc_height.isnot(None),
         )
@@ -111,20 +107,13 @@ class HeatmapGenerator:
         elif split == 'vs_rhh':
             query = query.filter(Pitch.batter_side == 'Right')
         elif split not in ('overall',):
-            # Treat as pitch type filter (check both tagged and auto)
-            from sqlalchemy import or_
-            query = query.filter(or_(
-                Pitch.tagged_pitch_type == split,
-                Pitch.auto_pitch_type == split,
-            ))
+            # Treat as pitch type filter
+            query = query.filter(Pitch.effective_pitch_type == split)
 
         # Apply optional filters
         if 'game_id' in self.filters:
             query = query.filter(Pitch.game_id == self.filters['game_id'])
-        if 'start_date' in self.filters:
-            query = query.filter(Pitch.date >= self.filters['start_date'])
-        if 'end_date' in self.filters:
-            query = query.filter(Pitch.date <= self.filters['end_date'])
+        query = query.filter(*date_range_clauses(self.filters))
 
         rows = query.with_entities(
             Pitch.plate_loc_side,
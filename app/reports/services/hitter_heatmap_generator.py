@@ -18,6 +18,9 @@ from scipy.stats import gaussian_kde
 
 from app.extensions import db
 from app.models.pitch import Pitch
+from app.utils.player_filters import batter_filter
+from app.utils.request_timing import phase
+from app.utils.seasons import date_range_clauses
 
 
 class HitterHeatmapGenerator:
@@ -74,13 +77,14 @@ class HitterHeatmapGenerator:
         n = len(data)
         title = f"{self._build_title(split, heatmap_type)} (n={n})"
 
-        if n < self.MIN_DATA_POINTS:
-            return self._render_no_data(title)
+        with phase('render'):
+            if n < self.MIN_DATA_POINTS:
+                return self._render_no_data(title)
 
-        x_data = [d[0] for d in data]
-        y_data = [d[1] for d in data]
+            x_data = [d[0] for d in data]
+            y_data = [d[1] for d in data]
 
-        return self._render_heatmap(x_data, y_data, title)
+            return self._render_heatmap(x_data, y_data, title)
 
     def _get_pitch_data(self, split, heatmap_type):
         """
@@ -93,20 +97,12 @@ class HitterHeatmapGenerator:
         Returns:
             List of (plate_loc_side, plate_loc_height) tuples.
         """
-        if self.batter_id is not None:
-            batter_filter = Pitch.batter_id == self.batter_id
-        else:
-            from sqlalchemy import and_
-            batter_filter = and_(
-                Pitch.batter == self.batter_name,
-                Pitch.batter_id.is_(None),
-            )
-
         q = db.session.query(
             Pitch.plate_loc_side,
             Pitch.plate_loc_height
         ).filter(
-            batter_filter,
+            *batter_filter(batter_id=self.batter_id,
+                           batter_name=self.batter_name),
             Pitch.plate_loc_side.isnot(None),
             Pitch.plate_loc_height.isnot(None)
         )
@@ -119,25 +115,16 @@ class HitterHeatmapGenerator:
 
         # Apply heatmap type filter
         if heatmap_type == 'contact':
-            q = q.filter(Pitch.pitch_call.in_([
-                'InPlay', 'FoulBall', 'FoulBallNotFieldable',
-                'FoulBallFieldable', 'FoulTip'
-            ]))
+            q = q.filter(Pitch.is_swing == 1, Pitch.is_whiff == 0)
         elif heatmap_type == 'swing':
-            q = q.filter(Pitch.pitch_call.in_([
-                'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
-                'FoulBallFieldable', 'InPlay', 'FoulTip'
-            ]))
+            q = q.filter(Pitch.is_swing == 1)
         elif heatmap_type == 'whiff':
-            q = q.filter(Pitch.pitch_call == 'StrikeSwinging')
+            q = q.filter(Pitch.is_whiff == 1)
 
         # Apply additional filters
         if self.filters.get('game_id'):
             q = q.filter(Pitch.game_id == self.filters['game_id'])
-        if self.filters.get('start_date'):
-            q = q.filter(Pitch.date >= self.filters['start_date'])
-        if self.filters.get('end_date'):
-            q = q.filter(Pitch.date <= self.filters['end_date'])
+        q = q.filter(*date_range_clauses(self.filters))
 
         rows = q.all()
         return [(row.plate_loc_side, row.plate_loc_height) for row in rows]
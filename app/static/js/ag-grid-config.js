@@ -41,6 +41,23 @@ const MexProGrid = {
         });
     },
 
+    /**
+     * Decode a ?format=columnar table ({fields, values, length}) into row
+     * objects. Dictionary-encoded columns arrive as {dictionary, indices}.
+     */
+    decodeColumnar(table) {
+        const columns = table.values.map(col => (col && col.dictionary)
+            ? col.indices.map(i => (i == null ? null : col.dictionary[i]))
+            : col);
+        const rows = new Array(table.length);
+        for (let r = 0; r < table.length; r++) {
+            const row = {};
+            table.fields.forEach((field, c) => { row[field] = columns[c][r]; });
+            rows[r] = row;
+        }
+        return rows;
+    },
+
     /** Default grid options */
     defaultOptions: {
         pagination: true,
@@ -76,19 +93,116 @@ const MexProGrid = {
         try {
             const response = await fetch(apiUrl);
             const data = await response.json();
+            return this.initFromData(containerId, data, extraOptions);
+        } catch (err) {
+            console.error('Failed to initialize grid:', err);
+            container.innerHTML = '<div class="alert alert-danger">Failed to load data.</div>';
+            return null;
+        }
+    },
 
-            const columnDefs = this.applyFormatters(data.columns || []);
-            const rowData = data.rows || [];
+    /**
+     * Initialize an AG Grid from an already-fetched {columns, rows} payload
+     * (e.g. one section of a bundled response).
+     * @param {string} containerId - DOM element ID
+     * @param {object} data - {columns, rows}
+     * @param {object} extraOptions - Additional grid options
+     * @returns {object} The grid API
+     */
+    initFromData(containerId, data, extraOptions = {}) {
+        const container = document.getElementById(containerId);
+        if (!container) {
+            console.error(`Container #${containerId} not found`);
+            return null;
+        }
+
+        const gridOptions = {
+            ...this.defaultOptions,
+            ...extraOptions,
+            columnDefs: this.applyFormatters(data.columns || []),
+            rowData: data.rows || [],
+        };
+
+        return agGrid.createGrid(container, gridOptions);
+    },
+
+    /** Rows requested per block in server-side (infinite) mode */
+    blockSize: 100,
+
+    /** Build a block URL carrying AG Grid's window, sort and filter models */
+    buildBlockUrl(apiUrl, params) {
+        const url = new URL(apiUrl, window.location.origin);
+        url.searchParams.set('startRow', params.startRow);
+        url.searchParams.set('endRow', params.endRow);
+        if (params.sortModel && params.sortModel.length) {
+            url.searchParams.set('sortModel', JSON.stringify(params.sortModel));
+        }
+        if (params.filterModel && Object.keys(params.filterModel).length) {
+            url.searchParams.set('filterModel', JSON.stringify(params.filterModel));
+        }
+        return url.toString();
+    },
+
+    /**
+     * Initialize an AG Grid that sorts, filters and pages on the server.
+     * Uses the infinite row model: the API returns {columns, rows, total}
+     * for the first block and {rows, total} for later ones.
+     * @param {string} containerId - DOM element ID
+     * @param {string} apiUrl - Leaderboard URL (may carry its own filters)
+     * @param {object} extraOptions - Additional grid options
+     * @returns {Promise<object>} The grid API
+     */
+    async initServerSide(containerId, apiUrl, extraOptions = {}) {
+        const container = document.getElementById(containerId);
+        if (!container) {
+            console.error(`Container #${containerId} not found`);
+            return null;
+        }
+
+        const fetchBlock = async (params) => {
+            const response = await fetch(this.buildBlockUrl(apiUrl, params));
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        };
+
+        try {
+            // First block doubles as the column definition request
+            let firstBlock = await fetchBlock({startRow: 0, endRow: this.blockSize});
+
+            const columnDefs = this.applyFormatters(firstBlock.columns || []).map(col => {
+                if (col.filter !== false && col.type === 'numericColumn') {
+                    col.filter = 'agNumberColumnFilter';
+                }
+                return col;
+            });
+
+            const datasource = {
+                getRows: async (params) => {
+                    try {
+                        const unchanged = params.startRow === 0 &&
+                            !params.sortModel.length &&
+                            !Object.keys(params.filterModel || {}).length;
+                        const data = (firstBlock && unchanged) ? firstBlock : await fetchBlock(params);
+                        firstBlock = null;
+                        params.successCallback(data.rows || [], data.total);
+                    } catch (err) {
+                        console.error('Failed to load rows:', err);
+                        params.failCallback();
+                    }
+                },
+            };
 
             const gridOptions = {
                 ...this.defaultOptions,
                 ...extraOptions,
                 columnDefs,
-                rowData,
+                rowModelType: 'infinite',
+                cacheBlockSize: this.blockSize,
+                datasource,
             };
+            delete gridOptions.autoSizeStrategy;
 
-            const gridApi = agGrid.createGrid(container, gridOptions);
-            return gridApi;
+            return agGrid.createGrid(container, gridOptions);
         } catch (err) {
             console.error('Failed to initialize grid:', err);
             container.innerHTML = '<div class="alert alert-danger">Failed to load data.</div>';
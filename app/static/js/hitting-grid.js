@@ -2,10 +2,10 @@
  * Hitter leaderboard AG Grid initialization.
  */
 document.addEventListener('DOMContentLoaded', function() {
-    MexProGrid.init('hitterGrid', '/stats/api/hitting-leaderboard', {
+    MexProGrid.initServerSide('hitterGrid', '/stats/api/hitting-leaderboard', {
         onCellClicked: function(event) {
             // Only navigate if clicking on the name column
-            if (event.colDef.field === 'name') {
+            if (event.colDef.field === 'name' && event.data) {
                 const batterId = event.data.batter_id;
                 const name = event.data.name;
                 if (batterId) {
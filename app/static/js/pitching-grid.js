@@ -2,10 +2,10 @@
  * Pitcher leaderboard AG Grid initialization.
  */
 document.addEventListener('DOMContentLoaded', function() {
-    MexProGrid.init('pitcherGrid', '/stats/api/pitching-leaderboard', {
+    MexProGrid.initServerSide('pitcherGrid', '/stats/api/pitching-leaderboard', {
         onCellClicked: function(event) {
             // Only navigate if clicking on the name column
-            if (event.colDef.field === 'name') {
+            if (event.colDef.field === 'name' && event.data) {
                 const pitcherId = event.data.pitcher_id;
                 const name = event.data.name;
                 if (pitcherId) {
@@ -1,5 +1,9 @@
 from flask import Blueprint
+from app.utils.db_engines import use_reader_engine
 
 bp = Blueprint('stats', __name__, template_folder='templates')
 
-from app.stats import routes  # noqa: F401, E402
+# Read-only analytics: query through the reader engine
+bp.before_request(use_reader_engine)
+
+from app.stats import routes, commands  # noqa: F401, E402
@@ -0,0 +1,162 @@
+"""CLI commands for checking stats query performance."""
+
+import click
+from sqlalchemy import func
+
+from app.stats import bp
+
+
+@bp.cli.command('check-plans')
+@click.option('--verbose', '-v', is_flag=True,
+              help='Print the plan of every query, not only failures.')
+def check_plans(verbose):
+    """EXPLAIN every stats/heatmap query; fail on full scans of pitches.
+
+    Runs against the configured (SQLite) database, which must already hold
+    imported pitches; sample players, teams and games are taken from it.
+    """
+    from app.extensions import db
+    from app.utils.query_plans import check_query_plans
+
+    samples = _sample_values()
+    if samples is None:
+        raise click.ClickException('No pitches found; import some data first.')
+
+    try:
+        results = check_query_plans(db.engine, plan_cases(samples))
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    failures = [r for r in results if r['scans']]
+    for r in results:
+        if r['scans'] or verbose:
+            status = 'FULL SCAN' if r['scans'] else 'ok'
+            click.echo(f"[{status}] {r['label']}")
+            for detail in r['plan']:
+                click.echo(f'    {detail}')
+
+    click.echo(f'{len(results)} queries checked, {len(failures)} full table scans.')
+    if failures:
+        raise SystemExit(1)
+
+
+def _sample_values():
+    """Pick representative players, team, game and date range from the data."""
+    from app.extensions import db
+    from app.models.pitch import Pitch
+
+    first = db.session.query(Pitch).filter(
+        Pitch.pitcher_id.isnot(None), Pitch.batter_id.isnot(None),
+    ).first()
+    if first is None:
+        return None
+
+    pitcher_name = db.session.query(Pitch.pitcher).filter(
+        Pitch.pitcher_id.is_(None), Pitch.pitcher.isnot(None)).limit(1).scalar()
+    batter_name = db.session.query(Pitch.batter).filter(
+        Pitch.batter_id.is_(None), Pitch.batter.isnot(None)).limit(1).scalar()
+    start, end = db.session.query(func.min(Pitch.date), func.max(Pitch.date)).one()
+
+    return {
+        'pitcher_id': first.pitcher_id,
+        'pitcher_name': pitcher_name or first.pitcher,
+        'pitcher_team': first.pitcher_team,
+        'batter_id': first.batter_id,
+        'batter_name': batter_name or first.batter,
+        'batter_team': first.batter_team,
+        'game_id': first.game_id,
+        'pitch_type': first.effective_pitch_type or 'Fastball',
+        'start_date': start,
+        'end_date': end,
+    }
+
+
+def plan_cases(s):
+    """(label, callable) pairs covering the stats and heatmap service queries.
+
+    Unfiltered leaderboards necessarily read every pitch and are not
+    included; each leaderboard is checked with the team, game and date
+    filters the API accepts.
+    """
+    from app.pitchers.services.pitcher_stats import PitcherStatsService
+    from app.pitchers.services.pitch_profiles import get_pitch_profiles
+    from app.pitchers.services.pitcher_bundle import get_pitcher_bundle
+    from app.hitters.services.hitter_stats import HitterStatsService
+    from app.stats.services.split_engine import compute_splits
+    from app.stats.services.time_series import get_time_series
+    from app.games.services.box_score import get_box_score, get_game_log
+    from app.reports.services.heatmap_generator import HeatmapGenerator
+    from app.reports.services.hitter_heatmap_generator import HitterHeatmapGenerator
+
+    pid, pname = s['pitcher_id'], s['pitcher_name']
+    bid, bname = s['batter_id'], s['batter_name']
+    dates = {'start_date': s['start_date'], 'end_date': s['end_date']}
+    game = {'game_id': s['game_id']}
+    pitcher_by_id = PitcherStatsService._build_pitcher_filter(pitcher_id=pid)
+    pitcher_by_name = PitcherStatsService._build_pitcher_filter(pitcher_name=pname)
+    batter_by_id = HitterStatsService._build_batter_filter(batter_id=bid)
+    batter_by_name = HitterStatsService._build_batter_filter(batter_name=bname)
+
+    cases = [
+        ('pitching leaderboard: team',
+         lambda: PitcherStatsService.get_leaderboard({'team': s['pitcher_team'], **dates})),
+        ('pitching leaderboard: game',
+         lambda: PitcherStatsService.get_leaderboard(game)),
+        ('pitching leaderboard: dates',
+         lambda: PitcherStatsService.get_leaderboard(dates)),
+        ('hitting leaderboard: team',
+         lambda: HitterStatsService.get_leaderboard({'team': s['batter_team'], **dates})),
+        ('hitting leaderboard: game',
+         lambda: HitterStatsService.get_leaderboard(game)),
+        ('hitting leaderboard: dates',
+         lambda: HitterStatsService.get_leaderboard(dates)),
+        ('pitcher arsenal', lambda: PitcherStatsService.get_pitcher_arsenal(pid)),
+        ('pitcher arsenal: by name',
+         lambda: PitcherStatsService.get_pitcher_arsenal_by_name(pname)),
+        ('pitcher usage by hand',
+         lambda: PitcherStatsService.get_pitcher_usage_by_hand(pid)),
+        ('pitcher usage by hand: by name',
+         lambda: PitcherStatsService.get_pitcher_usage_by_hand_by_name(pname)),
+        ('pitch profiles', lambda: get_pitch_profiles(pitcher_id=pid)),
+        ('pitch profiles: by name', lambda: get_pitch_profiles(pitcher_name=pname)),
+        ('pitcher bundle', lambda: get_pitcher_bundle(pitcher_id=pid)),
+        ('pitcher bundle: by name', lambda: get_pitcher_bundle(pitcher_name=pname)),
+        ('pitcher splits', lambda: compute_splits(pitcher_by_id, ['batter_side', 'count'])),
+        ('pitcher splits: by name', lambda: compute_splits(pitcher_by_name, ['batter_side'])),
+        ('batter summary', lambda: HitterStatsService.get_batter_summary(bid)),
+        ('batter summary: by name',
+         lambda: HitterStatsService.get_batter_summary_by_name(bname)),
+        ('batter splits', lambda: HitterStatsService.get_batter_splits(bid)),
+        ('batter splits: by name',
+         lambda: HitterStatsService.get_batter_splits_by_name(bname)),
+        ('batter splits: by', lambda: compute_splits(batter_by_id, ['pitch_group'])),
+        ('batter splits: by name, by',
+         lambda: compute_splits(batter_by_name, ['inning'])),
+        ('pitcher time series', lambda: get_time_series('pitcher', trackman_id=pid)),
+        ('pitcher time series: by name', lambda: get_time_series('pitcher', name=pname)),
+        ('batter time series', lambda: get_time_series('batter', trackman_id=bid)),
+        ('batter time series: by name', lambda: get_time_series('batter', name=bname)),
+        ('box score', lambda: get_box_score(s['game_id'])),
+        ('pitcher game log', lambda: get_game_log('pitcher', trackman_id=pid)),
+        ('batter game log: by name', lambda: get_game_log('batter', name=bname)),
+        ('batter contact quality',
+         lambda: HitterStatsService.get_batter_contact_quality(bid)),
+        ('batter contact quality: by name',
+         lambda: HitterStatsService.get_batter_contact_quality_by_name(bname)),
+    ]
+
+    for split in ('overall', 'vs_lhh', 'vs_rhh', s['pitch_type']):
+        cases.append((f'pitcher heatmap: {split}',
+                      lambda split=split: HeatmapGenerator(pitcher_id=pid)._get_pitch_data(split)))
+        cases.append((f'pitcher heatmap: by name, {split}',
+                      lambda split=split: HeatmapGenerator(pitcher_name=pname)._get_pitch_data(split)))
+
+    for split in ('overall', 'vs_lhp', 'vs_rhp'):
+        for heatmap_type in ('pitched', 'contact', 'whiff'):
+            label = f'batter heatmap: {split}, {heatmap_type}'
+            cases.append((label, lambda split=split, t=heatmap_type:
+                          HitterHeatmapGenerator(batter_id=bid)._get_pitch_data(split, t)))
+        cases.append((f'batter heatmap: by name, {split}',
+                      lambda split=split: HitterHeatmapGenerator(batter_name=bname)._get_pitch_data(split, 'pitched')))
+
+    return cases
@@ -1,13 +1,30 @@
-from flask import jsonify, request
+from flask import Response, jsonify, request, stream_with_context
 from flask_login import login_required
 from app.stats import bp
 from app.pitchers.services.pitcher_stats import PitcherStatsService
 from app.pitchers.services.pitch_profiles import get_pitch_profiles
+from app.pitchers.services.pitcher_bundle import get_pitcher_bundle
 from app.hitters.services.hitter_stats import HitterStatsService
+from app.stats.services.split_engine import compute_splits, parse_split_dimensions
+from app.stats.services.time_series import get_time_series, PA_WINDOW, SWING_WINDOW
+from app.stats.services.pitch_export import FORMATS, iter_export, parse_export_request
+from app.utils.grid_model import is_grid_request, parse_grid_request, fetch_grid_page
+from app.utils.columnar import wants_columnar, to_columnar
+from app.utils.compression import compress_response
+from app.utils.conditional import conditional_get
+from app.utils.request_timing import phase
+
+
+@bp.after_request
+def compress_api_response(response):
+    """gzip/brotli-compress JSON API responses when the client accepts it."""
+    with phase('compress'):
+        return compress_response(response, request.accept_encodings)
 
 
 @bp.route('/api/pitching-leaderboard')
 @login_required
+@conditional_get
 def pitching_leaderboard_api():
     """JSON endpoint for AG Grid pitching leaderboard."""
     filters = {
@@ -19,13 +36,27 @@ def pitching_leaderboard_api():
     # Remove None values
     filters = {k: v for k, v in filters.items() if v}
 
+    if is_grid_request(request.args):
+        min_bf = request.args.get('min_bf', 0, type=int)
+        return _grid_page_response(
+            PitcherStatsService.leaderboard_query(filters),
+            PitcherStatsService.leaderboard_sort_columns,
+            PitcherStatsService.leaderboard_row,
+            _pitching_leaderboard_columns,
+            distributions=lambda rows: PitcherStatsService.leaderboard_distributions(
+                filters, pitcher_keys={r.pitcher_key for r in rows}),
+            qualifier=lambda c: c.bf_count >= min_bf,
+            default_sort='bf',
+        )
+
     data = PitcherStatsService.get_leaderboard(filters)
     columns = _pitching_leaderboard_columns()
-    return jsonify({'columns': columns, 'rows': data})
+    return jsonify({'columns': columns, 'rows': _rows_payload(data)})
 
 
 @bp.route('/api/pitcher/<int:pitcher_id>/arsenal')
 @login_required
+@conditional_get
 def pitcher_arsenal_api(pitcher_id):
     """JSON endpoint for pitcher arsenal breakdown."""
     filters = {
@@ -37,11 +68,12 @@ def pitcher_arsenal_api(pitcher_id):
 
     data = PitcherStatsService.get_pitcher_arsenal(pitcher_id, filters)
     columns = _arsenal_columns()
-    return jsonify({'columns': columns, 'rows': data})
+    return jsonify({'columns': columns, 'rows': _rows_payload(data)})
 
 
 @bp.route('/api/pitcher/<int:pitcher_id>/usage-by-hand')
 @login_required
+@conditional_get
 def pitcher_usage_by_hand_api(pitcher_id):
     """Pitch usage split by batter handedness."""
     filters = {'game_id': request.args.get('game_id')}
@@ -53,6 +85,7 @@ def pitcher_usage_by_hand_api(pitcher_id):
 
 @bp.route('/api/pitcher/by-name/<path:pitcher_name>/arsenal')
 @login_required
+@conditional_get
 def pitcher_arsenal_by_name_api(pitcher_name):
     """JSON endpoint for pitcher arsenal by name (no Trackman ID)."""
     filters = {
@@ -64,11 +97,12 @@ def pitcher_arsenal_by_name_api(pitcher_name):
 
     data = PitcherStatsService.get_pitcher_arsenal_by_name(pitcher_name, filters)
     columns = _arsenal_columns()
-    return jsonify({'columns': columns, 'rows': data})
+    return jsonify({'columns': columns, 'rows': _rows_payload(data)})
 
 
 @bp.route('/api/pitcher/by-name/<path:pitcher_name>/usage-by-hand')
 @login_required
+@conditional_get
 def pitcher_usage_by_hand_by_name_api(pitcher_name):
     """Pitch usage by name split by batter handedness."""
     filters = {'game_id': request.args.get('game_id')}
@@ -80,38 +114,75 @@ def pitcher_usage_by_hand_by_name_api(pitcher_name):
 
 @bp.route('/api/pitcher/<int:pitcher_id>/pitch-profiles')
 @login_required
+@conditional_get
 def pitcher_pitch_profiles_api(pitcher_id):
     """Pitch movement profiles for visualization."""
-    filters = {
-        'game_id': request.args.get('game_id'),
-        'start_date': request.args.get('start_date'),
-        'end_date': request.args.get('end_date'),
-    }
-    filters = {k: v for k, v in filters.items() if v}
-
-    data = get_pitch_profiles(pitcher_id=pitcher_id, filters=filters)
-    return jsonify(data)
+    return _pitch_profiles_response(pitcher_id=pitcher_id)
 
 
 @bp.route('/api/pitcher/by-name/<path:pitcher_name>/pitch-profiles')
 @login_required
+@conditional_get
 def pitcher_pitch_profiles_by_name_api(pitcher_name):
     """Pitch movement profiles by name."""
-    filters = {
-        'game_id': request.args.get('game_id'),
-        'start_date': request.args.get('start_date'),
-        'end_date': request.args.get('end_date'),
-    }
-    filters = {k: v for k, v in filters.items() if v}
+    return _pitch_profiles_response(pitcher_name=pitcher_name)
 
-    data = get_pitch_profiles(pitcher_name=pitcher_name, filters=filters)
-    return jsonify(data)
+
+@bp.route('/api/pitcher/<int:pitcher_id>/bundle')
+@login_required
+@conditional_get
+def pitcher_bundle_api(pitcher_id):
+    """Arsenal, usage by hand and pitch profiles in one response."""
+    return _bundle_response(pitcher_id=pitcher_id)
+
+
+@bp.route('/api/pitcher/by-name/<path:pitcher_name>/bundle')
+@login_required
+@conditional_get
+def pitcher_bundle_by_name_api(pitcher_name):
+    """Pitcher page bundle by name (no Trackman ID)."""
+    return _bundle_response(pitcher_name=pitcher_name)
+
+
+@bp.route('/api/pitcher/<int:pitcher_id>/splits')
+@login_required
+@conditional_get
+def pitcher_splits_api(pitcher_id):
+    """Results against a pitcher split by ?by=dim1,dim2,... in one query."""
+    return _splits_response(
+        PitcherStatsService._build_pitcher_filter(pitcher_id=pitcher_id))
+
+
+@bp.route('/api/pitcher/by-name/<path:pitcher_name>/splits')
+@login_required
+@conditional_get
+def pitcher_splits_by_name_api(pitcher_name):
+    """Split results for a pitcher identified by name."""
+    return _splits_response(
+        PitcherStatsService._build_pitcher_filter(pitcher_name=pitcher_name))
+
+
+@bp.route('/api/pitcher/<int:pitcher_id>/time-series')
+@login_required
+@conditional_get
+def pitcher_time_series_api(pitcher_id):
+    """Per-game velocity/spin/whiff lines with rolling wOBA and whiff%."""
+    return _time_series_response('pitcher', trackman_id=pitcher_id)
+
+
+@bp.route('/api/pitcher/by-name/<path:pitcher_name>/time-series')
+@login_required
+@conditional_get
+def pitcher_time_series_by_name_api(pitcher_name):
+    """Time series for a pitcher identified by name."""
+    return _time_series_response('pitcher', name=pitcher_name)
 
 
 # ── Hitter API Endpoints ──────────────────────────────────────
 
 @bp.route('/api/hitting-leaderboard')
 @login_required
+@conditional_get
 def hitting_leaderboard_api():
     """JSON endpoint for AG Grid hitting leaderboard."""
     filters = {
@@ -122,15 +193,36 @@ def hitting_leaderboard_api():
     }
     filters = {k: v for k, v in filters.items() if v}
 
+    if is_grid_request(request.args):
+        min_pa = max(request.args.get('min_pa', 1, type=int), 1)
+        return _grid_page_response(
+            HitterStatsService.leaderboard_query(filters),
+            HitterStatsService.leaderboard_sort_columns,
+            HitterStatsService.leaderboard_row,
+            _hitting_leaderboard_columns,
+            distributions=lambda rows: HitterStatsService.leaderboard_distributions(
+                filters, batter_keys={r.batter_key for r in rows}),
+            qualifier=lambda c: c.pa >= min_pa,
+            default_sort='pa',
+        )
+
     data = HitterStatsService.get_leaderboard(filters)
     columns = _hitting_leaderboard_columns()
-    return jsonify({'columns': columns, 'rows': data})
+    return jsonify({'columns': columns, 'rows': _rows_payload(data)})
 
 
 @bp.route('/api/batter/<int:batter_id>/splits')
 @login_required
+@conditional_get
 def batter_splits_api(batter_id):
-    """Batting splits by pitcher handedness (vs LHP, vs RHP)."""
+    """Batting splits by pitcher handedness (vs LHP, vs RHP).
+
+    With ?by=dim1,dim2,... returns generic split-engine buckets instead.
+    """
+    if request.args.get('by'):
+        return _splits_response(
+            HitterStatsService._build_batter_filter(batter_id=batter_id))
+
     filters = {'game_id': request.args.get('game_id')}
     filters = {k: v for k, v in filters.items() if v}
 
@@ -140,8 +232,13 @@ def batter_splits_api(batter_id):
 
 @bp.route('/api/batter/by-name/<path:batter_name>/splits')
 @login_required
+@conditional_get
 def batter_splits_by_name_api(batter_name):
     """Batting splits by name (no Trackman ID)."""
+    if request.args.get('by'):
+        return _splits_response(
+            HitterStatsService._build_batter_filter(batter_name=batter_name))
+
     filters = {'game_id': request.args.get('game_id')}
     filters = {k: v for k, v in filters.items() if v}
 
@@ -151,17 +248,19 @@ def batter_splits_by_name_api(batter_name):
 
 @bp.route('/api/batter/<int:batter_id>/contact-quality')
 @login_required
+@conditional_get
 def batter_contact_quality_api(batter_id):
     """Exit velocity and launch angle data for charts."""
     filters = {'game_id': request.args.get('game_id')}
     filters = {k: v for k, v in filters.items() if v}
 
     data = HitterStatsService.get_batter_contact_quality(batter_id, filters)
-    return jsonify(data)
+    return jsonify(_rows_payload(data))
 
 
 @bp.route('/api/batter/by-name/<path:batter_name>/contact-quality')
 @login_required
+@conditional_get
 def batter_contact_quality_by_name_api(batter_name):
     """Contact quality data by name (no Trackman ID)."""
     filters = {'game_id': request.args.get('game_id')}
@@ -169,9 +268,193 @@ def batter_contact_quality_by_name_api(batter_name):
 
     data = HitterStatsService.get_batter_contact_quality_by_name(
         batter_name, filters)
+    return jsonify(_rows_payload(data))
+
+
+@bp.route('/api/batter/<int:batter_id>/time-series')
+@login_required
+@conditional_get
+def batter_time_series_api(batter_id):
+    """Per-game exit velo/whiff/wOBA lines with rolling wOBA and whiff%."""
+    return _time_series_response('batter', trackman_id=batter_id)
+
+
+@bp.route('/api/batter/by-name/<path:batter_name>/time-series')
+@login_required
+@conditional_get
+def batter_time_series_by_name_api(batter_name):
+    """Time series for a batter identified by name."""
+    return _time_series_response('batter', name=batter_name)
+
+
+@bp.route('/api/export/pitches')
+@login_required
+def export_pitches_api():
+    """Stream filtered pitch rows as CSV, Parquet or Arrow IPC.
+
+    ?format=csv|parquet|arrow, ?columns=a,b,c and the filters accepted by
+    pitch_export.export_statement. The body is gzipped as a download
+    (.gz) with ?compression=gzip, or with Content-Encoding when the
+    client accepts gzip (CSV and Arrow; Parquet is already compressed).
+    """
+    try:
+        export = parse_export_request(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    mimetype, extension = FORMATS[export['format']]
+    filename = f'pitches.{extension}'
+    headers = {'X-Accel-Buffering': 'no'}
+    gzip_file = request.args.get('compression') == 'gzip'
+    gzip_encoding = (not gzip_file and export['format'] != 'parquet'
+                     and request.accept_encodings.quality('gzip') > 0)
+    if gzip_file:
+        mimetype, filename = 'application/gzip', filename + '.gz'
+    elif gzip_encoding:
+        headers['Content-Encoding'] = 'gzip'
+    headers['Content-Disposition'] = f'attachment; filename={filename}'
+
+    chunks = iter_export(export['columns'], export['filters'], export['format'],
+                         export['batch_size'], gzip=gzip_file or gzip_encoding)
+    response = Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _time_series_response(role, trackman_id=None, name=None):
+    """Serve get_time_series() with ?pa_window=, ?swing_window= and the
+    standard date/game filters."""
+    filters = {
+        'game_id': request.args.get('game_id'),
+        'start_date': request.args.get('start_date'),
+        'end_date': request.args.get('end_date'),
+    }
+    filters = {k: v for k, v in filters.items() if v}
+
+    try:
+        data = get_time_series(
+            role, trackman_id=trackman_id, name=name, filters=filters,
+            pa_window=request.args.get('pa_window', PA_WINDOW, type=int),
+            swing_window=request.args.get('swing_window', SWING_WINDOW, type=int),
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    data['games'] = _rows_payload(data['games'])
+    return jsonify(data)
+
+
+def _pitch_profiles_response(pitcher_id=None, pitcher_name=None):
+    """Serve get_pitch_profiles() with the standard date/game filters."""
+    filters = {
+        'game_id': request.args.get('game_id'),
+        'start_date': request.args.get('start_date'),
+        'end_date': request.args.get('end_date'),
+    }
+    filters = {k: v for k, v in filters.items() if v}
+
+    try:
+        options = _profile_options()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    data = get_pitch_profiles(pitcher_id=pitcher_id, pitcher_name=pitcher_name,
+                              filters=filters, **options)
     return jsonify(data)
 
 
+def _profile_options():
+    """Read ?format=columnar, ?summary=1 and ?sample=N for pitch profiles.
+
+    Raises:
+        ValueError: If sample is not a positive integer.
+    """
+    sample = request.args.get('sample')
+    if sample is not None:
+        try:
+            sample = int(sample)
+        except ValueError:
+            sample = 0
+        if sample < 1:
+            raise ValueError('sample must be a positive integer')
+
+    return {
+        'columnar': wants_columnar(request.args),
+        'sample': sample,
+        'summary': request.args.get('summary') in ('1', 'true'),
+    }
+
+
+def _bundle_response(pitcher_id=None, pitcher_name=None):
+    """Serve get_pitcher_bundle() with the standard date/game filters."""
+    filters = {
+        'game_id': request.args.get('game_id'),
+        'start_date': request.args.get('start_date'),
+        'end_date': request.args.get('end_date'),
+    }
+    filters = {k: v for k, v in filters.items() if v}
+
+    try:
+        options = _profile_options()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    data = get_pitcher_bundle(pitcher_id=pitcher_id, pitcher_name=pitcher_name,
+                              filters=filters, **options)
+    data['arsenal'] = {'columns': _arsenal_columns(),
+                       'rows': _rows_payload(data['arsenal'])}
+    return jsonify(data)
+
+
+def _splits_response(player_filters):
+    """Run the split engine for ?by= and the standard date/game filters."""
+    try:
+        dimensions = parse_split_dimensions(request.args.get('by'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    filters = {
+        'game_id': request.args.get('game_id'),
+        'start_date': request.args.get('start_date'),
+        'end_date': request.args.get('end_date'),
+    }
+    filters = {k: v for k, v in filters.items() if v}
+
+    data = compute_splits(player_filters, dimensions, filters)
+    return jsonify({'by': dimensions, 'rows': data})
+
+
+def _rows_payload(rows):
+    """Row dicts as-is, or a columnar table for ?format=columnar."""
+    if wants_columnar(request.args):
+        return to_columnar(rows)
+    return rows
+
+
+def _grid_page_response(query, sort_columns, format_row, column_defs,
+                        qualifier=None, default_sort=None, distributions=None):
+    """Serve one AG Grid infinite-row-model block from an aggregate query.
+
+    distributions, if given, is called with the block's rows and its
+    result passed to format_row (percentile columns for just those rows).
+    Column definitions are only included with the first block.
+    """
+    try:
+        grid = parse_grid_request(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    rows, total = fetch_grid_page(query, sort_columns, grid,
+                                  qualifier=qualifier,
+                                  default_sort=default_sort)
+    extra = distributions(rows) if distributions is not None else None
+    payload = {'rows': _rows_payload([format_row(row, extra) for row in rows]),
+               'total': total}
+    if grid['start'] == 0:
+        payload['columns'] = column_defs()
+    return jsonify(payload)
+
+
 # ── Column Definitions ────────────────────────────────────────
 
 def _pitching_leaderboard_columns():
@@ -190,11 +473,20 @@ def _pitching_leaderboard_columns():
         {'field': 'csw_pct', 'headerName': 'CSW%', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'in_zone_pct', 'headerName': 'Zone%', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'whiff_pct', 'headerName': 'Whiff%', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'chase_pct', 'headerName': 'Chase%', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'z_swing_pct', 'headerName': 'Z-Swing%', 'width': 85, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'z_contact_pct', 'headerName': 'Z-Contact%', 'width': 90, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'o_contact_pct', 'headerName': 'O-Contact%', 'width': 90, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'strike_pct', 'headerName': 'Strike%', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'gb_pct', 'headerName': 'GB%', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'hr', 'headerName': 'HR', 'width': 55, 'type': 'numericColumn'},
         {'field': 'avg_velo', 'headerName': 'Velo', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
         {'field': 'max_velo', 'headerName': 'MaxVelo', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
+        # Percentiles are computed per page, so the grid cannot sort or filter on them
+        {'field': 'velo_p10', 'headerName': 'Velo10', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'fixed1', 'sortable': False, 'filter': False},
+        {'field': 'velo_p50', 'headerName': 'Velo50', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'fixed1', 'sortable': False, 'filter': False},
+        {'field': 'velo_p90', 'headerName': 'Velo90', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'fixed1', 'sortable': False, 'filter': False},
+        {'field': 'max_effort_velo', 'headerName': 'MaxEff', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'fixed1', 'sortable': False, 'filter': False},
         {'field': 'avg_spin', 'headerName': 'Spin', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed0'},
     ]
 
@@ -207,6 +499,9 @@ def _arsenal_columns():
         {'field': 'pct', 'headerName': 'P%', 'width': 60, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'avg_velo', 'headerName': 'Vel', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
         {'field': 'velo_range', 'headerName': 'Range', 'width': 80},
+        {'field': 'velo_p10', 'headerName': 'Vel10', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
+        {'field': 'velo_p90', 'headerName': 'Vel90', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
+        {'field': 'max_effort_velo', 'headerName': 'MaxEff', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
         {'field': 'avg_spin', 'headerName': 'Spin', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed0'},
         {'field': 'avg_ivb', 'headerName': 'IVB', 'width': 60, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
         {'field': 'avg_hb', 'headerName': 'HB', 'width': 60, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
@@ -214,7 +509,10 @@ def _arsenal_columns():
         {'field': 'in_zone_pct', 'headerName': 'Zone%', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'whiff_pct', 'headerName': 'Whiff%', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'csw_pct', 'headerName': 'CSW%', 'width': 70, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'chase_pct', 'headerName': 'Chase%', 'width': 75, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'z_contact_pct', 'headerName': 'Z-Contact%', 'width': 90, 'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'avg_ev', 'headerName': 'EV', 'width': 60, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
+        {'field': 'ev_p90', 'headerName': 'EV90', 'width': 65, 'type': 'numericColumn', 'valueFormatter': 'fixed1'},
     ]
 
 
@@ -263,10 +561,26 @@ def _hitting_leaderboard_columns():
          'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'contact_pct', 'headerName': 'Contact%', 'width': 80,
          'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'chase_pct', 'headerName': 'O-Swing%', 'width': 85,
+         'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'z_swing_pct', 'headerName': 'Z-Swing%', 'width': 85,
+         'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'z_contact_pct', 'headerName': 'Z-Contact%', 'width': 90,
+         'type': 'numericColumn', 'valueFormatter': 'pct1'},
+        {'field': 'o_contact_pct', 'headerName': 'O-Contact%', 'width': 90,
+         'type': 'numericColumn', 'valueFormatter': 'pct1'},
         {'field': 'avg_ev', 'headerName': 'AvgEV', 'width': 70,
          'type': 'numericColumn', 'valueFormatter': 'fixed1'},
         {'field': 'max_ev', 'headerName': 'MaxEV', 'width': 70,
          'type': 'numericColumn', 'valueFormatter': 'fixed1'},
+        # Percentiles are computed per page, so the grid cannot sort or
+        # filter on them
+        {'field': 'ev_p50', 'headerName': 'EV50', 'width': 70,
+         'type': 'numericColumn', 'valueFormatter': 'fixed1',
+         'sortable': False, 'filter': False},
+        {'field': 'ev_p90', 'headerName': 'EV90', 'width': 70,
+         'type': 'numericColumn', 'valueFormatter': 'fixed1',
+         'sortable': False, 'filter': False},
         {'field': 'avg_la', 'headerName': 'AvgLA', 'width': 70,
          'type': 'numericColumn', 'valueFormatter': 'fixed1'},
     ]
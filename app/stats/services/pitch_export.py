@@ -0,0 +1,239 @@
+"""Streaming pitch-level export (CSV, Parquet, Arrow IPC).
+
+Rows are read with ``yield_per``, so PostgreSQL uses a server-side
+cursor and SQLite steps its cursor lazily. Each batch is encoded and
+yielded before the next is fetched:
+
+* CSV: one chunk of lines per batch.
+* Parquet: one row group per batch.
+* Arrow: one IPC stream record batch per batch.
+
+Memory is bounded by the batch size, not the export size. gzip is
+applied to the encoded stream incrementally.
+
+Parquet and Arrow need pyarrow (in requirements.txt); an install without
+it still serves CSV.
+"""
+
+import csv
+import io
+import zlib
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, or_, select
+
+from app.extensions import db
+from app.models.pitch import Pitch
+from app.utils.player_filters import pitcher_filter, batter_filter
+from app.utils.seasons import date_range_clauses
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = pq = None
+
+FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows'),
+}
+
+DEFAULT_BATCH_SIZE = 5000
+MAX_BATCH_SIZE = 50000
+
+# Bookkeeping columns that are not pitch data
+INTERNAL_COLUMNS = {'id', 'upload_log_id', 'created_at',
+                    'pitcher_key', 'batter_key', 'catcher_key'}
+EXPORT_COLUMNS = [c.name for c in Pitch.__table__.columns
+                  if c.name not in INTERNAL_COLUMNS]
+
+DEFAULT_COLUMNS = [
+    'date', 'game_id', 'inning', 'top_bottom', 'outs', 'balls', 'strikes',
+    'pitcher', 'pitcher_id', 'pitcher_throws', 'pitcher_team',
+    'batter', 'batter_id', 'batter_side', 'batter_team',
+    'effective_pitch_type', 'pitch_group', 'pitch_call', 'k_or_bb',
+    'play_result', 'rel_speed', 'spin_rate', 'induced_vert_break',
+    'horz_break', 'rel_height', 'rel_side', 'extension',
+    'plate_loc_height', 'plate_loc_side', 'exit_speed', 'angle',
+    'distance', 'pitch_uid',
+]
+
+
+def parse_export_request(args):
+    """Read format, columns, filters and batch size from request args.
+
+    Returns:
+        Dict with 'format', 'columns', 'filters' and 'batch_size'.
+
+    Raises:
+        ValueError: On an unknown format or column, a format that needs
+            pyarrow when it is not installed, or a bad batch size.
+    """
+    fmt = args.get('format', 'csv')
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Valid: {', '.join(FORMATS)}")
+    if fmt != 'csv' and pa is None:
+        raise ValueError(f"Format '{fmt}' requires pyarrow, which is not installed")
+
+    columns = [c.strip() for c in args.get('columns', '').split(',') if c.strip()]
+    unknown = [c for c in columns if c not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+
+    batch_size = args.get('batch_size', DEFAULT_BATCH_SIZE, type=int)
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f'batch_size must be between 1 and {MAX_BATCH_SIZE}')
+
+    filter_names = ('pitcher_id', 'pitcher', 'batter_id', 'batter', 'team',
+                    'pitcher_team', 'batter_team', 'game_id', 'start_date',
+                    'end_date', 'pitch_type')
+    filters = {k: args.get(k) for k in filter_names if args.get(k)}
+    for key in ('pitcher_id', 'batter_id'):
+        if key in filters:
+            if not filters[key].isdigit():
+                raise ValueError(f'{key} must be an integer')
+            filters[key] = int(filters[key])
+
+    return {
+        'format': fmt,
+        'columns': list(dict.fromkeys(columns)) or DEFAULT_COLUMNS,
+        'filters': filters,
+        'batch_size': batch_size,
+    }
+
+
+def export_statement(columns, filters):
+    """SELECT of the given pitch columns in game order, filtered by:
+    pitcher_id / pitcher (name), batter_id / batter (name), team (either
+    side), pitcher_team, batter_team, game_id, start_date, end_date and
+    pitch_type (comma-separated effective pitch types)."""
+    table = Pitch.__table__
+    stmt = select(*[table.c[name] for name in columns])
+
+    if 'pitcher_id' in filters or 'pitcher' in filters:
+        stmt = stmt.where(*pitcher_filter(filters.get('pitcher_id'), filters.get('pitcher')))
+    if 'batter_id' in filters or 'batter' in filters:
+        stmt = stmt.where(*batter_filter(filters.get('batter_id'), filters.get('batter')))
+    if filters.get('team'):
+        stmt = stmt.where(or_(Pitch.pitcher_team == filters['team'],
+                              Pitch.batter_team == filters['team']))
+    if filters.get('pitcher_team'):
+        stmt = stmt.where(Pitch.pitcher_team == filters['pitcher_team'])
+    if filters.get('batter_team'):
+        stmt = stmt.where(Pitch.batter_team == filters['batter_team'])
+    if filters.get('game_id'):
+        stmt = stmt.where(Pitch.game_id == filters['game_id'])
+    if filters.get('pitch_type'):
+        types = [t.strip() for t in filters['pitch_type'].split(',') if t.strip()]
+        stmt = stmt.where(Pitch.effective_pitch_type.in_(types))
+    stmt = stmt.where(*date_range_clauses(filters))
+
+    return stmt.order_by(Pitch.date, Pitch.game_id, Pitch.pitch_no, Pitch.id)
+
+
+def iter_export(columns, filters, fmt='csv', batch_size=DEFAULT_BATCH_SIZE, gzip=False):
+    """Yield the encoded export in chunks (one or more per row batch)."""
+    result = db.session.execute(export_statement(columns, filters),
+                                execution_options={'yield_per': batch_size})
+    encoder = {'csv': _csv_chunks, 'parquet': _parquet_chunks,
+               'arrow': _arrow_chunks}[fmt]
+    chunks = encoder(columns, result.partitions())
+    if gzip:
+        chunks = _gzip_chunks(chunks)
+    for chunk in chunks:
+        if chunk:
+            yield chunk
+
+
+def _csv_chunks(columns, batches):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buf.getvalue().encode('utf-8')
+        buf.seek(0)
+        buf.truncate()
+    yield buf.getvalue().encode('utf-8')
+
+
+def arrow_schema(columns):
+    """pyarrow schema for the given pitch columns."""
+    fields = []
+    for name in columns:
+        col_type = Pitch.__table__.c[name].type
+        if isinstance(col_type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(col_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(col_type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(col_type, DateTime):
+            arrow_type = pa.timestamp('us')
+        elif isinstance(col_type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _record_batch(schema, batch):
+    arrays = [pa.array(values, type=field.type)
+              for field, values in zip(schema, zip(*batch))]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _arrow_chunks(columns, batches):
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield sink.drain()
+        for batch in batches:
+            writer.write_batch(_record_batch(schema, batch))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _parquet_chunks(columns, batches):
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression='zstd') as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([_record_batch(schema, batch)]))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31: gzip container
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last
+    drain(), so a writer's output can be streamed as it is produced."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
@@ -0,0 +1,99 @@
+"""Player page headers: name, hand, team, counts and date range.
+
+One aggregate query per player, grouped only by team so a player who
+changed teams still comes back as a handful of rows; they are merged
+here. Switch hitters (both Left and Right batter_side) are reported as
+'Switch' instead of being split across rows. Results are cached per
+process keyed on the data version, so they are recomputed after every
+import.
+"""
+
+from sqlalchemy import func, distinct, case
+
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.models.pitch import Pitch
+from app.utils.player_filters import pitcher_filter, batter_filter
+from app.utils.request_cache import TTLCache, cache_key
+
+# Entries are keyed on the data version; the TTL only bounds memory
+HEADER_CACHE_TTL = 600
+
+# role -> (name column, hand column, team column, filter builder, hand key)
+ROLES = {
+    'pitcher': (Pitch.pitcher, Pitch.pitcher_throws, Pitch.pitcher_team, pitcher_filter, 'throws'),
+    'batter': (Pitch.batter, Pitch.batter_side, Pitch.batter_team, batter_filter, 'bats'),
+}
+
+_cache = TTLCache()
+
+
+def get_player_header(role, trackman_id=None, name=None):
+    """Header info for a pitcher or batter.
+
+    Args:
+        role: 'pitcher' or 'batter'.
+        trackman_id: Trackman ID, for players that have one.
+        name: Player name, for players without a Trackman ID.
+
+    Returns:
+        Dict with 'trackman_id', 'name', 'throws' (pitchers) or 'bats'
+        (batters), 'team', 'pitch_count', 'game_count', 'first_date' and
+        'last_date', or None if the player has no pitches.
+    """
+    key = cache_key('player_header', role, trackman_id, name, DataVersion.current())
+    header = _cache.get(key)
+    if header is None:
+        header = _load_header(role, trackman_id, name)
+        if header is None:
+            return None
+        _cache.set(key, header, HEADER_CACHE_TTL)
+    return dict(header)
+
+
+def _load_header(role, trackman_id, name):
+    name_col, hand_col, team_col, build_filter, hand_key = ROLES[role]
+    filters = build_filter(trackman_id, name)
+
+    last_date = func.max(Pitch.date)
+    rows = db.session.query(
+        team_col.label('team'),
+        func.max(name_col).label('name'),
+        func.max(case((hand_col == 'Left', 1), else_=0)).label('left'),
+        func.max(case((hand_col == 'Right', 1), else_=0)).label('right'),
+        func.max(hand_col).label('hand'),
+        func.count(Pitch.id).label('pitch_count'),
+        func.count(distinct(Pitch.game_id)).label('game_count'),
+        func.min(Pitch.date).label('first_date'),
+        last_date.label('last_date'),
+    ).filter(*filters).group_by(team_col).order_by(
+        last_date.desc().nulls_last(), func.count(Pitch.id).desc()).all()
+
+    if not rows:
+        return None
+
+    # Rows are per team, most recent first
+    latest = rows[0]
+    left = any(r.left for r in rows)
+    right = any(r.right for r in rows)
+    if left and right:
+        hand = 'Switch'
+    elif left or right:
+        hand = 'Left' if left else 'Right'
+    else:
+        hand = next((r.hand for r in rows if r.hand), None)
+
+    first_dates = [r.first_date for r in rows if r.first_date]
+    last_dates = [r.last_date for r in rows if r.last_date]
+
+    return {
+        'trackman_id': trackman_id,
+        'name': latest.name or name,
+        hand_key: hand,
+        'team': next((r.team for r in rows if r.team), None),
+        'pitch_count': sum(r.pitch_count for r in rows),
+        # A pitcher/batter appears for one team per game
+        'game_count': sum(r.game_count for r in rows),
+        'first_date': min(first_dates) if first_dates else None,
+        'last_date': max(last_dates) if last_dates else None,
+    }
@@ -0,0 +1,156 @@
+"""Generic split engine: any combination of split dimensions, one query.
+
+Every requested bucket (e.g. vs LHP in 0-2 counts, innings 7+) is
+aggregated in a single GROUP BY pass over the player's pitches; rate
+stats are then derived in Python with the baseball_metrics helpers.
+"""
+
+from sqlalchemy import func, case, cast, String
+from app.extensions import db
+from app.models.pitch import Pitch
+from app.utils.baseball_metrics import (
+    calculate_batting_average, calculate_obp, calculate_slg, calculate_ops,
+    calculate_woba, pct,
+)
+from app.utils.seasons import date_range_clauses
+
+
+def _count_state():
+    """SQL expression: ball-strike count as 'B-S' text."""
+    return cast(Pitch.balls, String) + '-' + cast(Pitch.strikes, String)
+
+
+def _inning_bucket():
+    """SQL expression: inning grouped into early / middle / late."""
+    return case(
+        (Pitch.inning <= 3, '1-3'),
+        (Pitch.inning <= 6, '4-6'),
+        else_='7+',
+    )
+
+
+# Split dimension name -> factory for its SQL grouping expression.
+SPLIT_DIMENSIONS = {
+    'pitcher_throws': lambda: Pitch.pitcher_throws,
+    'batter_side': lambda: Pitch.batter_side,
+    'count': _count_state,
+    'balls': lambda: Pitch.balls,
+    'strikes': lambda: Pitch.strikes,
+    'outs': lambda: Pitch.outs,
+    'inning': _inning_bucket,
+    'pitcher_set': lambda: Pitch.pitcher_set,
+    'pitch_group': lambda: Pitch.pitch_group,
+}
+
+
+def parse_split_dimensions(by):
+    """Parse a comma-separated ?by= value into a list of dimension names.
+
+    Raises:
+        ValueError: If no dimension is given or one is unknown.
+    """
+    dims = [d.strip() for d in (by or '').split(',') if d.strip()]
+    if not dims:
+        raise ValueError('At least one split dimension is required')
+    unknown = [d for d in dims if d not in SPLIT_DIMENSIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown split dimension(s): {', '.join(unknown)}. "
+            f"Valid: {', '.join(SPLIT_DIMENSIONS)}")
+    return list(dict.fromkeys(dims))
+
+
+def compute_splits(player_filters, dimensions, filters=None):
+    """Aggregate a player's pitches into one row per split bucket.
+
+    Args:
+        player_filters: List of SQLAlchemy clauses selecting the player
+            (see PitcherStatsService._build_pitcher_filter and
+            HitterStatsService._build_batter_filter).
+        dimensions: List of keys from SPLIT_DIMENSIONS.
+        filters: Optional dict with 'game_id', 'start_date', 'end_date'.
+
+    Returns:
+        List of dicts, one per bucket, with a 'split' dict of dimension
+        values plus counting and rate stats. Buckets where any dimension
+        is NULL are dropped.
+    """
+    filters = filters or {}
+
+    keys = [SPLIT_DIMENSIONS[d]().label(d) for d in dimensions]
+
+    q = db.session.query(
+        *keys,
+        func.count(Pitch.id).label('pitches'),
+        func.sum(Pitch.pa_ended).label('pa'),
+        func.sum(case((Pitch.k_or_bb == 'Walk', 1), else_=0)).label('bb'),
+        func.sum(case((Pitch.play_result == 'HitByPitch', 1), else_=0)).label('hbp'),
+        func.sum(case((Pitch.play_result == 'Sacrifice', 1), else_=0)).label('sf'),
+        func.sum(case((Pitch.play_result == 'Single', 1), else_=0)).label('singles'),
+        func.sum(case((Pitch.play_result == 'Double', 1), else_=0)).label('doubles'),
+        func.sum(case((Pitch.play_result == 'Triple', 1), else_=0)).label('triples'),
+        func.sum(case((Pitch.play_result == 'HomeRun', 1), else_=0)).label('hr'),
+        func.sum(case((Pitch.k_or_bb == 'Strikeout', 1), else_=0)).label('k'),
+        func.sum(Pitch.is_swing).label('swings'),
+        func.sum(Pitch.is_whiff).label('whiffs'),
+        func.sum(Pitch.is_csw).label('csw'),
+        # Every tracked exit speed (fouls included), as hitter splits always used
+        func.avg(Pitch.exit_speed).label('avg_ev'),
+    ).filter(
+        *player_filters,
+        *[key.element.isnot(None) for key in keys],
+    ).group_by(*[key.element for key in keys])
+
+    if filters.get('game_id'):
+        q = q.filter(Pitch.game_id == filters['game_id'])
+    q = q.filter(*date_range_clauses(filters))
+
+    result = []
+    for row in q.all():
+        stats = split_line(row)
+        stats['split'] = {d: getattr(row, d) for d in dimensions}
+        result.append(stats)
+
+    result.sort(key=lambda r: tuple(str(r['split'][d]) for d in dimensions))
+    return result
+
+
+def split_line(row):
+    """Turn one aggregate row into a batting line with rate stats."""
+    pa = row.pa or 0
+    bb = row.bb or 0
+    hbp = row.hbp or 0
+    sf = row.sf or 0
+    singles = row.singles or 0
+    doubles = row.doubles or 0
+    triples = row.triples or 0
+    hr = row.hr or 0
+
+    ab = pa - bb - hbp - sf
+    h = singles + doubles + triples + hr
+    tb = singles + (2 * doubles) + (3 * triples) + (4 * hr)
+
+    avg = calculate_batting_average(h, ab)
+    obp = calculate_obp(h, bb, hbp, ab, sf)
+    slg = calculate_slg(tb, ab)
+
+    return {
+        'pitches': row.pitches,
+        'pa': pa,
+        'ab': ab,
+        'h': h,
+        'hr': hr,
+        'bb': bb,
+        'k': row.k or 0,
+        'avg': avg,
+        'obp': obp,
+        'slg': slg,
+        'ops': calculate_ops(obp, slg),
+        'woba': calculate_woba(singles, doubles, triples, hr, bb, hbp, ab,
+                               bb, hbp, sf),
+        'k_pct': pct(row.k, pa),
+        'bb_pct': pct(bb, pa),
+        'whiff_pct': pct(row.whiffs, row.swings),
+        'csw_pct': pct(row.csw, row.pitches),
+        'avg_ev': round(row.avg_ev, 1) if row.avg_ev else None,
+    }
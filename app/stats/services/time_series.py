@@ -0,0 +1,264 @@
+"""Per-game and rolling time series for a pitcher or batter.
+
+The player's pitches are read in one ordered scan (date, game, pitch
+number) and folded game by game. Each game gets its own line: velocity
+and spin for pitchers, exit velocity for batters, and whiff%, K%, BB%
+and wOBA for both. Two rolling windows advance pitch by pitch: the last
+N plate appearances and the last N swings. Each game line also carries
+the rolling wOBA, K% and whiff% as of that game's last pitch.
+
+The fold state is cached per player and query. When the data version
+changes, only pitches from games after the last folded game are read,
+and they are folded into a copy of that state. If anything changed at
+or before that game (an older game backfilled, an upload deleted), the
+series is rebuilt from scratch.
+"""
+
+import copy
+from collections import deque
+
+from sqlalchemy import func, tuple_
+
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.models.pitch import Pitch
+from app.utils.baseball_metrics import calculate_woba, pct
+from app.utils.player_filters import pitcher_filter, batter_filter
+from app.utils.request_cache import TTLCache, cache_key
+from app.utils.seasons import date_range_clauses
+
+PA_WINDOW = 50
+SWING_WINDOW = 100
+MAX_WINDOW = 1000
+
+# Entries are keyed on the data version; the TTL only bounds memory
+SERIES_CACHE_TTL = 600
+
+ROLE_FILTERS = {'pitcher': pitcher_filter, 'batter': batter_filter}
+
+# Per-game fields that only make sense for one role
+ROLE_FIELDS = {
+    'pitcher': ('fb_velo', 'max_velo', 'fb_spin'),
+    'batter': ('avg_ev', 'max_ev'),
+}
+
+# Plate appearance event: one count per outcome, in this order
+PA_FIELDS = ('pa', 'singles', 'doubles', 'triples', 'hr', 'bb', 'hbp', 'sf', 'k')
+PLAY_RESULT_FIELDS = {
+    'Single': 'singles',
+    'Double': 'doubles',
+    'Triple': 'triples',
+    'HomeRun': 'hr',
+    'HitByPitch': 'hbp',
+    'Sacrifice': 'sf',
+}
+K_OR_BB_FIELDS = {'Strikeout': 'k', 'Walk': 'bb'}
+
+SCAN_COLUMNS = (
+    Pitch.game_id, Pitch.date, Pitch.pitch_group, Pitch.rel_speed,
+    Pitch.spin_rate, Pitch.exit_speed, Pitch.is_swing, Pitch.is_whiff,
+    Pitch.is_csw, Pitch.is_bip, Pitch.pa_ended, Pitch.play_result,
+    Pitch.k_or_bb,
+)
+
+_cache = TTLCache()
+
+
+def get_time_series(role, trackman_id=None, name=None, filters=None,
+                    pa_window=PA_WINDOW, swing_window=SWING_WINDOW):
+    """Per-game lines with rolling windows for one player.
+
+    Args:
+        role: 'pitcher' or 'batter'.
+        trackman_id: Trackman ID, for players that have one.
+        name: Player name, for players without a Trackman ID.
+        filters: Optional game_id / start_date / end_date.
+        pa_window: Plate appearances in the rolling wOBA / K% window.
+        swing_window: Swings in the rolling whiff% window.
+
+    Returns:
+        Dict with 'pa_window', 'swing_window' and 'games' (oldest first).
+
+    Raises:
+        ValueError: If a window is outside 1..MAX_WINDOW.
+    """
+    for window in (pa_window, swing_window):
+        if not 1 <= window <= MAX_WINDOW:
+            raise ValueError(f'Rolling windows must be between 1 and {MAX_WINDOW}')
+    filters = filters or {}
+
+    clauses = [
+        *ROLE_FILTERS[role](trackman_id, name),
+        *date_range_clauses(filters),
+        Pitch.date.isnot(None),
+        Pitch.game_id.isnot(None),
+    ]
+    if filters.get('game_id'):
+        clauses.append(Pitch.game_id == filters['game_id'])
+
+    key = cache_key('time_series', role, trackman_id, name,
+                    tuple(sorted(filters.items())), pa_window, swing_window)
+    version = DataVersion.current()
+    cached = _cache.get(key)
+
+    if cached is not None and cached[0] == version:
+        state = cached[1]
+    elif cached is not None and _unchanged_through(cached[1], clauses):
+        state = copy.deepcopy(cached[1])
+        state.fold(_scan(clauses, after=state.last_game))
+    else:
+        state = SeriesState(pa_window, swing_window)
+        state.fold(_scan(clauses))
+    _cache.set(key, (version, state), SERIES_CACHE_TTL)
+
+    drop = {f for r, fields in ROLE_FIELDS.items() if r != role for f in fields}
+    return {
+        'pa_window': pa_window,
+        'swing_window': swing_window,
+        'games': [{k: v for k, v in line.items() if k not in drop}
+                  for line in state.games],
+    }
+
+
+def _scan(clauses, after=None):
+    """The player's pitches in game order, optionally only games after
+    the (date, game_id) pair ``after``."""
+    q = db.session.query(*SCAN_COLUMNS).filter(*clauses)
+    if after is not None:
+        q = q.filter(tuple_(Pitch.date, Pitch.game_id) > tuple_(*after))
+    return q.order_by(Pitch.date, Pitch.game_id, Pitch.pitch_no, Pitch.id).all()
+
+
+def _unchanged_through(state, clauses):
+    """Whether the pitches up to state's last game are still the ones it
+    folded (same count), so new games can be appended incrementally."""
+    if state.last_game is None:
+        return False
+    folded = db.session.query(func.count(Pitch.id)).filter(
+        *clauses, tuple_(Pitch.date, Pitch.game_id) <= tuple_(*state.last_game),
+    ).scalar()
+    return folded == state.pitches
+
+
+class RollingWindow:
+    """Running sums over the last ``size`` events (tuples of counts)."""
+
+    def __init__(self, size, width):
+        self.size = size
+        self.events = deque()
+        self.sums = [0] * width
+
+    def push(self, event):
+        self.events.append(event)
+        for i, value in enumerate(event):
+            self.sums[i] += value
+        if len(self.events) > self.size:
+            for i, value in enumerate(self.events.popleft()):
+                self.sums[i] -= value
+
+
+class GameTotals:
+    """Counting stats for one game."""
+
+    def __init__(self, game_id, date):
+        self.game_id = game_id
+        self.date = date
+        self.pitches = 0
+        self.pa = dict.fromkeys(PA_FIELDS, 0)
+        self.swings = 0
+        self.whiffs = 0
+        self.csw = 0
+        self.fb_velo = []
+        self.fb_spin = []
+        self.velo = []
+        self.ev = []
+
+
+class SeriesState:
+    """Fold state: finished game lines plus the rolling windows."""
+
+    def __init__(self, pa_window, swing_window):
+        self.pa_window = RollingWindow(pa_window, len(PA_FIELDS))
+        self.swing_window = RollingWindow(swing_window, 2)
+        self.games = []
+        self.last_game = None  # (date, game_id) of the last folded game
+        self.pitches = 0
+
+    def fold(self, rows):
+        """Fold pitches (in game order, all after last_game) into the state."""
+        game = None
+        for row in rows:
+            if game is None or row.game_id != game.game_id:
+                if game is not None:
+                    self._finish(game)
+                game = GameTotals(row.game_id, row.date)
+            self._add_pitch(game, row)
+        if game is not None:
+            self._finish(game)
+
+    def _add_pitch(self, game, row):
+        game.pitches += 1
+        self.pitches += 1
+        if row.rel_speed is not None:
+            game.velo.append(row.rel_speed)
+            if row.pitch_group == 'Fastball':
+                game.fb_velo.append(row.rel_speed)
+                if row.spin_rate is not None:
+                    game.fb_spin.append(row.spin_rate)
+        if row.is_bip and row.exit_speed is not None:
+            game.ev.append(row.exit_speed)
+        game.csw += row.is_csw or 0
+
+        if row.is_swing:
+            whiff = 1 if row.is_whiff else 0
+            game.swings += 1
+            game.whiffs += whiff
+            self.swing_window.push((1, whiff))
+
+        if row.pa_ended:
+            event = dict.fromkeys(PA_FIELDS, 0)
+            event['pa'] = 1
+            if row.play_result in PLAY_RESULT_FIELDS:
+                event[PLAY_RESULT_FIELDS[row.play_result]] = 1
+            if row.k_or_bb in K_OR_BB_FIELDS:
+                event[K_OR_BB_FIELDS[row.k_or_bb]] = 1
+            for field, value in event.items():
+                game.pa[field] += value
+            self.pa_window.push(tuple(event[f] for f in PA_FIELDS))
+
+    def _finish(self, game):
+        rolling = dict(zip(PA_FIELDS, self.pa_window.sums))
+        rolling_swings, rolling_whiffs = self.swing_window.sums
+        self.games.append({
+            'game_id': game.game_id,
+            'date': game.date.isoformat(),
+            'pitches': game.pitches,
+            'pa': game.pa['pa'],
+            'fb_velo': _mean(game.fb_velo),
+            'max_velo': round(max(game.velo), 1) if game.velo else None,
+            'fb_spin': _mean(game.fb_spin, digits=0),
+            'avg_ev': _mean(game.ev),
+            'max_ev': round(max(game.ev), 1) if game.ev else None,
+            'whiff_pct': pct(game.whiffs, game.swings),
+            'csw_pct': pct(game.csw, game.pitches),
+            'k_pct': pct(game.pa['k'], game.pa['pa']),
+            'bb_pct': pct(game.pa['bb'], game.pa['pa']),
+            'woba': _woba(game.pa),
+            'rolling_pa': rolling['pa'],
+            'rolling_woba': _woba(rolling),
+            'rolling_k_pct': pct(rolling['k'], rolling['pa']),
+            'rolling_swings': rolling_swings,
+            'rolling_whiff_pct': pct(rolling_whiffs, rolling_swings),
+        })
+        self.last_game = (game.date, game.game_id)
+
+
+def _woba(counts):
+    ab = counts['pa'] - counts['bb'] - counts['hbp'] - counts['sf']
+    return calculate_woba(counts['singles'], counts['doubles'], counts['triples'],
+                          counts['hr'], counts['bb'], counts['hbp'], ab,
+                          counts['bb'], counts['hbp'], counts['sf'])
+
+
+def _mean(values, digits=1):
+    return round(sum(values) / len(values), digits) if values else None
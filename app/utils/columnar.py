@@ -0,0 +1,58 @@
+"""Compact columnar encoding for JSON API payloads.
+
+A list of row dicts such as::
+
+    [{'pitch_type': 'Slider', 'avg_velo': 84.1}, {'pitch_type': 'Slider', ...}]
+
+is sent as one field list plus one value array per field::
+
+    {'fields': ['pitch_type', 'avg_velo'],
+     'values': [{'dictionary': ['Slider'], 'indices': [0, 0]}, [84.1, ...]]}
+
+Low-cardinality text columns are dictionary-encoded; everything else is
+a plain array. MexProGrid.decodeColumnar() in ag-grid-config.js turns a
+table back into row objects.
+"""
+
+# Dictionary-encode a text column when it has at most this share of
+# distinct values.
+DICTIONARY_MAX_RATIO = 0.5
+
+
+def wants_columnar(args):
+    """True when the request opted into ?format=columnar."""
+    return args.get('format') == 'columnar'
+
+
+def to_columnar(rows, fields=None):
+    """Encode a list of dicts as a columnar table.
+
+    Args:
+        rows: List of dicts sharing the same keys.
+        fields: Optional explicit field order; defaults to the first
+            row's keys.
+
+    Returns:
+        Dict with 'fields', 'values' and 'length'.
+    """
+    if fields is None:
+        fields = list(rows[0].keys()) if rows else []
+
+    values = [_encode_column([row.get(f) for row in rows]) for f in fields]
+    return {'fields': list(fields), 'values': values, 'length': len(rows)}
+
+
+def _encode_column(column):
+    """Dictionary-encode repetitive text columns, pass others through."""
+    if not column or not all(v is None or isinstance(v, str) for v in column):
+        return column
+
+    dictionary = list(dict.fromkeys(v for v in column if v is not None))
+    if len(dictionary) > len(column) * DICTIONARY_MAX_RATIO:
+        return column
+
+    lookup = {v: i for i, v in enumerate(dictionary)}
+    return {
+        'dictionary': dictionary,
+        'indices': [None if v is None else lookup[v] for v in column],
+    }
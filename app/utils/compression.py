@@ -0,0 +1,48 @@
+"""Response compression for JSON APIs (gzip, or brotli when installed)."""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_MIMETYPES = ('application/json',)
+
+
+def compress_response(response, accept_encodings):
+    """Compress a buffered response body in place if the client accepts it.
+
+    Meant to be called from an after_request hook. Streaming responses,
+    small bodies and already-encoded bodies are left untouched.
+
+    Args:
+        response: Flask Response object.
+        accept_encodings: The request's parsed Accept-Encoding
+            (``request.accept_encodings``).
+
+    Returns:
+        The (possibly modified) response.
+    """
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_SIZE:
+        return response
+
+    if brotli is not None and accept_encodings.quality('br') > 0:
+        response.set_data(brotli.compress(body, quality=5))
+        response.headers['Content-Encoding'] = 'br'
+    elif accept_encodings.quality('gzip') > 0:
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+
+    return response
@@ -0,0 +1,54 @@
+"""Conditional GET support (ETag / 304) keyed on the global data version.
+
+Stats, heatmap and report responses depend only on the stored pitch data,
+the team branding (both tracked by DataVersion) and the request
+parameters, so a strong ETag can be computed before the view runs. When the client already holds that representation the view is
+skipped entirely and a bodiless 304 is returned.
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import request, make_response
+
+
+def compute_etag():
+    """Strong ETag for the current request at the current data version.
+
+    Combines the data version, endpoint, URL arguments, normalized query
+    parameters and Accept-Encoding (compressed and plain bodies are
+    different representations).
+    """
+    from app.models.data_version import DataVersion
+
+    parts = [
+        str(DataVersion.current()),
+        request.endpoint or '',
+        repr(sorted((request.view_args or {}).items())),
+        repr(sorted(request.args.items(multi=True))),
+        request.headers.get('Accept-Encoding', ''),
+    ]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+
+def conditional_get(view):
+    """Decorator: answer If-None-Match with 304 before running the view.
+
+    Apply it inside @login_required so authentication still runs first.
+    """
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        etag = compute_etag()
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    return wrapped
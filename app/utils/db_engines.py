@@ -0,0 +1,63 @@
+"""Engine tuning and read/write routing.
+
+SQLite profile: every new connection gets the pragmas in
+``SQLITE_PRAGMAS`` (WAL journaling, relaxed fsync, mmap, a larger page
+cache and a busy timeout). With WAL, readers keep working while an
+import holds the write lock instead of failing or waiting on it.
+
+Reader engine: when a ``reader`` bind is configured (see
+``config.reader_binds``), read-only analytics blueprints call
+use_reader_engine() before each request and RoutingSession sends their
+queries to that engine. It has its own connection pool, so API traffic
+never queues behind the importer's connection, and its SQLite
+connections are opened with ``query_only`` so an accidental write fails
+loudly.
+"""
+
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+READER_BIND = 'reader'
+
+
+class RoutingSession(Session):
+    """Session that reads through the reader engine when the current
+    request asked for it; flushes always go to the primary engine."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing and has_app_context()
+                and g.get('use_reader_engine')
+                and READER_BIND in self._db.engines):
+            return self._db.engines[READER_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_reader_engine():
+    """before_request hook for read-only blueprints."""
+    g.use_reader_engine = True
+
+
+def configure_engines(app, db):
+    """Apply the SQLite profile to the app's SQLite engines."""
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if engine.dialect.name != 'sqlite':
+                continue
+            engine_pragmas = dict(pragmas)
+            if key == READER_BIND:
+                engine_pragmas['query_only'] = 'ON'
+            if engine_pragmas:
+                event.listen(engine, 'connect', _pragma_listener(engine_pragmas))
+
+
+def _pragma_listener(pragmas):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name} = {value}')
+        finally:
+            cursor.close()
+    return set_pragmas
@@ -0,0 +1,45 @@
+"""One cursor-execute timer shared by the SQL instrumentation.
+
+Query stats, the slow-query log and request timing all need each
+statement's duration. Instead of each wrapping every cursor call in its
+own before/after listener pair, the first add_statement_observer() call
+installs a single pair on each of the app's engines. It measures the
+statement once and passes the elapsed time to every observer:
+
+    def observer(conn, statement, parameters, context, executemany, elapsed_ms):
+        ...
+
+Observers run in registration order, after the statement has finished,
+so time one observer spends (an EXPLAIN, say) is not charged to the
+statement in the others.
+"""
+
+import time
+
+from sqlalchemy import event
+
+
+def add_statement_observer(app, db, observer):
+    """Call observer with the duration of every statement run on the
+    app's engines."""
+    observers = app.extensions.get('db_timing')
+    if observers is None:
+        observers = app.extensions['db_timing'] = []
+        _install(app, db, observers)
+    observers.append(observer)
+
+
+def _install(app, db, observers):
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context._db_timing_start) * 1000
+        for observer in observers:
+            observer(conn, statement, parameters, context, executemany, elapsed_ms)
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._db_timing_start = time.perf_counter()
@@ -0,0 +1,17 @@
+from functools import wraps
+
+from flask import abort, current_app
+from flask_login import current_user
+
+
+def admin_required(view):
+    """Allow only users whose role has the ADMIN permission (use under
+    @login_required)."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_app.config.get('LOGIN_DISABLED'):
+            return view(*args, **kwargs)
+        if not current_user.is_authenticated or not current_user.is_admin():
+            abort(403)
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,144 @@
+"""Server-side AG Grid support: sort/filter models translated to SQL.
+
+The grid's infinite row model asks for a window of rows
+(``startRow``/``endRow``) together with its current ``sortModel`` and
+``filterModel``. These helpers turn that request into ORDER BY / WHERE /
+LIMIT clauses over an aggregate subquery so only the visible window is
+formatted and sent back.
+"""
+
+import json
+
+from sqlalchemy import func, and_, or_
+
+MAX_BLOCK_SIZE = 500
+
+_TEXT_OPS = {
+    'contains': lambda col, v: col.ilike(f'%{v}%'),
+    'notContains': lambda col, v: ~col.ilike(f'%{v}%'),
+    'equals': lambda col, v: col == v,
+    'notEqual': lambda col, v: col != v,
+    'startsWith': lambda col, v: col.ilike(f'{v}%'),
+    'endsWith': lambda col, v: col.ilike(f'%{v}'),
+}
+
+_NUMBER_OPS = {
+    'equals': lambda col, v, to: col == v,
+    'notEqual': lambda col, v, to: col != v,
+    'greaterThan': lambda col, v, to: col > v,
+    'greaterThanOrEqual': lambda col, v, to: col >= v,
+    'lessThan': lambda col, v, to: col < v,
+    'lessThanOrEqual': lambda col, v, to: col <= v,
+    'inRange': lambda col, v, to: col.between(v, to),
+}
+
+
+def sql_pct(numerator, denominator):
+    """SQL counterpart of baseball_metrics.pct (unrounded, NULL on 0)."""
+    return 100.0 * numerator / func.nullif(denominator, 0)
+
+
+def sql_rate(numerator, denominator):
+    """SQL counterpart of baseball_metrics.rate (unrounded, NULL on 0)."""
+    return 1.0 * numerator / func.nullif(denominator, 0)
+
+
+def is_grid_request(args):
+    """True when the request carries infinite-row-model paging params."""
+    return 'startRow' in args or 'endRow' in args
+
+
+def parse_grid_request(args):
+    """Read startRow/endRow/sortModel/filterModel from request args.
+
+    sortModel and filterModel are JSON-encoded query parameters.
+
+    Raises:
+        ValueError: On malformed parameters.
+    """
+    try:
+        start = max(int(args.get('startRow', 0)), 0)
+        end = int(args.get('endRow', start + 100))
+        sort_model = json.loads(args.get('sortModel') or '[]')
+        filter_model = json.loads(args.get('filterModel') or '{}')
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid grid request: {e}')
+
+    end = min(max(end, start), start + MAX_BLOCK_SIZE)
+    if not isinstance(sort_model, list) or not isinstance(filter_model, dict):
+        raise ValueError('Invalid grid request: bad sortModel/filterModel')
+
+    return {
+        'start': start,
+        'end': end,
+        'sort_model': sort_model,
+        'filter_model': filter_model,
+    }
+
+
+def fetch_grid_page(query, sort_columns, grid, qualifier=None, default_sort=None):
+    """Apply a grid request to an aggregate query and fetch one window.
+
+    Args:
+        query: Unexecuted grouped query (one row per player).
+        sort_columns: Callable taking the subquery's column collection and
+            returning {field: SQL expression} for sortable/filterable fields.
+        grid: Dict from parse_grid_request().
+        qualifier: Optional callable taking the column collection and
+            returning a WHERE clause (e.g. minimum PA).
+        default_sort: Field to sort descending when the grid sends no
+            sort model.
+
+    Returns:
+        (rows, total) where rows are raw aggregate rows for the window and
+        total is the number of rows matching the filters.
+    """
+    sub = query.subquery()
+    columns = sort_columns(sub.c)
+
+    q = query.session.query(sub)
+    if qualifier is not None:
+        q = q.filter(qualifier(sub.c))
+    for field, model in grid['filter_model'].items():
+        if field in columns:
+            clause = _filter_clause(columns[field], model)
+            if clause is not None:
+                q = q.filter(clause)
+
+    total = q.count()
+
+    order_by = []
+    sort_model = grid['sort_model'] or (
+        [{'colId': default_sort, 'sort': 'desc'}] if default_sort else [])
+    for entry in sort_model:
+        expr = columns.get(entry.get('colId'))
+        if expr is None:
+            continue
+        expr = expr.desc() if entry.get('sort') == 'desc' else expr.asc()
+        order_by.append(expr.nullslast())
+
+    rows = q.order_by(*order_by).offset(grid['start']).limit(
+        grid['end'] - grid['start']).all()
+    return rows, total
+
+
+def _filter_clause(col, model):
+    """Translate one column's AG Grid filter model into a WHERE clause."""
+    if 'conditions' in model:
+        clauses = [c for c in (_filter_clause(col, m) for m in model['conditions'])
+                   if c is not None]
+        if not clauses:
+            return None
+        if model.get('operator') == 'OR':
+            return or_(*clauses)
+        return and_(*clauses)
+
+    op = model.get('type')
+    if model.get('filterType') == 'number':
+        if op not in _NUMBER_OPS or model.get('filter') is None:
+            return None
+        return _NUMBER_OPS[op](col, model['filter'], model.get('filterTo'))
+
+    if op not in _TEXT_OPS or not model.get('filter'):
+        return None
+    return _TEXT_OPS[op](col, str(model['filter']))
@@ -0,0 +1,147 @@
+"""Keyset (seek) pagination for newest-first listings.
+
+Offset pagination makes the database walk every skipped row, so late
+pages get slower as history grows. Here each page is a range scan that
+starts right after the last row of the previous page, identified by its
+sort key (e.g. ``(date, id)``), so the cost of any page depends only on
+the page size. Cursors are opaque URL-safe strings encoding that key.
+
+The leading sort column may be nullable; NULLs sort after every value
+(newest-first, NULLS LAST). NULL and non-NULL rows are read by separate
+index-friendly queries, so the order is the same on SQLite and
+PostgreSQL.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    """One page of rows plus cursors for the neighbouring pages."""
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+
+def keyset_paginate(query, sort_column, id_column, per_page,
+                    after=None, before=None):
+    """Return a KeysetPage of query ordered by (sort_column, id_column) desc.
+
+    Args:
+        query: ORM query for the (already filtered) entity.
+        sort_column: Leading sort column, e.g. Game.date.
+        id_column: Unique tie-breaker, e.g. Game.id.
+        per_page: Page size.
+        after: Cursor of the last row of the previous page (older rows).
+        before: Cursor of the first row of the next page (newer rows).
+
+    Raises:
+        InvalidCursor: If a cursor cannot be decoded.
+    """
+    limit = per_page + 1
+    if before is not None:
+        key = decode_cursor(before, sort_column, id_column)
+        rows = _seek(_newer_segments(query, sort_column, id_column, key), limit)
+        has_newer = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        has_older = True
+    else:
+        key = decode_cursor(after, sort_column, id_column) if after is not None else None
+        rows = _seek(_older_segments(query, sort_column, id_column, key), limit)
+        has_older = len(rows) > per_page
+        items = rows[:per_page]
+        has_newer = after is not None
+
+    if not items:
+        return KeysetPage([])
+
+    def cursor(row):
+        return encode_cursor(getattr(row, sort_column.key), getattr(row, id_column.key))
+
+    return KeysetPage(
+        items,
+        next_cursor=cursor(items[-1]) if has_older else None,
+        prev_cursor=cursor(items[0]) if has_newer else None,
+    )
+
+
+def _seek(segments, limit):
+    """Concatenate rows from ordered segment queries, up to limit rows.
+
+    Each segment is a plain row-value range (or IS NULL) condition, so it
+    is served by an index seek on (sort_column, id_column) rather than by
+    scanning from the top of the index.
+    """
+    rows = []
+    for segment in segments:
+        rows += segment.limit(limit - len(rows)).all()
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+def _older_segments(query, sort_column, id_column, key):
+    """Rows after key in (sort_column DESC NULLS LAST, id DESC) order."""
+    nulls = query.filter(sort_column.is_(None)).order_by(id_column.desc())
+    if key is None:
+        values = query.filter(sort_column.isnot(None))
+    else:
+        value, row_id = key
+        if value is None:
+            return [nulls.filter(id_column < row_id)]
+        values = query.filter(sort_column.isnot(None),
+                              tuple_(sort_column, id_column) < tuple_(value, row_id))
+    return [values.order_by(sort_column.desc(), id_column.desc()), nulls]
+
+
+def _newer_segments(query, sort_column, id_column, key):
+    """Rows before key, nearest first (the reverse of _older_segments)."""
+    values = query.filter(sort_column.isnot(None))
+    value, row_id = key
+    if value is not None:
+        values = values.filter(tuple_(sort_column, id_column) > tuple_(value, row_id))
+        return [values.order_by(sort_column.asc(), id_column.asc())]
+    nulls = query.filter(sort_column.is_(None), id_column > row_id).order_by(id_column.asc())
+    return [nulls, values.order_by(sort_column.asc(), id_column.asc())]
+
+
+def encode_cursor(value, row_id):
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, sort_column, id_column):
+    """Decode a cursor into (sort value, id) typed for the given columns."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+        if value is not None:
+            python_type = sort_column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            else:
+                value = python_type(value)
+        return value, int(row_id)
+    except (ValueError, TypeError, NotImplementedError) as e:
+        raise InvalidCursor(f'Invalid page cursor: {cursor!r}') from e
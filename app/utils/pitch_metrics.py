@@ -1,4 +1,8 @@
-"""Pitch type grouping and zone classification utilities."""
+"""Pitch type grouping, zone and pitch-call classification.
+
+Shared by ingest (derived columns) and the game summaries, so it lives
+outside the blueprint packages.
+"""
 
 PITCH_TYPE_GROUPS = {
     'Fastball': ['Four-Seam', 'Fastball', 'Sinker', 'Two-Seam', 'Cutter'],
@@ -26,6 +30,20 @@ ZONE_RIGHT = 0.83
 ZONE_BOTTOM = 1.5
 ZONE_TOP = 3.5
 
+# Pitch call classes
+SWING_CALLS = (
+    'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
+    'FoulBallFieldable', 'InPlay', 'FoulTip',
+)
+WHIFF_CALLS = ('StrikeSwinging',)
+CSW_CALLS = ('StrikeCalled', 'StrikeSwinging')
+BIP_CALLS = ('InPlay',)
+# Every call that counts as a strike in a pitcher's strike total
+STRIKE_CALLS = ('StrikeCalled',) + SWING_CALLS
+
+# Exit velocity (mph) at or above which a batted ball counts as hard hit
+HARD_HIT_EV = 95
+
 
 def is_in_zone(plate_loc_side, plate_loc_height):
     """Check if a pitch is in the strike zone."""
@@ -39,15 +57,12 @@ def is_swing(pitch_call):
     """Check if the pitch call represents a swing."""
     if not pitch_call:
         return False
-    return pitch_call in (
-        'StrikeSwinging', 'FoulBall', 'FoulBallNotFieldable',
-        'FoulBallFieldable', 'InPlay', 'FoulTip',
-    )
+    return pitch_call in SWING_CALLS
 
 
 def is_whiff(pitch_call):
     """Check if the pitch call is a swing and miss."""
-    return pitch_call == 'StrikeSwinging'
+    return pitch_call in WHIFF_CALLS
 
 
 def is_called_strike(pitch_call):
@@ -57,9 +72,9 @@ def is_called_strike(pitch_call):
 
 def is_csw(pitch_call):
     """Called Strike + Whiff (CSW)."""
-    return pitch_call in ('StrikeCalled', 'StrikeSwinging')
+    return pitch_call in CSW_CALLS
 
 
 def is_ball_in_play(pitch_call):
     """Check if the pitch was put in play."""
-    return pitch_call == 'InPlay'
+    return pitch_call in BIP_CALLS
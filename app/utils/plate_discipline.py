@@ -0,0 +1,50 @@
+"""Plate discipline aggregates (Chase%, Z-Swing%, Z-Contact%, O-Contact%).
+
+The SQL side is a handful of conditional sums over the per-pitch flag
+columns, meant to be spliced into an existing aggregate query so that
+discipline stats come out of the same scan as everything else.
+"""
+
+from sqlalchemy import func, case
+from app.models.pitch import Pitch
+from app.utils.baseball_metrics import pct
+from app.utils.grid_model import sql_pct
+
+
+def plate_discipline_columns():
+    """Labeled aggregate columns to add to a grouped Pitch query.
+
+    is_in_zone is NULL for pitches without a location, so those pitches
+    fall into neither the zone nor the out-of-zone buckets.
+    """
+    return [
+        func.sum(Pitch.is_in_zone).label('pd_z_pitches'),
+        func.sum(case((Pitch.is_in_zone == 0, 1), else_=0)).label('pd_o_pitches'),
+        func.sum(Pitch.is_in_zone * Pitch.is_swing).label('pd_z_swings'),
+        func.sum(case((Pitch.is_in_zone == 0, Pitch.is_swing), else_=0)).label('pd_o_swings'),
+        func.sum(Pitch.is_in_zone * Pitch.is_whiff).label('pd_z_whiffs'),
+        func.sum(case((Pitch.is_in_zone == 0, Pitch.is_whiff), else_=0)).label('pd_o_whiffs'),
+    ]
+
+
+def plate_discipline_rates(row):
+    """Compute discipline percentages from a row carrying the pd_* columns."""
+    z_swings = row.pd_z_swings or 0
+    o_swings = row.pd_o_swings or 0
+    return {
+        'chase_pct': pct(o_swings, row.pd_o_pitches),
+        'z_swing_pct': pct(z_swings, row.pd_z_pitches),
+        'z_contact_pct': pct(z_swings - (row.pd_z_whiffs or 0), z_swings),
+        'o_contact_pct': pct(o_swings - (row.pd_o_whiffs or 0), o_swings),
+    }
+
+
+def plate_discipline_sort_columns(c):
+    """SQL sort/filter expressions for the discipline fields, over a
+    subquery column collection carrying the pd_* columns."""
+    return {
+        'chase_pct': sql_pct(c.pd_o_swings, c.pd_o_pitches),
+        'z_swing_pct': sql_pct(c.pd_z_swings, c.pd_z_pitches),
+        'z_contact_pct': sql_pct(c.pd_z_swings - c.pd_z_whiffs, c.pd_z_swings),
+        'o_contact_pct': sql_pct(c.pd_o_swings - c.pd_o_whiffs, c.pd_o_swings),
+    }
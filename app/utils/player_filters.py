@@ -0,0 +1,30 @@
+"""Filter clauses selecting one player's pitches via the surrogate keys.
+
+A player is addressed either by Trackman ID or, for players without one,
+by name; both resolve to a PlayerKey and the pitch query filters on the
+indexed integer key column.
+"""
+
+from sqlalchemy import false
+
+from app.models.pitch import Pitch
+from app.models.player_key import PlayerKey
+
+
+def pitcher_filter(pitcher_id=None, pitcher_name=None):
+    """Clauses selecting a pitcher's pitches."""
+    return _key_filter(Pitch.pitcher_key, pitcher_id, pitcher_name)
+
+
+def batter_filter(batter_id=None, batter_name=None):
+    """Clauses selecting a batter's pitches."""
+    return _key_filter(Pitch.batter_key, batter_id, batter_name)
+
+
+def _key_filter(column, trackman_id, name):
+    key = PlayerKey.lookup(trackman_id=trackman_id, name=name)
+    if key is None:
+        # Unknown player: match nothing (a NULL comparison would match
+        # rows whose keys have not been backfilled yet)
+        return [false()]
+    return [column == key]
@@ -0,0 +1,84 @@
+"""Query-plan checks: catch stats queries that fall back to full table scans.
+
+Service code is run as-is while every SELECT it sends to the database is
+captured; each captured statement is then replayed through SQLite's
+``EXPLAIN QUERY PLAN`` with the same bound parameters. A plan step of the
+form ``SCAN pitches`` (optionally ``USING INDEX``, which still visits
+every row) means the query reads the whole table. ``SCAN ... USING
+COVERING INDEX`` and ``SEARCH`` steps are fine.
+"""
+
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+FULL_SCAN_RE = re.compile(r'^SCAN (\w+)(?: AS \w+)?(?: USING INDEX \w+)?$')
+
+
+@contextmanager
+def capture_selects(engine):
+    """Collect (statement, parameters) for every SELECT run on engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def explain_query_plan(connection, statement, parameters):
+    """Return the plan detail strings for a driver-level statement (SQLite)."""
+    result = connection.exec_driver_sql(
+        'EXPLAIN QUERY PLAN ' + statement, parameters)
+    return [row[-1] for row in result]
+
+
+def full_table_scans(plan, tables):
+    """Plan steps that scan one of the given tables end to end."""
+    scans = []
+    for detail in plan:
+        match = FULL_SCAN_RE.match(detail)
+        if match and match.group(1) in tables:
+            scans.append(detail)
+    return scans
+
+
+def check_query_plans(engine, cases, tables=('pitches',)):
+    """Run each case and EXPLAIN every SELECT it issues.
+
+    Args:
+        engine: SQLite engine the cases run against.
+        cases: Iterable of (label, callable) pairs; each callable runs one
+            service query with representative arguments.
+        tables: Table names for which a full scan is a failure.
+
+    Returns:
+        List of dicts with 'label', 'statement', 'plan' and 'scans' (the
+        offending steps; empty when the query is served by an index).
+    """
+    if engine.dialect.name != 'sqlite':
+        raise ValueError('Query plan checks require SQLite '
+                         f'(got {engine.dialect.name})')
+
+    results = []
+    for label, run in cases:
+        with capture_selects(engine) as statements:
+            run()
+
+        with engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = explain_query_plan(conn, statement, parameters)
+                results.append({
+                    'label': label,
+                    'statement': statement,
+                    'plan': plan,
+                    'scans': full_table_scans(plan, tables),
+                })
+    return results
@@ -0,0 +1,167 @@
+"""Per-endpoint SQL query statistics.
+
+The shared cursor timer (db_timing) charges each statement to the
+current request; when the request ends its totals are folded into
+an in-memory QueryStats keyed by Flask endpoint (count, DB time, the
+slowest statements). The admin "Query stats" page reads it.
+
+Queries run outside a request (CLI commands, imports run from the shell)
+are not recorded.
+
+Tests can bound an endpoint's query count with assert_max_queries():
+
+    with assert_max_queries(3, endpoint='stats.pitching_leaderboard_api'):
+        client.get('/stats/api/pitching-leaderboard')
+"""
+
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_request_context, request
+
+from app.utils.db_timing import add_statement_observer
+
+SLOWEST_PER_ENDPOINT = 5
+STATEMENT_PREVIEW = 500
+
+
+class EndpointStats:
+    """Aggregated numbers for one endpoint."""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_ms = 0.0
+        self.max_db_ms = 0.0
+        self.slowest = []  # (ms, statement), slowest first
+
+    @property
+    def avg_queries(self):
+        return self.queries / self.requests if self.requests else 0.0
+
+    @property
+    def avg_db_ms(self):
+        return self.db_ms / self.requests if self.requests else 0.0
+
+
+class RequestQueries:
+    """Queries issued by one request."""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.count = 0
+        self.db_ms = 0.0
+        self.slowest = []  # heap of the slowest (ms, statement)
+
+
+class QueryStats:
+    """Thread-safe in-memory aggregate of RequestQueries by endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._captures = []
+        self.since = time.time()
+
+    def record(self, req):
+        with self._lock:
+            stats = self._endpoints.get(req.endpoint)
+            if stats is None:
+                stats = self._endpoints[req.endpoint] = EndpointStats(req.endpoint)
+            stats.requests += 1
+            stats.queries += req.count
+            stats.max_queries = max(stats.max_queries, req.count)
+            stats.db_ms += req.db_ms
+            stats.max_db_ms = max(stats.max_db_ms, req.db_ms)
+            stats.slowest = heapq.nlargest(SLOWEST_PER_ENDPOINT, stats.slowest + req.slowest)
+            for captured in self._captures:
+                captured.append(req)
+
+    def endpoints(self):
+        """EndpointStats for every endpoint seen, by total DB time."""
+        with self._lock:
+            return sorted(self._endpoints.values(), key=lambda s: s.db_ms, reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.since = time.time()
+
+    @contextmanager
+    def capture(self):
+        """Collect the RequestQueries of requests finished in the block."""
+        captured = []
+        with self._lock:
+            self._captures.append(captured)
+        try:
+            yield captured
+        finally:
+            with self._lock:
+                self._captures.remove(captured)
+
+
+def init_query_stats(app, db):
+    """Attach the timing hooks to the app's engines and request cycle."""
+    stats = QueryStats()
+    app.extensions['query_stats'] = stats
+
+    add_statement_observer(app, db, _record_statement)
+
+    @app.teardown_request
+    def record_request_queries(exc):
+        if request.endpoint == 'static':
+            return
+        req = g.pop('request_queries', None)
+        stats.record(req or RequestQueries(_endpoint()))
+
+
+def get_query_stats():
+    """The app's QueryStats, or None when QUERY_STATS_ENABLED is off."""
+    return current_app.extensions.get('query_stats')
+
+
+@contextmanager
+def assert_max_queries(limit, endpoint=None):
+    """Fail if a request finished in the block issued more than limit
+    queries (only requests to endpoint, if given).
+
+    Raises RuntimeError when query stats are disabled, and fails if no
+    request to endpoint finished in the block.
+    """
+    stats = get_query_stats()
+    if stats is None:
+        raise RuntimeError('assert_max_queries needs query stats; '
+                           'set QUERY_STATS_ENABLED=1')
+    with stats.capture() as requests:
+        yield requests
+    matched = [r for r in requests if endpoint is None or r.endpoint == endpoint]
+    if endpoint is not None and not matched:
+        raise AssertionError(f'No request to {endpoint} finished in the block')
+    over = [r for r in matched if r.count > limit]
+    if over:
+        details = ', '.join(f'{r.endpoint}: {r.count}' for r in over)
+        raise AssertionError(f'Query budget of {limit} exceeded ({details})')
+
+
+def _record_statement(conn, statement, parameters, context, executemany, elapsed_ms):
+    if not has_request_context():
+        return
+
+    req = g.get('request_queries')
+    if req is None:
+        req = g.request_queries = RequestQueries(_endpoint())
+    req.count += 1
+    req.db_ms += elapsed_ms
+    entry = (elapsed_ms, statement[:STATEMENT_PREVIEW])
+    if len(req.slowest) < SLOWEST_PER_ENDPOINT:
+        heapq.heappush(req.slowest, entry)
+    else:
+        heapq.heappushpop(req.slowest, entry)
+
+
+def _endpoint():
+    return request.endpoint or '<unmatched>'
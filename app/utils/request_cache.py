@@ -0,0 +1,156 @@
+"""Process-local caches for data every request needs before the view runs.
+
+Each page render used to query the main TeamConfig (for branding) and
+load the logged-in User, then lazily load its Role on the first
+permission check. Both change rarely, so they are cached here and a
+typical page view issues no queries before its own work.
+
+Entries are dropped as soon as a session flushes or commits a change to
+TeamConfig, User or Role rows. A TeamConfig change also bumps
+DataVersion: reports and pages render the branding, and their ETags
+(app.utils.conditional) are keyed on the data version. Writes made by another process (another
+worker, ``seed.py``) cannot be seen, so every entry also expires after
+``REQUEST_CACHE_TTL`` seconds.
+"""
+
+import threading
+import time
+
+from flask import current_app
+from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload
+
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.models.team import TeamConfig
+from app.models.user import Permission, Role, User
+
+DEFAULT_TTL = 60
+
+
+class TTLCache:
+    """Thread-safe dict whose entries expire after a fixed time."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+team_config_cache = TTLCache()
+user_cache = TTLCache()
+
+
+class CachedUser(UserMixin):
+    """Read-only snapshot of a User and its Role.
+
+    Exposes what requests use (id, username, email, is_active, can,
+    is_admin) without holding an ORM instance across sessions. Views that
+    need to modify the user should load the User row themselves.
+    """
+
+    def __init__(self, user):
+        self.id = user.id
+        self.username = user.username
+        self.email = user.email
+        self.role_id = user.role_id
+        self.role_name = user.role.name if user.role else None
+        self.permissions = user.role.permissions if user.role else None
+        self._active = bool(user.is_active)
+
+    @property
+    def is_active(self):
+        return self._active
+
+    def can(self, perm):
+        return self.permissions is not None and self.permissions & perm == perm
+
+    def is_admin(self):
+        return self.can(Permission.ADMIN)
+
+    def __repr__(self):
+        return f'<User {self.username}>'
+
+
+def cache_ttl():
+    return current_app.config.get('REQUEST_CACHE_TTL', DEFAULT_TTL)
+
+
+def cache_key(*parts):
+    """Key entries by database so apps bound to different DBs don't mix."""
+    return (current_app.config['SQLALCHEMY_DATABASE_URI'],) + parts
+
+
+def load_user(user_id):
+    """Flask-Login user loader: the cached snapshot for user_id, or None."""
+    key = cache_key(user_id)
+    cached = user_cache.get(key)
+    if cached is not None:
+        return cached
+
+    user = db.session.query(User).options(joinedload(User.role)).filter(
+        User.id == user_id).first()
+    if user is None:
+        return None
+
+    snapshot = CachedUser(user)
+    user_cache.set(key, snapshot, cache_ttl())
+    return snapshot
+
+
+def invalidate_team_config():
+    team_config_cache.clear()
+
+
+def invalidate_users():
+    user_cache.clear()
+
+
+@event.listens_for(Session, 'before_flush')
+def _bump_data_version_on_branding(session, flush_context, instances):
+    modified = (obj for obj in session.dirty if session.is_modified(obj))
+    if any(isinstance(obj, TeamConfig)
+           for obj in (*session.new, *session.deleted, *modified)):
+        DataVersion.bump()
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_on_flush(session, flush_context):
+    changed = {type(obj) for obj in (*session.new, *session.dirty, *session.deleted)}
+    if TeamConfig in changed:
+        invalidate_team_config()
+        session.info['invalidate_team_config'] = True
+    if User in changed or Role in changed:
+        invalidate_users()
+        session.info['invalidate_users'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_on_transaction_end(session):
+    # A request may have re-cached rows between the flush and the commit
+    # (or cached flushed rows that were then rolled back).
+    if session.info.pop('invalidate_team_config', False):
+        invalidate_team_config()
+    if session.info.pop('invalidate_users', False):
+        invalidate_users()
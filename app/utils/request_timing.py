@@ -0,0 +1,259 @@
+"""Per-request phase timing (Server-Timing header) and latency histograms.
+
+Each request's wall time is split into phases:
+
+* ``auth``: loading the logged-in user.
+* ``db``: time inside database cursor calls.
+* ``render``: matplotlib heatmap rendering.
+* ``pdf``: building report PDFs with reportlab.
+* ``template``: Jinja page rendering.
+* ``serialize``: JSON encoding.
+* ``compress``: gzip/brotli of API responses.
+* ``app``: everything else (Python aggregation in the services, routing).
+
+Code marks a phase with ``with phase('render'):``. Times are exclusive:
+a phase excludes the phases nested inside it, so the PDF time does not
+include the heatmaps or queries it triggers, and the phases add up to
+``total``. They are sent as a ``Server-Timing`` header, which browser
+devtools show under Timing.
+
+Each request's total is also added to an in-memory histogram for its
+endpoint; a streamed response is recorded when its body has been sent. The admin "Latency" page shows p50/p95/p99 from these.
+"""
+
+import bisect
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from flask import current_app, g, has_request_context, request, template_rendered, before_render_template
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.db_timing import add_statement_observer
+
+ROOT_PHASE = 'app'
+PHASE_DESCRIPTIONS = {
+    'auth': 'User load',
+    'db': 'Database',
+    'render': 'Chart render',
+    'pdf': 'PDF build',
+    'template': 'Template',
+    'serialize': 'JSON',
+    'compress': 'Compression',
+    'app': 'Python',
+}
+
+# Histogram bucket upper bounds in ms: 1 ms to ~2 min, 20% apart, so a
+# percentile read from them is within 20% of the true value.
+BUCKET_BOUNDS = [1.2 ** i for i in range(65)]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (ms) with percentile estimates."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """Estimated q-th percentile (0-100), interpolated within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKET_BOUNDS[i - 1] if i else 0.0
+                upper = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - seen) / n
+                return min(estimate, self.max_ms)
+            seen += n
+        return self.max_ms
+
+    @property
+    def mean_ms(self):
+        return self.sum_ms / self.count if self.count else 0.0
+
+
+class EndpointLatency:
+    """Latency histogram and per-phase time totals for one endpoint."""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.histogram = LatencyHistogram()
+        self.phase_ms = defaultdict(float)
+
+    @property
+    def requests(self):
+        return self.histogram.count
+
+    def p(self, q):
+        return self.histogram.percentile(q)
+
+    def avg_phases(self):
+        """(phase, mean ms) pairs, slowest first."""
+        n = self.requests or 1
+        return sorted(((name, total / n) for name, total in self.phase_ms.items()),
+                      key=lambda item: item[1], reverse=True)
+
+
+class LatencyStats:
+    """Thread-safe EndpointLatency registry."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self.since = time.time()
+
+    def record(self, endpoint, total_ms, phases):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointLatency(endpoint)
+            stats.histogram.add(total_ms)
+            for name, ms in phases.items():
+                stats.phase_ms[name] += ms
+
+    def endpoints(self):
+        """EndpointLatency for every endpoint seen, slowest p95 first."""
+        with self._lock:
+            return sorted(self._endpoints.values(), key=lambda s: s.p(95), reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.since = time.time()
+
+
+class RequestTimer:
+    """Exclusive phase times of the current request."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.exclusive = defaultdict(float)
+        self.stack = [ROOT_PHASE]
+
+    def add(self, name, ms):
+        """Charge ms to name and take it out of the enclosing phase."""
+        self.exclusive[self.stack[-1]] -= ms
+        self.exclusive[name] += ms
+
+    def finish(self):
+        """Phase times (ms) and the request total."""
+        total = (time.perf_counter() - self.start) * 1000
+        phases = dict(self.exclusive)
+        phases[ROOT_PHASE] = phases.get(ROOT_PHASE, 0.0) + total
+        return {k: v for k, v in phases.items() if v > 0}, total
+
+
+@contextmanager
+def phase(name):
+    """Time the block as phase name of the current request (no-op
+    outside a request or when timing is disabled)."""
+    timer = _timer()
+    if timer is None:
+        yield
+        return
+    timer.stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.stack.pop()
+        timer.add(name, (time.perf_counter() - start) * 1000)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Default JSON provider that charges encoding to ``serialize``."""
+
+    def dumps(self, obj, **kwargs):
+        with phase('serialize'):
+            return super().dumps(obj, **kwargs)
+
+
+def init_request_timing(app, db):
+    """Install the request hooks, DB/template timers and JSON provider."""
+    stats = LatencyStats()
+    app.extensions['latency_stats'] = stats
+    app.json = TimedJSONProvider(app)
+    send_header = app.config.get('SERVER_TIMING_HEADER', True)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_timer = RequestTimer()
+
+    @app.after_request
+    def finish_request_timer(response):
+        timer = g.get('request_timer')
+        if timer is None or request.endpoint == 'static':
+            return response
+        endpoint = request.endpoint or '<unmatched>'
+        if response.is_streamed:
+            # The body is produced after this hook (and its queries still
+            # charge the timer); record once it has been sent. Headers are
+            # already out by then, so there is no Server-Timing.
+            response.call_on_close(lambda: record(timer, endpoint))
+            return response
+        g.pop('request_timer')
+        phases, total = record(timer, endpoint)
+        if send_header:
+            response.headers['Server-Timing'] = server_timing_header(phases, total)
+        return response
+
+    def record(timer, endpoint):
+        phases, total = timer.finish()
+        stats.record(endpoint, total, phases)
+        return phases, total
+
+    add_statement_observer(app, db, _add_db_time)
+
+    before_render_template.connect(_before_render_template, app)
+    template_rendered.connect(_template_rendered, app)
+
+
+def get_latency_stats():
+    """The app's LatencyStats, or None when request timing is disabled."""
+    return current_app.extensions.get('latency_stats')
+
+
+def server_timing_header(phases, total):
+    entries = [f'{name};dur={ms:.1f};desc="{PHASE_DESCRIPTIONS.get(name, name)}"'
+               for name, ms in sorted(phases.items(), key=lambda item: item[1], reverse=True)]
+    entries.append(f'total;dur={total:.1f}')
+    return ', '.join(entries)
+
+
+def _timer():
+    if not has_request_context():
+        return None
+    return g.get('request_timer')
+
+
+def _add_db_time(conn, statement, parameters, context, executemany, elapsed_ms):
+    timer = _timer()
+    if timer is not None:
+        timer.add('db', elapsed_ms)
+
+
+def _before_render_template(sender, template, context, **extra):
+    timer = _timer()
+    if timer is not None:
+        timer.stack.append('template')
+        g.template_render_start = time.perf_counter()
+
+
+def _template_rendered(sender, template, context, **extra):
+    timer = _timer()
+    start = g.pop('template_render_start', None)
+    if timer is not None and start is not None:
+        timer.stack.pop()
+        timer.add('template', (time.perf_counter() - start) * 1000)
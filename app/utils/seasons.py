@@ -0,0 +1,49 @@
+"""Season scoping for pitch queries.
+
+Pitches carry a ``season`` column (the calendar year of the game date).
+On PostgreSQL the pitches table is list-partitioned on it (see
+app.ingest.services.partitions), so a query only touches the partitions
+its season predicate allows. Services apply their start/end date filters
+through date_range_clauses(), which adds the matching season bounds so
+the planner can prune partitions it would otherwise have to visit to
+evaluate the date range.
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from app.models.pitch import Pitch
+
+
+def season_of(value):
+    """Season of a date (or ISO date string); None if unknown."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, date):
+        return value.year
+    try:
+        return int(str(value)[:4])
+    except ValueError:
+        return None
+
+
+def date_range_clauses(filters):
+    """Filter clauses for filters['start_date'] / filters['end_date'].
+
+    Each bound is applied to Pitch.date and, as a pruning hint, to
+    Pitch.season.
+    """
+    clauses = []
+    start, end = filters.get('start_date'), filters.get('end_date')
+    if start:
+        clauses.append(Pitch.date >= start)
+        season = season_of(start)
+        if season is not None:
+            clauses.append(Pitch.season >= season)
+    if end:
+        clauses.append(Pitch.date <= end)
+        season = season_of(end)
+        if season is not None:
+            clauses.append(Pitch.season <= season)
+    return clauses
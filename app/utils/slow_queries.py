@@ -0,0 +1,147 @@
+"""Slow-query log with the plan captured at the time.
+
+Every statement that takes longer than ``SLOW_QUERY_MS`` is written, with
+its bound parameters, endpoint, duration and query plan, to a rotating
+log file (``SLOW_QUERY_LOG``) and kept in memory for the admin "Slow
+queries" page. The plan is taken right after the statement ran, on the
+same connection and with the same parameters:
+
+* SQLite: ``EXPLAIN QUERY PLAN``.
+* PostgreSQL: plain ``EXPLAIN``, or ``EXPLAIN (ANALYZE, BUFFERS)`` when
+  ``SLOW_QUERY_EXPLAIN_ANALYZE`` is on. ANALYZE runs the query a second
+  time, so it is off by default; the EXPLAIN is wrapped in a savepoint
+  that is always rolled back, so it can neither abort the caller's
+  transaction nor keep the effects of a data-modifying CTE.
+
+Only SELECT and WITH statements are explained. Statements run outside a request (CLI
+commands, imports) are logged with no endpoint.
+"""
+
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+from flask import current_app, has_request_context, request
+
+from app.utils.db_timing import add_statement_observer
+
+logger = logging.getLogger('app.slow_queries')
+
+KEEP_IN_MEMORY = 200
+PARAMETERS_PREVIEW = 1000
+
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of the most recent slow queries."""
+
+    def __init__(self, maxlen=KEEP_IN_MEMORY):
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=maxlen)
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self):
+        """Logged queries, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def init_slow_query_log(app, db):
+    """Log statements slower than SLOW_QUERY_MS on all of the app's
+    engines (0 disables)."""
+    threshold_ms = app.config.get('SLOW_QUERY_MS') or 0
+    if threshold_ms <= 0:
+        return
+
+    slow_log = SlowQueryLog()
+    app.extensions['slow_queries'] = slow_log
+    _add_file_handler(app.config.get('SLOW_QUERY_LOG'))
+    analyze = app.config.get('SLOW_QUERY_EXPLAIN_ANALYZE', False)
+
+    def log_if_slow(conn, statement, parameters, context, executemany, elapsed_ms):
+        if elapsed_ms < threshold_ms:
+            return
+
+        plan = None
+        if not executemany and _is_query(statement):
+            plan = explain(conn, statement, parameters, analyze)
+        entry = {
+            'at': datetime.now(timezone.utc),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'duration_ms': elapsed_ms,
+            'statement': statement,
+            'parameters': _preview(parameters),
+            'plan': plan,
+        }
+        slow_log.add(entry)
+        logger.warning('%.1f ms [%s]\n%s\nparameters: %s\nplan:\n%s',
+                       elapsed_ms, entry['endpoint'] or '-', statement,
+                       entry['parameters'], '\n'.join(plan or ['(not captured)']))
+
+    add_statement_observer(app, db, log_if_slow)
+
+
+def get_slow_query_log():
+    """The app's SlowQueryLog, or None when the log is disabled."""
+    return current_app.extensions.get('slow_queries')
+
+
+def explain(conn, statement, parameters, analyze=False):
+    """Plan lines for statement, run on conn's DBAPI connection so the
+    EXPLAIN itself is neither timed nor logged. None if it fails."""
+    dbapi_connection = conn.connection.dbapi_connection
+    dialect = conn.dialect.name
+    cursor = dbapi_connection.cursor()
+    try:
+        if dialect == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+            return [row[-1] for row in cursor.fetchall()]
+
+        prefix = 'EXPLAIN (ANALYZE, BUFFERS) ' if analyze else 'EXPLAIN '
+        cursor.execute('SAVEPOINT slow_query_explain')
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+            cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+    except Exception:
+        logger.debug('EXPLAIN failed', exc_info=True)
+        return None
+    finally:
+        cursor.close()
+
+
+def _is_query(statement):
+    """True for SELECT and WITH (CTE) statements."""
+    words = statement.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in ('SELECT', 'WITH')
+
+
+def _add_file_handler(path):
+    if not path:
+        return
+    path = os.path.abspath(path)
+    if any(getattr(h, 'baseFilename', None) == path for h in logger.handlers):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=5 * 1024 * 1024, backupCount=5)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING)
+
+
+def _preview(parameters):
+    text = repr(parameters)
+    if len(text) > PARAMETERS_PREVIEW:
+        text = text[:PARAMETERS_PREVIEW] + '...'
+    return text
@@ -2,7 +2,24 @@ from flask import current_app
 
 
 def get_team_config():
-    """Load main team config from DB, fallback to .env defaults."""
+    """Main team config, cached per process (see app.utils.request_cache)."""
+    from app.utils.request_cache import team_config_cache, cache_key, cache_ttl
+
+    key = cache_key('team_config')
+    config = team_config_cache.get(key)
+    if config is None:
+        config, found = _load_team_config()
+        # Don't cache the fallback after a DB error (e.g. before migrations)
+        if found is not None:
+            team_config_cache.set(key, config, cache_ttl())
+    return dict(config)
+
+
+def _load_team_config():
+    """Load main team config from DB, fallback to .env defaults.
+
+    Returns (config, found); found is None if the lookup failed.
+    """
     try:
         from app.models.team import TeamConfig
         team = TeamConfig.query.filter_by(is_main_team=True).first()
@@ -18,9 +35,10 @@ def get_team_config():
                 'accent_color': team.accent_color,
                 'logo': team.logo_filename or 'team-logo.png',
                 'season_year': team.season_year or current_app.config.get('SEASON_YEAR', 2026),
-            }
+            }, True
+        found = False
     except Exception:
-        pass
+        found = None
 
     return {
         'code': current_app.config.get('DEFAULT_TEAM_CODE', 'TEAM'),
@@ -33,4 +51,4 @@ def get_team_config():
         'accent_color': current_app.config.get('DEFAULT_ACCENT_COLOR', '#ffffff'),
         'logo': 'team-logo.png',
         'season_year': current_app.config.get('SEASON_YEAR', 2026),
-    }
+    }, found
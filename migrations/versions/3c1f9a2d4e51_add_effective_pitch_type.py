@@ -0,0 +1,34 @@
+"""Add materialized effective_pitch_type and pitch_group to pitches
+
+Existing rows are populated with `flask ingest backfill-derived`.
+
+Revision ID: 3c1f9a2d4e51
+Revises: 7985aab4feeb
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a2d4e51'
+down_revision = '7985aab4feeb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('effective_pitch_type', sa.String(length=30), nullable=True))
+        batch_op.add_column(sa.Column('pitch_group', sa.String(length=20), nullable=True))
+        batch_op.drop_index('ix_pitches_pitcher_pitch_type')
+        batch_op.create_index('ix_pitches_pitcher_effective_type', ['pitcher_id', 'effective_pitch_type'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.drop_index('ix_pitches_pitcher_effective_type')
+        batch_op.create_index('ix_pitches_pitcher_pitch_type', ['pitcher_id', 'tagged_pitch_type'], unique=False)
+        batch_op.drop_column('pitch_group')
+        batch_op.drop_column('effective_pitch_type')
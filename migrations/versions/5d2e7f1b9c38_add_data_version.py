@@ -0,0 +1,29 @@
+"""Add data_version counter used for ETags
+
+Revision ID: 5d2e7f1b9c38
+Revises: 8a4be07c19d2
+Create Date: 2026-10-18 11:42:10.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e7f1b9c38'
+down_revision = '8a4be07c19d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('data_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('data_version')
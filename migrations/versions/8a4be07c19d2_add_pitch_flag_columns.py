@@ -0,0 +1,35 @@
+"""Add precomputed per-pitch flag columns
+
+Existing rows are populated with `flask ingest backfill-derived`.
+
+Revision ID: 8a4be07c19d2
+Revises: 3c1f9a2d4e51
+Create Date: 2026-10-18 10:03:27.540961
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4be07c19d2'
+down_revision = '3c1f9a2d4e51'
+branch_labels = None
+depends_on = None
+
+
+FLAG_COLUMNS = ['is_swing', 'is_whiff', 'is_csw', 'is_bip', 'pa_ended', 'is_hard_hit']
+
+
+def upgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        for name in FLAG_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.SmallInteger(), nullable=True, server_default=sa.text('0')))
+        batch_op.add_column(sa.Column('is_in_zone', sa.SmallInteger(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.drop_column('is_in_zone')
+        for name in reversed(FLAG_COLUMNS):
+            batch_op.drop_column(name)
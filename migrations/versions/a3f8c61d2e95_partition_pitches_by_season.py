@@ -0,0 +1,107 @@
+"""Add pitches.season; partition pitches by season on PostgreSQL
+
+season is the calendar year of the pitch date. On PostgreSQL the table
+is rebuilt as LIST-partitioned on season: one pitches_<season> partition
+per season present plus pitches_default (undated rows). Primary key and
+pitch_uid uniqueness are enforced per partition, since a partitioned
+table's unique constraints must include the partition key. New seasons
+get their partition from the importer (app.ingest.services.partitions).
+
+Other databases only get the column.
+
+Revision ID: a3f8c61d2e95
+Revises: c59d2e8a1f47
+Create Date: 2026-10-19 14:22:07.915304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f8c61d2e95'
+down_revision = 'c59d2e8a1f47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('season', sa.Integer(), nullable=True))
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('UPDATE pitches SET season = EXTRACT(YEAR FROM date)::integer '
+                   'WHERE date IS NOT NULL')
+        _partition(bind)
+    else:
+        op.execute("UPDATE pitches SET season = CAST(strftime('%Y', date) AS INTEGER) "
+                   "WHERE date IS NOT NULL")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        _unpartition(bind)
+
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.drop_column('season')
+
+
+def _table_ddl(bind, table):
+    """Non-unique index definitions and foreign key constraints of table."""
+    indexes = [row.indexdef for row in bind.execute(sa.text(
+        'SELECT indexdef FROM pg_indexes WHERE tablename = :t'), {'t': table})
+        if ' UNIQUE ' not in row.indexdef]
+    foreign_keys = bind.execute(sa.text(
+        "SELECT conname, pg_get_constraintdef(oid) AS definition FROM pg_constraint "
+        "WHERE conrelid = to_regclass(:t) AND contype = 'f'"), {'t': table}).fetchall()
+    return indexes, foreign_keys
+
+
+def _create_partition(name, bounds):
+    op.execute(f'CREATE TABLE {name} PARTITION OF pitches {bounds}')
+    op.execute(f'ALTER TABLE {name} ADD PRIMARY KEY (id)')
+    op.execute(f'CREATE UNIQUE INDEX ix_{name}_pitch_uid ON {name} (pitch_uid)')
+
+
+def _partition(bind):
+    seasons = [row[0] for row in bind.execute(sa.text(
+        'SELECT DISTINCT season FROM pitches WHERE season IS NOT NULL ORDER BY season'))]
+    indexes, foreign_keys = _table_ddl(bind, 'pitches')
+
+    op.execute('ALTER TABLE pitches RENAME TO pitches_unpartitioned')
+    op.execute('ALTER SEQUENCE pitches_id_seq OWNED BY NONE')
+    op.execute('CREATE TABLE pitches (LIKE pitches_unpartitioned INCLUDING DEFAULTS) '
+               'PARTITION BY LIST (season)')
+    for season in seasons:
+        _create_partition(f'pitches_{season}', f'FOR VALUES IN ({season})')
+    _create_partition('pitches_default', 'DEFAULT')
+
+    op.execute('INSERT INTO pitches SELECT * FROM pitches_unpartitioned')
+    op.execute('DROP TABLE pitches_unpartitioned')
+    op.execute('ALTER SEQUENCE pitches_id_seq OWNED BY pitches.id')
+
+    # Indexes created on the parent cascade to every partition
+    for definition in indexes:
+        op.execute(definition)
+    for fk in foreign_keys:
+        op.execute(f'ALTER TABLE pitches ADD CONSTRAINT {fk.conname} {fk.definition}')
+
+
+def _unpartition(bind):
+    indexes, foreign_keys = _table_ddl(bind, 'pitches')
+
+    op.execute('ALTER TABLE pitches RENAME TO pitches_partitioned')
+    op.execute('ALTER SEQUENCE pitches_id_seq OWNED BY NONE')
+    op.execute('CREATE TABLE pitches (LIKE pitches_partitioned INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO pitches SELECT * FROM pitches_partitioned')
+    op.execute('DROP TABLE pitches_partitioned CASCADE')
+    op.execute('ALTER SEQUENCE pitches_id_seq OWNED BY pitches.id')
+
+    op.execute('ALTER TABLE pitches ADD PRIMARY KEY (id)')
+    op.execute('CREATE UNIQUE INDEX ix_pitches_pitch_uid ON pitches (pitch_uid)')
+    for definition in indexes:
+        op.execute(definition.replace(' ON ONLY ', ' ON '))
+    for fk in foreign_keys:
+        op.execute(f'ALTER TABLE pitches ADD CONSTRAINT {fk.conname} {fk.definition}')
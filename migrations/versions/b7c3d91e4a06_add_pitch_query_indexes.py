@@ -0,0 +1,37 @@
+"""Add indexes for name-keyed players, batter team and heatmap locations
+
+Revision ID: b7c3d91e4a06
+Revises: 5d2e7f1b9c38
+Create Date: 2026-10-19 09:14:52.306417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c3d91e4a06'
+down_revision = '5d2e7f1b9c38'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    'ix_pitches_batter_team_date': ['batter_team', 'date'],
+    'ix_pitches_pitcher_name': ['pitcher', 'pitcher_id'],
+    'ix_pitches_batter_name': ['batter', 'batter_id'],
+    'ix_pitches_pitcher_side_loc': ['pitcher_id', 'batter_side', 'plate_loc_side', 'plate_loc_height'],
+    'ix_pitches_batter_hand_loc': ['batter_id', 'pitcher_throws', 'plate_loc_side', 'plate_loc_height'],
+}
+
+
+def upgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        for name in reversed(list(INDEXES)):
+            batch_op.drop_index(name)
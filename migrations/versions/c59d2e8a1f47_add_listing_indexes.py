@@ -0,0 +1,45 @@
+"""Add indexes for keyset pagination of games and upload history
+
+Revision ID: c59d2e8a1f47
+Revises: f2b6a0d83c17
+Create Date: 2026-10-19 13:05:21.448190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c59d2e8a1f47'
+down_revision = 'f2b6a0d83c17'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    'games': {
+        'ix_games_date_id': ['date', 'id'],
+        'ix_games_home_team_date': ['home_team', 'date', 'id'],
+        'ix_games_away_team_date': ['away_team', 'date', 'id'],
+        'ix_games_level_date': ['level', 'date', 'id'],
+        'ix_games_verified_date': ['is_verified', 'date', 'id'],
+    },
+    'upload_logs': {
+        'ix_upload_logs_created_id': ['created_at', 'id'],
+        'ix_upload_logs_status_created': ['status', 'created_at', 'id'],
+    },
+}
+
+
+def upgrade():
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, columns in indexes.items():
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    for table, indexes in reversed(list(INDEXES.items())):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name in reversed(list(indexes)):
+                batch_op.drop_index(name)
@@ -0,0 +1,81 @@
+"""Add game_pitcher_lines / game_batter_lines for box scores and game logs
+
+Existing databases are populated with `flask ingest rebuild-game-lines`.
+
+Revision ID: d84e1b7f3a52
+Revises: a3f8c61d2e95
+Create Date: 2026-10-19 18:05:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd84e1b7f3a52'
+down_revision = 'a3f8c61d2e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('game_pitcher_lines',
+    sa.Column('game_id', sa.String(length=100), nullable=False),
+    sa.Column('player_key', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.Column('trackman_id', sa.Integer(), nullable=True),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('team', sa.String(length=50), nullable=True),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('batters_faced', sa.Integer(), nullable=False),
+    sa.Column('pitches', sa.Integer(), nullable=False),
+    sa.Column('strikes', sa.Integer(), nullable=False),
+    sa.Column('whiffs', sa.Integer(), nullable=False),
+    sa.Column('k', sa.Integer(), nullable=False),
+    sa.Column('bb', sa.Integer(), nullable=False),
+    sa.Column('hbp', sa.Integer(), nullable=False),
+    sa.Column('h', sa.Integer(), nullable=False),
+    sa.Column('hr', sa.Integer(), nullable=False),
+    sa.Column('max_velo', sa.Float(), nullable=True),
+    sa.Column('fb_velo', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['game_id'], ['games.game_id'], ),
+    sa.PrimaryKeyConstraint('game_id', 'player_key')
+    )
+    with op.batch_alter_table('game_pitcher_lines', schema=None) as batch_op:
+        batch_op.create_index('ix_game_pitcher_lines_player_date', ['player_key', 'date'], unique=False)
+
+    op.create_table('game_batter_lines',
+    sa.Column('game_id', sa.String(length=100), nullable=False),
+    sa.Column('player_key', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.Column('trackman_id', sa.Integer(), nullable=True),
+    sa.Column('name', sa.String(length=100), nullable=True),
+    sa.Column('team', sa.String(length=50), nullable=True),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('pa', sa.Integer(), nullable=False),
+    sa.Column('ab', sa.Integer(), nullable=False),
+    sa.Column('h', sa.Integer(), nullable=False),
+    sa.Column('doubles', sa.Integer(), nullable=False),
+    sa.Column('triples', sa.Integer(), nullable=False),
+    sa.Column('hr', sa.Integer(), nullable=False),
+    sa.Column('bb', sa.Integer(), nullable=False),
+    sa.Column('hbp', sa.Integer(), nullable=False),
+    sa.Column('k', sa.Integer(), nullable=False),
+    sa.Column('batted_balls', sa.Integer(), nullable=False),
+    sa.Column('avg_ev', sa.Float(), nullable=True),
+    sa.Column('max_ev', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['game_id'], ['games.game_id'], ),
+    sa.PrimaryKeyConstraint('game_id', 'player_key')
+    )
+    with op.batch_alter_table('game_batter_lines', schema=None) as batch_op:
+        batch_op.create_index('ix_game_batter_lines_player_date', ['player_key', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('game_batter_lines', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_batter_lines_player_date')
+    op.drop_table('game_batter_lines')
+
+    with op.batch_alter_table('game_pitcher_lines', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_pitcher_lines_player_date')
+    op.drop_table('game_pitcher_lines')
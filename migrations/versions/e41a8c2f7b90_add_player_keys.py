@@ -0,0 +1,72 @@
+"""Add surrogate player keys and re-key player indexes
+
+Existing rows are populated with `flask ingest backfill-player-keys`.
+
+Revision ID: e41a8c2f7b90
+Revises: b7c3d91e4a06
+Create Date: 2026-10-19 10:27:03.884512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41a8c2f7b90'
+down_revision = 'b7c3d91e4a06'
+branch_labels = None
+depends_on = None
+
+
+KEY_COLUMNS = ['pitcher_key', 'batter_key', 'catcher_key']
+
+
+def upgrade():
+    op.create_table('player_keys',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('trackman_id', sa.Integer(), nullable=True),
+    sa.Column('name_only', sa.String(length=100), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name_only'),
+    sa.UniqueConstraint('trackman_id')
+    )
+
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        for name in KEY_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(f'fk_pitches_{name}', 'player_keys', [name], ['id'])
+
+        batch_op.drop_index('ix_pitches_pitcher_effective_type')
+        batch_op.drop_index('ix_pitches_pitcher_name')
+        batch_op.drop_index('ix_pitches_batter_name')
+        batch_op.drop_index('ix_pitches_pitcher_side_loc')
+        batch_op.drop_index('ix_pitches_batter_hand_loc')
+
+        batch_op.create_index('ix_pitches_pitcher_key_date', ['pitcher_key', 'date'], unique=False)
+        batch_op.create_index('ix_pitches_batter_key_date', ['batter_key', 'date'], unique=False)
+        batch_op.create_index('ix_pitches_catcher_key', ['catcher_key'], unique=False)
+        batch_op.create_index('ix_pitches_pitcher_key_effective_type', ['pitcher_key', 'effective_pitch_type'], unique=False)
+        batch_op.create_index('ix_pitches_pitcher_side_loc', ['pitcher_key', 'batter_side', 'plate_loc_side', 'plate_loc_height'], unique=False)
+        batch_op.create_index('ix_pitches_batter_hand_loc', ['batter_key', 'pitcher_throws', 'plate_loc_side', 'plate_loc_height'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('pitches', schema=None) as batch_op:
+        batch_op.drop_index('ix_pitches_batter_hand_loc')
+        batch_op.drop_index('ix_pitches_pitcher_side_loc')
+        batch_op.drop_index('ix_pitches_pitcher_key_effective_type')
+        batch_op.drop_index('ix_pitches_catcher_key')
+        batch_op.drop_index('ix_pitches_batter_key_date')
+        batch_op.drop_index('ix_pitches_pitcher_key_date')
+
+        batch_op.create_index('ix_pitches_batter_hand_loc', ['batter_id', 'pitcher_throws', 'plate_loc_side', 'plate_loc_height'], unique=False)
+        batch_op.create_index('ix_pitches_pitcher_side_loc', ['pitcher_id', 'batter_side', 'plate_loc_side', 'plate_loc_height'], unique=False)
+        batch_op.create_index('ix_pitches_batter_name', ['batter', 'batter_id'], unique=False)
+        batch_op.create_index('ix_pitches_pitcher_name', ['pitcher', 'pitcher_id'], unique=False)
+        batch_op.create_index('ix_pitches_pitcher_effective_type', ['pitcher_id', 'effective_pitch_type'], unique=False)
+
+        for name in reversed(KEY_COLUMNS):
+            batch_op.drop_constraint(f'fk_pitches_{name}', type_='foreignkey')
+            batch_op.drop_column(name)
+
+    op.drop_table('player_keys')
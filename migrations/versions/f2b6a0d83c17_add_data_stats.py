@@ -0,0 +1,41 @@
+"""Add data_stats summary tables for the dashboard
+
+Existing databases are populated with `flask ingest rebuild-stats`.
+
+Revision ID: f2b6a0d83c17
+Revises: e41a8c2f7b90
+Create Date: 2026-10-19 11:52:40.671205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b6a0d83c17'
+down_revision = 'e41a8c2f7b90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('data_stats',
+    sa.Column('season', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('games', sa.Integer(), nullable=False),
+    sa.Column('pitches', sa.Integer(), nullable=False),
+    sa.Column('pitchers', sa.Integer(), nullable=False),
+    sa.Column('batters', sa.Integer(), nullable=False),
+    sa.Column('last_import_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('season')
+    )
+    op.create_table('data_stats_players',
+    sa.Column('season', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('role', sa.String(length=10), nullable=False),
+    sa.Column('player_key', sa.Integer(), autoincrement=False, nullable=False),
+    sa.PrimaryKeyConstraint('season', 'role', 'player_key')
+    )
+
+
+def downgrade():
+    op.drop_table('data_stats_players')
+    op.drop_table('data_stats')
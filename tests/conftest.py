@@ -0,0 +1,78 @@
+"""Shared fixtures: an app on the testing config, seeded through the importer.
+
+The database is TestingConfig's (in-memory SQLite unless
+TEST_DATABASE_URL is set). Each test module gets a fresh schema.
+"""
+
+import os
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from tests.trackman import write_game_csv
+
+SEED_GAMES = 3
+
+requires_postgres = pytest.mark.skipif(
+    not os.environ.get('TEST_DATABASE_URL', '').startswith('postgresql'),
+    reason='TEST_DATABASE_URL is not a PostgreSQL database')
+
+
+def import_file(path, filename=None):
+    """Run the importer to completion; return its final progress dict."""
+    from app.ingest.services.csv_importer import import_csv
+
+    final = None
+    for progress in import_csv(str(path), filename or path.name):
+        if progress['step'] in ('done', 'error'):
+            final = progress
+    return final
+
+
+def clear_service_caches():
+    """Drop per-process caches keyed on the data version, which restarts
+    at the same values in every fresh test database."""
+    from app.stats.services import player_header, time_series
+    from app.utils import request_cache
+
+    for cache in (player_header._cache, time_series._cache,
+                  request_cache.team_config_cache, request_cache.user_cache):
+        cache.clear()
+
+
+@pytest.fixture(scope='module')
+def app():
+    """App with an empty schema.
+
+    The schema lives on the primary bind. Only that one is named: an app
+    with a reader bind (test_db_engines) leaves a 'reader' metadata on
+    the shared db object, which later apps don't configure.
+    """
+    app = create_app('testing')
+    app.config['LOGIN_DISABLED'] = True
+    with app.app_context():
+        db.drop_all(bind_key=None)
+        db.create_all(bind_key=None)
+    clear_service_caches()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all(bind_key=None)
+
+
+@pytest.fixture(scope='module')
+def seeded_app(app, tmp_path_factory):
+    """App with SEED_GAMES synthetic games imported."""
+    folder = tmp_path_factory.mktemp('trackman')
+    with app.app_context():
+        for game_no in range(1, SEED_GAMES + 1):
+            result = import_file(write_game_csv(folder / f'game{game_no}.csv', game_no))
+            assert result['step'] == 'done', result
+    clear_service_caches()
+    return app
+
+
+@pytest.fixture
+def client(seeded_app):
+    return seeded_app.test_client()
@@ -0,0 +1,131 @@
+from collections import Counter, defaultdict
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.extensions import db
+from app.games.services.box_score import fold_game, get_box_score, get_game_log
+from app.hitters.services.hitter_stats import HitterStatsService
+from app.models.game_line import GameBatterLine, GamePitcherLine
+from app.models.pitch import Pitch
+from app.pitchers.services.pitcher_stats import PitcherStatsService
+from tests.conftest import SEED_GAMES, import_file
+from tests.trackman import game_id, game_rows, write_csv
+
+PITCHER_STATS = {'bf': 'batters_faced', 'p': 'pitches', 'k': 'k', 'bb': 'bb', 'hr': 'hr'}
+BATTER_STATS = ('pa', 'ab', 'h', '2b', '3b', 'hr', 'bb', 'k')
+BATTER_LINE = {'2b': 'doubles', '3b': 'triples'}
+
+
+def _sum_lines(model, fields):
+    totals = defaultdict(Counter)
+    for line in model.query:
+        totals[(line.name, line.team)].update(
+            {stat: getattr(line, attr) for stat, attr in fields.items()})
+    return totals
+
+
+def _sum_rows(rows, stats):
+    totals = defaultdict(Counter)
+    for row in rows:
+        # A switch hitter has a leaderboard row per side, but one line a game
+        totals[(row['name'], row['team'])].update({s: row[s] for s in stats})
+    return totals
+
+
+def test_pitcher_lines_match_the_leaderboard(seeded_app):
+    with seeded_app.app_context():
+        expected = _sum_rows(PitcherStatsService.get_leaderboard(), PITCHER_STATS)
+        assert _sum_lines(GamePitcherLine, PITCHER_STATS) == expected
+
+        hits = db.session.query(Pitch.pitcher, db.func.count()).filter(
+            Pitch.pa_ended == 1,
+            Pitch.play_result.in_(('Single', 'Double', 'Triple', 'HomeRun')),
+        ).group_by(Pitch.pitcher).all()
+        lines = Counter()
+        for line in GamePitcherLine.query:
+            lines[line.name] += line.h
+        assert lines == Counter(dict(hits))
+
+
+def test_batter_lines_match_the_leaderboard(seeded_app):
+    with seeded_app.app_context():
+        expected = _sum_rows(HitterStatsService.get_leaderboard(), BATTER_STATS)
+        fields = {s: BATTER_LINE.get(s, s) for s in BATTER_STATS}
+        assert _sum_lines(GameBatterLine, fields) == expected
+
+
+def test_box_score_teams(seeded_app):
+    with seeded_app.app_context():
+        box = get_box_score(game_id(1))
+        assert [t['team'] for t in box['teams']] == ['TIJ', 'MEX']
+        pitches = sum(t['pitching_totals']['pitches'] for t in box['teams'])
+        assert pitches == Pitch.query.filter_by(game_id=game_id(1)).count()
+        assert get_box_score('nope') is None
+
+
+def test_reimport_with_more_pitches_updates_lines(seeded_app, tmp_path):
+    game_no = 20
+    with seeded_app.app_context():
+        import_file(write_csv(tmp_path / 'part.csv', game_rows(game_no, pitches=100)))
+        assert _pitches_on_lines(game_id(game_no)) == 100
+
+        result = import_file(write_csv(tmp_path / 'full.csv', game_rows(game_no, pitches=180)))
+        assert (result['imported'], result['skipped']) == (80, 100)
+        assert _pitches_on_lines(game_id(game_no)) == 180
+        pa = db.session.query(db.func.sum(Pitch.pa_ended)).filter(
+            Pitch.game_id == game_id(game_no)).scalar()
+        assert sum(line.pa for line in GameBatterLine.query.filter_by(
+            game_id=game_id(game_no))) == pa
+
+
+def _pitches_on_lines(gid):
+    return sum(line.pitches for line in GamePitcherLine.query.filter_by(game_id=gid))
+
+
+@pytest.mark.parametrize('role, kwargs, team, opponent', [
+    ('pitcher', {'trackman_id': 1001}, 'MEX', 'TIJ'),
+    ('pitcher', {'name': 'Doe, Jim'}, 'MEX', 'TIJ'),
+    ('pitcher', {'trackman_id': 1003}, 'TIJ', '@MEX'),
+    ('batter', {'trackman_id': 2001}, 'TIJ', '@MEX'),
+])
+def test_game_log_is_newest_first_with_opponent(seeded_app, role, kwargs, team, opponent):
+    with seeded_app.app_context():
+        log = get_game_log(role, **kwargs)
+    seeded = [entry for entry in log
+              if entry['game'].game_id in {game_id(n) for n in range(1, SEED_GAMES + 1)}]
+    assert [e['game'].game_id for e in seeded] == \
+        [game_id(n) for n in range(SEED_GAMES, 0, -1)]
+    dates = [e['line'].date for e in log]
+    assert dates == sorted(dates, reverse=True)
+    assert all(e['line'].team == team and e['opponent'] == opponent for e in log)
+
+
+def test_unknown_player_has_no_game_log(seeded_app):
+    with seeded_app.app_context():
+        assert get_game_log('batter', name='Nobody, Here') == []
+
+
+def test_fold_game_counts_one_plate_appearance_per_ending_pitch():
+    def pitch(call, pa_ended=0, k_or_bb='', play_result='', exit_speed=None, velo=90.0):
+        return SimpleNamespace(
+            date=date(2026, 4, 2), pitcher_key=1, pitcher_id=1001, pitcher='P',
+            pitcher_team='MEX', batter_key=2, batter_id=2001, batter='B', batter_team='TIJ',
+            pitch_call=call, pitch_group='Fastball', rel_speed=velo, exit_speed=exit_speed,
+            is_whiff=int(call == 'StrikeSwinging'), is_bip=int(call == 'InPlay'),
+            pa_ended=pa_ended, play_result=play_result, k_or_bb=k_or_bb)
+
+    rows = [
+        pitch('BallCalled'), pitch('StrikeSwinging'), pitch('FoulBall'),
+        pitch('StrikeSwinging', 1, k_or_bb='Strikeout', velo=95.0),
+        pitch('InPlay', 1, play_result='HomeRun', exit_speed=104.0),
+        pitch('BallCalled', 1, k_or_bb='Walk', velo=None),
+    ]
+    (pitcher,), (batter,) = fold_game('G', rows)
+
+    assert (pitcher.batters_faced, pitcher.pitches, pitcher.strikes, pitcher.whiffs) == (3, 6, 4, 2)
+    assert (pitcher.k, pitcher.bb, pitcher.h, pitcher.hr) == (1, 1, 1, 1)
+    assert (pitcher.max_velo, pitcher.fb_velo) == (95.0, 91.0)
+    assert (batter.pa, batter.ab, batter.h, batter.hr, batter.k, batter.bb) == (3, 2, 1, 1, 1, 1)
+    assert (batter.batted_balls, batter.avg_ev, batter.max_ev) == (1, 104.0, 104.0)
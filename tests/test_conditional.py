@@ -0,0 +1,31 @@
+from app.extensions import db
+from app.models.data_version import DataVersion
+from app.models.team import TeamConfig
+
+URL = '/stats/api/pitching-leaderboard'
+
+
+def test_unchanged_data_gets_304(client):
+    etag = client.get(URL).headers['ETag']
+    response = client.get(URL, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+def test_branding_change_invalidates_etags(seeded_app, client):
+    etag = client.get(URL).headers['ETag']
+    with seeded_app.app_context():
+        version = DataVersion.current()
+        db.session.add(TeamConfig(team_code='MEX', team_name='Diablos',
+                                  season_year=2026, is_main_team=True))
+        db.session.commit()
+        assert DataVersion.current() == version + 1
+
+        team = TeamConfig.query.filter_by(is_main_team=True).one()
+        team.season_year = 2027
+        db.session.commit()
+        assert DataVersion.current() == version + 2
+
+    response = client.get(URL, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,34 @@
+from sqlalchemy import func
+
+from app.extensions import db
+from app.ingest.services.data_stats import rebuild_data_stats
+from app.models.data_stats import DataStats, ALL_SEASONS
+from app.models.game import Game
+from app.models.pitch import Pitch
+from tests.conftest import SEED_GAMES
+from tests.trackman import PITCHES_PER_GAME
+
+
+def _totals():
+    return {s.season: (s.games, s.pitches, s.pitchers, s.batters)
+            for s in DataStats.query.order_by(DataStats.season)}
+
+
+def test_import_maintains_totals(seeded_app):
+    with seeded_app.app_context():
+        stats = DataStats.get(ALL_SEASONS)
+        assert stats.games == SEED_GAMES == Game.query.count()
+        assert stats.pitches == SEED_GAMES * PITCHES_PER_GAME == Pitch.query.count()
+        assert stats.pitchers == db.session.query(
+            func.count(func.distinct(Pitch.pitcher_key))).scalar()
+        assert stats.batters == db.session.query(
+            func.count(func.distinct(Pitch.batter_key))).scalar()
+        assert DataStats.get(2026).pitches == stats.pitches
+        assert stats.last_import_at is not None
+
+
+def test_rebuild_matches_incremental_totals(seeded_app):
+    with seeded_app.app_context():
+        before = _totals()
+        rebuild_data_stats()
+        assert _totals() == before
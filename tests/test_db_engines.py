@@ -0,0 +1,90 @@
+"""Read/write routing with a reader bind (file-based SQLite only)."""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+import config
+from app import create_app
+from app.extensions import db
+from app.models.upload_log import UploadLog
+from app.utils.db_engines import READER_BIND, use_reader_engine
+from tests.conftest import clear_service_caches, import_file
+from tests.trackman import write_game_csv
+
+
+@pytest.fixture(scope='module')
+def file_app(tmp_path_factory):
+    folder = tmp_path_factory.mktemp('file_db')
+    uri = f"sqlite:///{folder / 'mexpro.db'}"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config.TestingConfig, 'SQLALCHEMY_DATABASE_URI', uri)
+        mp.setattr(config.TestingConfig, 'SQLALCHEMY_BINDS', config.reader_binds(uri))
+        app = create_app('testing')
+    app.config['LOGIN_DISABLED'] = True
+    with app.app_context():
+        assert set(db.engines) == {None, READER_BIND}
+        db.create_all(bind_key=None)
+        assert import_file(write_game_csv(folder / 'game1.csv', 1))['step'] == 'done'
+    clear_service_caches()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def statements(file_app):
+    """(bind key, statement) of every statement run while the test runs."""
+    seen, listeners = [], []
+    with file_app.app_context():
+        for key, engine in db.engines.items():
+            def record(conn, cursor, statement, parameters, context, executemany, key=key):
+                seen.append((key, statement))
+            event.listen(engine, 'before_cursor_execute', record)
+            listeners.append((engine, record))
+    yield seen
+    for engine, record in listeners:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+@pytest.mark.parametrize('url', [
+    '/stats/api/pitching-leaderboard',
+    '/stats/api/pitcher/1001/bundle',
+    '/reports/pitcher/1001/heatmap/overall',
+])
+def test_analytics_requests_read_from_the_reader(file_app, statements, url):
+    clear_service_caches()
+    assert file_app.test_client().get(url).status_code == 200
+    assert statements
+    assert {key for key, _ in statements} == {READER_BIND}
+
+
+def test_other_requests_use_the_primary(file_app, statements):
+    clear_service_caches()
+    assert file_app.test_client().get('/dashboard').status_code == 200
+    assert statements
+    assert {key for key, _ in statements} == {None}
+
+
+def test_flushes_go_to_the_primary(file_app, statements):
+    with file_app.test_request_context('/stats/'):
+        use_reader_engine()
+        db.session.add(UploadLog(filename='routing.csv', status='done'))
+        db.session.flush()
+        # Reads use the reader's own connection, outside this transaction
+        assert db.session.query(UploadLog).filter_by(filename='routing.csv').count() == 0
+        db.session.rollback()
+
+    writes = [key for key, statement in statements if statement.startswith('INSERT')]
+    reads = [key for key, statement in statements if statement.startswith('SELECT')]
+    assert writes == [None]
+    assert reads == [READER_BIND]
+
+
+def test_reader_connections_are_query_only(file_app):
+    with file_app.app_context(), db.engines[READER_BIND].connect() as conn:
+        assert conn.execute(text('SELECT count(*) FROM pitches')).scalar() > 0
+        with pytest.raises(OperationalError, match='readonly'):
+            conn.execute(text("UPDATE pitches SET notes = 'x'"))
@@ -0,0 +1,33 @@
+from sqlalchemy import text
+
+from app.extensions import db
+from app.utils.db_timing import add_statement_observer
+
+
+def _listeners(engine, name):
+    return list(getattr(engine.dispatch, name))
+
+
+def test_one_listener_pair_per_engine(app):
+    # Query stats, slow-query log and request timing share it
+    assert len(app.extensions['db_timing']) == 3
+    with app.app_context():
+        for engine in db.engines.values():
+            assert len(_listeners(engine, 'after_cursor_execute')) == 1
+            assert len(_listeners(engine, 'before_cursor_execute')) == 1
+
+
+def test_observers_get_the_same_elapsed_time(app):
+    seen = []
+    add_statement_observer(app, db, lambda *args: seen.append(('a', args[1], args[-1])))
+    add_statement_observer(app, db, lambda *args: seen.append(('b', args[1], args[-1])))
+    try:
+        with app.app_context():
+            db.session.execute(text('SELECT 1'))
+            db.session.rollback()
+    finally:
+        del app.extensions['db_timing'][-2:]
+
+    ((a, statement, elapsed), (b, _, same)) = [s for s in seen if s[1] == 'SELECT 1']
+    assert (a, b) == ('a', 'b')
+    assert elapsed == same > 0
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from app.pitchers.services.pitch_profiles import summarize_pitch_profiles
+from app.utils.distributions import grouped_quantiles, sorted_group_quantiles
+
+QS = (0.1, 0.5, 0.9)
+
+
+def test_sorted_group_quantiles_match_numpy():
+    rng = np.random.default_rng(7)
+    codes = rng.integers(0, 5, 500)
+    values = rng.normal(90, 4, 500)
+    values[::9] = np.nan
+
+    table = sorted_group_quantiles(codes, values, 6, QS)
+
+    for g in range(5):
+        expected = np.quantile(values[(codes == g) & ~np.isnan(values)], QS)
+        np.testing.assert_allclose(table[g], expected)
+    # Group 5 has no values
+    assert np.isnan(table[5]).all()
+
+
+def test_grouped_quantiles_keys_and_missing_values():
+    frame = pd.DataFrame({
+        'key': [1, 1, 1, 2, 2, None],
+        'team': ['A', 'A', 'A', 'B', 'B', 'B'],
+        'value': [1.0, 2.0, 4.0, np.nan, np.nan, 3.0],
+    })
+    result = grouped_quantiles(frame, ['key', 'team'], 'value', (0.5,))
+    # Key 2 has only missing values; a missing key is reported as None
+    assert result == {(1.0, 'A'): [2.0], (None, 'B'): [3.0]}
+
+
+def test_profile_summary_percentiles_match_numpy():
+    rng = np.random.default_rng(3)
+    rows = [SimpleNamespace(pitch_type=t, horz_break=rng.normal(),
+                            induced_vert_break=rng.normal(), rel_speed=rng.normal(90),
+                            spin_rate=np.nan if t == 'Splitter' else rng.normal(2200, 50))
+            for t in ['Fastball'] * 40 + ['Slider'] * 15 + ['Splitter'] * 5]
+
+    summary = {s['pitch_type']: s for s in summarize_pitch_profiles(rows)}
+
+    for pitch_type, entry in summary.items():
+        velo = [r.rel_speed for r in rows if r.pitch_type == pitch_type]
+        expected = np.percentile(velo, (10, 50, 90))
+        assert [entry['velo_p10'], entry['velo_p50'], entry['velo_p90']] == \
+            [round(float(v), 1) for v in expected]
+    assert summary['Splitter']['spin_p50'] is None
+    assert summary['Slider']['spin_p90'] is not None
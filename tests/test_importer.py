@@ -0,0 +1,70 @@
+from sqlalchemy import event
+
+from app.extensions import db
+from app.ingest.services.csv_importer import CHUNK_SIZE
+from app.models.data_stats import DataStats
+from app.models.pitch import Pitch
+from app.models.player import Player
+from tests.conftest import import_file
+from tests.trackman import game_rows, write_csv
+
+
+def _count_statements(engine, needle):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if needle in statement:
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    return statements, lambda: event.remove(engine, 'before_cursor_execute',
+                                            before_cursor_execute)
+
+
+def test_players_resolved_once_per_chunk(app, tmp_path):
+    rows = game_rows(20, pitches=CHUNK_SIZE + 100)
+    with app.app_context():
+        statements, stop = _count_statements(db.engine, 'FROM players')
+        try:
+            result = import_file(write_csv(tmp_path / 'game20.csv', rows))
+        finally:
+            stop()
+        assert result['step'] == 'done'
+        # One player lookup per chunk, not three per row
+        assert len(statements) == 2
+
+        players = {p.trackman_id: p for p in Player.query}
+        assert set(players) == {1001, 1003, 2001, 2003, 3001}
+        assert (players[1001].name, players[1001].throws, players[1001].team) == \
+            ('Smith, John', 'Right', 'MEX')
+        assert players[3001].name == 'Catch, Er'
+
+
+def test_later_rows_update_players(app, tmp_path):
+    rows = game_rows(21, pitches=50)
+    for row in rows:
+        if row['PitcherId'] == '1001':
+            last = row
+    last['PitcherTeam'] = 'OAX'
+    with app.app_context():
+        assert import_file(write_csv(tmp_path / 'game21.csv', rows))['step'] == 'done'
+        assert Player.query.filter_by(trackman_id=1001).one().team == 'OAX'
+
+
+def test_reimport_counts_and_duplicates(app, tmp_path):
+    rows = game_rows(22, pitches=40)
+    with app.app_context():
+        first = import_file(write_csv(tmp_path / 'game22.csv', rows))
+        assert (first['imported'], first['skipped']) == (40, 0)
+
+        # Same file again: rejected by its hash
+        again = import_file(tmp_path / 'game22.csv', 'copy.csv')
+        assert again['step'] == 'error' and 'Duplicate file' in again['message']
+
+        # Stored pitches plus new ones, and a pitch repeated within the file
+        extra = game_rows(22, pitches=45)[40:]
+        updated = import_file(write_csv(tmp_path / 'game22b.csv', rows + extra + extra[:1]))
+        assert (updated['imported'], updated['skipped']) == (5, 41)
+
+        assert Pitch.query.filter_by(game_id='G0022').count() == 45
+        assert DataStats.get().pitches == Pitch.query.count()
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app.extensions import db
+from app.hitters.services.hitter_stats import HitterStatsService
+from app.models.pitch import Pitch
+from app.pitchers.services.pitcher_stats import PitcherStatsService
+from tests.conftest import clear_service_caches, import_file
+from tests.trackman import game_rows, write_csv
+
+
+@pytest.fixture(scope='module')
+def traded_app(seeded_app, tmp_path_factory):
+    """Seed data plus a game in which 'Lee, Al' pitches, harder, for MEX,
+    so he has a leaderboard row per team."""
+    rows = game_rows(9)
+    for row in rows:
+        if row['Pitcher'] == 'Lee, Al':
+            row['PitcherTeam'] = 'MEX'
+            row['RelSpeed'] = round(row['RelSpeed'] + 15, 1)
+    path = write_csv(tmp_path_factory.mktemp('traded') / 'game9.csv', rows)
+    with seeded_app.app_context():
+        assert import_file(path)['step'] == 'done'
+    clear_service_caches()
+    return seeded_app
+
+
+def _values(column, *criteria):
+    return np.array([v for (v,) in db.session.query(column).filter(
+        column.isnot(None), *criteria)], dtype=float)
+
+
+def _rounded(values, qs):
+    return [round(float(v), 1) for v in np.quantile(values, qs)]
+
+
+def test_pitching_percentiles_follow_leaderboard_rows(traded_app):
+    with traded_app.app_context():
+        rows = PitcherStatsService.get_leaderboard()
+        assert {r['team'] for r in rows if r['name'] == 'Lee, Al'} == {'MEX', 'TIJ'}
+        for row in rows:
+            group = (Pitch.pitcher == row['name'], Pitch.pitcher_throws == row['throws'],
+                     Pitch.pitcher_team == row['team'])
+            velo = _values(Pitch.rel_speed, *group)
+            fastballs = _values(Pitch.rel_speed, *group, Pitch.pitch_group == 'Fastball')
+            assert [row['velo_p10'], row['velo_p50'], row['velo_p90']] == \
+                _rounded(velo, (0.1, 0.5, 0.9))
+            assert [row['max_effort_velo']] == _rounded(fastballs, (0.95,))
+            assert row['velo_p90'] <= row['max_velo']
+
+
+def test_hitting_percentiles_follow_leaderboard_rows(traded_app):
+    with traded_app.app_context():
+        rows = HitterStatsService.get_leaderboard()
+        # The switch hitter has one row per side
+        assert {r['bats'] for r in rows if r['name'] == 'Bat, Three'} == {'Left', 'Right'}
+        for row in rows:
+            ev = _values(Pitch.exit_speed, Pitch.batter == row['name'],
+                         Pitch.batter_side == row['bats'], Pitch.batter_team == row['team'],
+                         Pitch.is_bip == 1)
+            assert [row['ev_p50'], row['ev_p90']] == _rounded(ev, (0.5, 0.9))
+
+
+def test_grid_page_percentiles_match_full_leaderboard(traded_app):
+    client = traded_app.test_client()
+    for url, key in (('/stats/api/pitching-leaderboard', 'velo_p50'),
+                     ('/stats/api/hitting-leaderboard', 'ev_p90')):
+        full = {(r['name'], r['team'], r.get('bats')): r[key]
+                for r in client.get(url).get_json()['rows']}
+        page = client.get(url + '?startRow=0&endRow=3&sortModel=[]').get_json()['rows']
+        assert len(page) == 3
+        assert all(r[key] == full[(r['name'], r['team'], r.get('bats'))] for r in page)
@@ -0,0 +1,88 @@
+"""COPY / staging / merge import path.
+
+The database tests only run when TEST_DATABASE_URL points at PostgreSQL,
+e.g. ``TEST_DATABASE_URL=postgresql+psycopg2://localhost/mexpro_test``.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.extensions import db
+from app.ingest.services.pg_copy import copy_pitches, _csv_field
+from app.models.data_stats import DataStats, ALL_SEASONS
+from app.models.pitch import Pitch
+from tests.conftest import import_file, requires_postgres
+from tests.trackman import game_rows, write_csv
+
+
+@pytest.mark.parametrize('value, is_int, expected', [
+    (None, False, ''),
+    (float('nan'), False, ''),
+    (np.nan, True, ''),
+    (pd.NA, False, ''),
+    ('', False, '""'),
+    ('Four-Seam', False, '"Four-Seam"'),
+    ('say "hi", ok', False, '"say ""hi"", ok"'),
+    (3.0, True, '3'),
+    (np.int64(7), True, '7'),
+    (np.float64(1.5), False, '1.5'),
+    (True, True, '1'),
+    (date(2026, 4, 2), False, '2026-04-02'),
+])
+def test_csv_field(value, is_int, expected):
+    assert _csv_field(value, is_int) == expected
+
+
+@requires_postgres
+def test_import_and_reimport(app, tmp_path):
+    rows = game_rows(30, pitches=120)
+    with app.app_context():
+        first = import_file(write_csv(tmp_path / 'game30.csv', rows))
+        assert first['step'] == 'done'
+        assert (first['imported'], first['skipped'], first['errors']) == (120, 0, 0)
+
+        # Overlapping file: only the new pitches go in
+        more = game_rows(30, pitches=130)
+        second = import_file(write_csv(tmp_path / 'game30b.csv', more))
+        assert (second['imported'], second['skipped']) == (10, 120)
+
+        assert Pitch.query.filter_by(game_id='G0030').count() == 130
+        _assert_totals_match()
+
+
+@requires_postgres
+def test_duplicates_within_file_are_dropped(app, tmp_path):
+    rows = game_rows(31, pitches=20)
+    with app.app_context():
+        result = import_file(write_csv(tmp_path / 'game31.csv', rows + rows[:3]))
+        assert (result['imported'], result['skipped']) == (20, 3)
+        assert Pitch.query.filter_by(game_id='G0031').count() == 20
+        _assert_totals_match()
+
+
+@requires_postgres
+def test_null_and_empty_string_survive_copy(app):
+    frame = pd.DataFrame({
+        'pitch_uid': ['COPY-null', 'COPY-empty', 'COPY-quoted'],
+        'notes': [None, '', 'say "hi", ok'],
+        'rel_speed': [None, 91.5, np.nan],
+        'balls': [None, 2, 3],
+    }).astype(object)
+    with app.app_context():
+        assert copy_pitches(frame, None) == {'COPY-null', 'COPY-empty', 'COPY-quoted'}
+        stored = {p.pitch_uid: (p.notes, p.rel_speed, p.balls) for p in
+                  Pitch.query.filter(Pitch.pitch_uid.like('COPY-%'))}
+        db.session.rollback()
+
+    assert stored['COPY-null'] == (None, None, None)
+    assert stored['COPY-empty'] == ('', 91.5, 2)
+    assert stored['COPY-quoted'] == ('say "hi", ok', None, 3)
+
+
+def _assert_totals_match():
+    stats = DataStats.get(ALL_SEASONS)
+    assert stats.pitches == Pitch.query.count()
+    assert stats.games == db.session.query(db.func.count(db.distinct(Pitch.game_id))).scalar()
@@ -0,0 +1,63 @@
+import gzip
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.extensions import db
+from app.models.pitch import Pitch
+from tests.trackman import PITCHES_PER_GAME
+
+URL = '/stats/api/export/pitches?game_id=G0001&batch_size=64'
+
+
+def _read(fmt, body):
+    if fmt == 'csv':
+        return pd.read_csv(io.BytesIO(body))
+    if fmt == 'parquet':
+        return pq.read_table(io.BytesIO(body)).to_pandas()
+    return pa.ipc.open_stream(body).read_all().to_pandas()
+
+
+@pytest.fixture(scope='module')
+def expected(seeded_app):
+    with seeded_app.app_context():
+        rows = db.session.query(Pitch.pitch_uid, Pitch.rel_speed).filter(
+            Pitch.game_id == 'G0001').all()
+    return dict(rows)
+
+
+@pytest.mark.parametrize('compressed', [False, True], ids=['plain', 'gzip'])
+@pytest.mark.parametrize('fmt', ['csv', 'parquet', 'arrow'])
+def test_export_round_trip(client, expected, fmt, compressed):
+    url = f'{URL}&format={fmt}' + ('&compression=gzip' if compressed else '')
+    response = client.get(url)
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+
+    body = response.get_data()
+    if compressed:
+        assert response.mimetype == 'application/gzip'
+        assert response.headers['Content-Disposition'].endswith('.gz')
+        body = gzip.decompress(body)
+    frame = _read(fmt, body)
+
+    assert len(frame) == PITCHES_PER_GAME
+    assert dict(zip(frame['pitch_uid'], frame['rel_speed'])) == pytest.approx(expected)
+    assert (frame['game_id'] == 'G0001').all()
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'arrow'])
+def test_export_content_encoding(client, expected, fmt):
+    response = client.get(f'{URL}&format={fmt}', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    frame = _read(fmt, gzip.decompress(response.get_data()))
+    assert set(frame['pitch_uid']) == set(expected)
+
+
+def test_export_rejects_unknown_column(client):
+    response = client.get(f'{URL}&columns=pitch_uid,nope')
+    assert response.status_code == 400
+    assert 'nope' in response.get_json()['error']
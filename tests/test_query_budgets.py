@@ -0,0 +1,58 @@
+"""Query-count budgets for the heaviest pages and APIs.
+
+Each request runs with cold service caches, so the budget is the most
+queries the endpoint issues. Raise a budget only on purpose.
+"""
+
+import pytest
+
+import config
+from app import create_app
+from app.utils.query_stats import assert_max_queries
+from tests.conftest import clear_service_caches
+
+BUDGETS = [
+    ('main.dashboard', '/dashboard', 3),
+    ('stats.pitching_leaderboard_api', '/stats/api/pitching-leaderboard', 3),
+    ('stats.pitching_leaderboard_api',
+     '/stats/api/pitching-leaderboard?startRow=0&endRow=50', 4),
+    ('stats.hitting_leaderboard_api', '/stats/api/hitting-leaderboard', 3),
+    ('stats.hitting_leaderboard_api',
+     '/stats/api/hitting-leaderboard?startRow=0&endRow=50', 4),
+    ('stats.pitcher_bundle_api', '/stats/api/pitcher/1001/bundle', 3),
+    ('stats.pitcher_bundle_by_name_api', '/stats/api/pitcher/by-name/Doe, Jim/bundle', 3),
+    ('games.detail', '/games/G0001', 4),
+]
+
+
+@pytest.mark.parametrize('endpoint, url, budget', BUDGETS,
+                         ids=[url for _, url, _ in BUDGETS])
+def test_query_budget(seeded_app, client, endpoint, url, budget):
+    clear_service_caches()
+    with seeded_app.app_context():
+        with assert_max_queries(budget, endpoint=endpoint):
+            response = client.get(url)
+    assert response.status_code == 200
+
+
+def test_budget_exceeded(seeded_app, client):
+    with seeded_app.app_context():
+        with pytest.raises(AssertionError, match='Query budget of 1 exceeded'):
+            with assert_max_queries(1, endpoint='games.detail'):
+                client.get('/games/G0001')
+
+
+def test_endpoint_must_be_requested(seeded_app, client):
+    with seeded_app.app_context():
+        with pytest.raises(AssertionError, match='No request to games.detail'):
+            with assert_max_queries(10, endpoint='games.detail'):
+                client.get('/dashboard')
+
+
+def test_disabled_query_stats(monkeypatch):
+    monkeypatch.setattr(config.TestingConfig, 'QUERY_STATS_ENABLED', False)
+    app = create_app('testing')
+    with app.app_context():
+        with pytest.raises(RuntimeError, match='QUERY_STATS_ENABLED'):
+            with assert_max_queries(3):
+                pass
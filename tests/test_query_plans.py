@@ -0,0 +1,41 @@
+"""Every stats and heatmap query must be served by an index.
+
+Runs the same cases as ``flask stats check-plans`` against the seeded
+test database and fails if any plan step scans the pitches table.
+"""
+
+import pytest
+
+from app.extensions import db
+from app.stats.commands import _sample_values, plan_cases
+from app.utils.query_plans import check_query_plans
+
+
+@pytest.fixture(scope='module')
+def plan_results(seeded_app):
+    with seeded_app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            pytest.skip('EXPLAIN QUERY PLAN checks need SQLite')
+        samples = _sample_values()
+        return check_query_plans(db.engine, plan_cases(samples))
+
+
+def test_samples_cover_name_only_players(seeded_app):
+    with seeded_app.app_context():
+        samples = _sample_values()
+    # By-name cases must resolve to a real player, not an empty filter
+    assert samples['pitcher_name'] == 'Doe, Jim'
+    assert samples['batter_name'] == 'Bat, Two'
+
+
+def test_every_case_queries_pitches(plan_results):
+    labels = {r['label'] for r in plan_results}
+    assert any('heatmap' in label for label in labels)
+    assert any('leaderboard' in label for label in labels)
+    assert len(plan_results) > 50
+
+
+def test_no_full_scans_of_pitches(plan_results):
+    scans = [(r['label'], detail) for r in plan_results
+             for detail in r['plan'] if 'SCAN pitches' in detail]
+    assert scans == []
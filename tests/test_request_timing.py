@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+import pytest
+from flask import Response, stream_with_context
+
+from app import create_app
+from app.utils.request_timing import (
+    BUCKET_BOUNDS, LatencyHistogram, get_latency_stats, server_timing_header,
+)
+
+
+def test_empty_histogram():
+    assert LatencyHistogram().percentile(95) == 0.0
+
+
+def test_single_value_is_every_percentile():
+    hist = LatencyHistogram()
+    hist.add(42.0)
+    assert [hist.percentile(q) for q in (1, 50, 99)] == [pytest.approx(42.0, rel=0.2)] * 3
+    assert hist.percentile(100) <= hist.max_ms == 42.0
+
+
+def test_percentiles_within_bucket_resolution():
+    values = np.random.default_rng(5).lognormal(3, 1, 5000)
+    hist = LatencyHistogram()
+    for v in values:
+        hist.add(v)
+    for q in (50, 95, 99):
+        assert hist.percentile(q) == pytest.approx(np.percentile(values, q), rel=0.2)
+    assert hist.mean_ms == pytest.approx(values.mean())
+    # Beyond the last bound the estimate is capped at the maximum
+    hist.add(BUCKET_BOUNDS[-1] * 10)
+    assert hist.percentile(100) == pytest.approx(hist.max_ms)
+
+
+def test_server_timing_header_format():
+    header = server_timing_header({'db': 3.25, 'app': 10.0}, 13.25)
+    assert header == ('app;dur=10.0;desc="Python", db;dur=3.2;desc="Database", '
+                      'total;dur=13.2')
+
+
+def _parse(header):
+    entries = {}
+    for entry in header.split(', '):
+        name, dur = entry.split(';')[:2]
+        entries[name] = float(dur.removeprefix('dur='))
+    return entries
+
+
+def test_json_response_has_server_timing(client):
+    response = client.get('/stats/api/pitching-leaderboard')
+    timing = _parse(response.headers['Server-Timing'])
+    assert {'db', 'app', 'total'} <= timing.keys()
+    phases = sum(ms for name, ms in timing.items() if name != 'total')
+    # Each value is rounded to 0.1 ms
+    assert phases == pytest.approx(timing['total'], abs=0.1 * len(timing))
+
+
+@pytest.fixture
+def streaming_app():
+    app = create_app('testing')
+
+    @app.route('/slow-stream')
+    def slow_stream():
+        def chunks():
+            for _ in range(3):
+                time.sleep(0.05)
+                yield b'x'
+        return Response(stream_with_context(chunks()))
+
+    return app
+
+
+def test_streamed_response_is_recorded_when_sent(streaming_app):
+    response = streaming_app.test_client().get('/slow-stream')
+    assert 'Server-Timing' not in response.headers
+    with streaming_app.app_context():
+        assert get_latency_stats().endpoints() == []
+
+    assert response.get_data() == b'xxx'
+    response.close()
+    with streaming_app.app_context():
+        (stats,) = get_latency_stats().endpoints()
+    assert (stats.endpoint, stats.requests) == ('slow_stream', 1)
+    assert stats.histogram.max_ms >= 150
+
+
+def test_export_is_timed_with_its_queries(seeded_app, client):
+    response = client.get('/stats/api/export/pitches?batch_size=50')
+    response.get_data()
+    response.close()
+    with seeded_app.app_context():
+        stats = {s.endpoint: s for s in get_latency_stats().endpoints()}
+    export = stats['stats.export_pitches_api']
+    assert export.requests == 1
+    assert export.phase_ms['db'] > 0
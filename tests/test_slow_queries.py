@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import text
+
+import config
+from app import create_app
+from app.extensions import db
+from app.utils.slow_queries import _is_query, explain, get_slow_query_log
+from tests.conftest import requires_postgres
+
+
+@pytest.mark.parametrize('statement, expected', [
+    ('SELECT 1', True),
+    ('  select a FROM t', True),
+    ('\nWITH x AS (SELECT 1) SELECT * FROM x', True),
+    ('with recursive x(n) AS (SELECT 1) SELECT n FROM x', True),
+    ('UPDATE t SET a = 1', False),
+    ('INSERT INTO t VALUES (1)', False),
+    ('SELECTED', False),
+    ('', False),
+])
+def test_is_query(statement, expected):
+    assert _is_query(statement) is expected
+
+
+@pytest.fixture
+def logging_app(monkeypatch):
+    """An app that logs every statement as slow."""
+    monkeypatch.setattr(config.TestingConfig, 'SLOW_QUERY_MS', 1e-9)
+    return create_app('testing')
+
+
+def test_with_statements_are_explained(logging_app):
+    with logging_app.app_context():
+        get_slow_query_log().clear()
+        db.session.execute(text('WITH x AS (SELECT 1 AS a) SELECT a FROM x'))
+        entry = get_slow_query_log().entries()[0]
+    assert entry['statement'].startswith('WITH')
+    assert entry['plan']
+
+
+def test_other_statements_are_not_explained(logging_app):
+    with logging_app.app_context():
+        get_slow_query_log().clear()
+        db.session.execute(text('CREATE TEMPORARY TABLE slow_t (a INTEGER)'))
+        db.session.execute(text('INSERT INTO slow_t VALUES (1)'))
+        entry = get_slow_query_log().entries()[0]
+        db.session.rollback()
+    assert entry['statement'].startswith('INSERT')
+    assert entry['plan'] is None
+
+
+@requires_postgres
+def test_explain_analyze_discards_cte_writes(app):
+    with app.app_context(), db.engine.connect() as conn:
+        conn.execute(text('CREATE TEMPORARY TABLE explain_t (a INTEGER)'))
+        conn.execute(text('INSERT INTO explain_t VALUES (1), (2)'))
+        plan = explain(conn, 'WITH d AS (DELETE FROM explain_t RETURNING a) '
+                             'SELECT count(*) FROM d', {}, analyze=True)
+        assert any('actual' in line for line in plan)
+        assert conn.execute(text('SELECT count(*) FROM explain_t')).scalar() == 2
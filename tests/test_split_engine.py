@@ -0,0 +1,22 @@
+from sqlalchemy import func
+
+from app.extensions import db
+from app.hitters.services.hitter_stats import HitterStatsService
+from app.models.pitch import Pitch
+
+
+def test_hand_split_avg_ev_averages_every_tracked_exit_speed(seeded_app):
+    with seeded_app.app_context():
+        splits = HitterStatsService.get_batter_splits(2001)
+        for key, hand in (('vs_lhp', 'Left'), ('vs_rhp', 'Right')):
+            expected = db.session.query(func.avg(Pitch.exit_speed)).filter(
+                Pitch.batter_id == 2001, Pitch.pitcher_throws == hand).scalar()
+            assert splits[key]['avg_ev'] == round(expected, 1)
+
+
+def test_hand_split_counts(seeded_app):
+    with seeded_app.app_context():
+        splits = HitterStatsService.get_batter_splits(2001)
+        pa = db.session.query(func.sum(Pitch.pa_ended)).filter(
+            Pitch.batter_id == 2001).scalar()
+        assert splits['vs_lhp']['pa'] + splits['vs_rhp']['pa'] == pa
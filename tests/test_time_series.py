@@ -0,0 +1,120 @@
+import pytest
+
+from app.stats.services import time_series
+from app.stats.services.time_series import MAX_WINDOW, get_time_series
+from tests.conftest import SEED_GAMES, import_file
+from tests.trackman import game_id, write_game_csv
+
+PLAYERS = [
+    ('pitcher', {'trackman_id': 1001}),
+    ('pitcher', {'name': 'Doe, Jim'}),
+    ('batter', {'trackman_id': 2003}),
+]
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """The ``after`` argument of every pitch scan."""
+    calls = []
+    scan = time_series._scan
+
+    def recording_scan(clauses, after=None):
+        calls.append(after)
+        return scan(clauses, after)
+
+    monkeypatch.setattr(time_series, '_scan', recording_scan)
+    return calls
+
+
+def _full_rebuild(role, kwargs, **windows):
+    time_series._cache.clear()
+    return get_time_series(role, **kwargs, **windows)
+
+
+def _series(role, kwargs, **windows):
+    return get_time_series(role, **kwargs, **windows)
+
+
+def test_incremental_fold_matches_full_rebuild(seeded_app, tmp_path, scans):
+    with seeded_app.app_context():
+        time_series._cache.clear()
+        before = {i: _series(role, kw, pa_window=7) for i, (role, kw) in enumerate(PLAYERS)}
+        assert all(len(s['games']) == SEED_GAMES for s in before.values())
+
+        # A newer game: only its pitches are scanned and folded
+        new_game = SEED_GAMES + 1
+        import_file(write_game_csv(tmp_path / 'newer.csv', new_game))
+        scans.clear()
+        incremental = {i: _series(role, kw, pa_window=7) for i, (role, kw) in enumerate(PLAYERS)}
+        assert [last_game[1] for last_game in scans] == [game_id(SEED_GAMES)] * len(PLAYERS)
+
+        for i, (role, kw) in enumerate(PLAYERS):
+            series = incremental[i]
+            assert series['games'][:SEED_GAMES] == before[i]['games']
+            assert series['games'][-1]['game_id'] == game_id(new_game)
+            assert series == _full_rebuild(role, kw, pa_window=7)
+
+
+def test_backfilled_older_game_rebuilds(seeded_app, tmp_path, scans):
+    with seeded_app.app_context():
+        time_series._cache.clear()
+        for role, kw in PLAYERS:
+            _series(role, kw)
+
+        # Game 0 is dated before every seeded game
+        import_file(write_game_csv(tmp_path / 'older.csv', 0))
+        scans.clear()
+        rebuilt = [_series(role, kw) for role, kw in PLAYERS]
+        assert scans == [None] * len(PLAYERS)
+
+        for series, (role, kw) in zip(rebuilt, PLAYERS):
+            assert series['games'][0]['game_id'] == game_id(0)
+            assert series == _full_rebuild(role, kw)
+
+
+def test_cached_series_is_reused_at_the_same_version(seeded_app, scans):
+    with seeded_app.app_context():
+        time_series._cache.clear()
+        first = _series('pitcher', {'trackman_id': 1001})
+        assert _series('pitcher', {'trackman_id': 1001}) == first
+    assert len(scans) == 1
+
+
+@pytest.mark.parametrize('role, kwargs', PLAYERS)
+def test_window_of_one(seeded_app, role, kwargs):
+    with seeded_app.app_context():
+        games = _full_rebuild(role, kwargs, pa_window=1, swing_window=1)['games']
+    for line in games:
+        assert line['rolling_pa'] == 1
+        assert line['rolling_k_pct'] in (0.0, 100.0)
+        assert line['rolling_swings'] == 1
+        assert line['rolling_whiff_pct'] in (0.0, 100.0)
+
+
+@pytest.mark.parametrize('role, kwargs', PLAYERS)
+def test_window_larger_than_the_season_is_cumulative(seeded_app, role, kwargs):
+    with seeded_app.app_context():
+        series = _full_rebuild(role, kwargs, pa_window=MAX_WINDOW, swing_window=MAX_WINDOW)
+    pa = 0
+    for line in series['games']:
+        pa += line['pa']
+        assert line['rolling_pa'] == pa
+    assert pa < MAX_WINDOW
+    # The last game's rolling K% is the whole season's
+    k = sum(line['k_pct'] * line['pa'] / 100 for line in series['games'])
+    assert series['games'][-1]['rolling_k_pct'] == pytest.approx(100 * k / pa, abs=0.1)
+
+
+@pytest.mark.parametrize('query', [
+    'pa_window=0', f'pa_window={MAX_WINDOW + 1}', 'swing_window=0', 'swing_window=-5',
+])
+def test_out_of_range_window_is_a_400(client, query):
+    response = client.get(f'/stats/api/pitcher/1001/time-series?{query}')
+    assert response.status_code == 400
+    assert 'between 1 and' in response.get_json()['error']
+
+
+def test_window_at_the_limit_is_accepted(client):
+    response = client.get(f'/stats/api/pitcher/1001/time-series?pa_window={MAX_WINDOW}')
+    assert response.status_code == 200
+    assert response.get_json()['pa_window'] == MAX_WINDOW
@@ -0,0 +1,95 @@
+"""Synthetic Trackman CSVs for the test suite.
+
+Each game is 300 pitches between two teams with a fixed cast: pitchers
+and batters with Trackman IDs, plus one of each without (name-only
+players), so both ways of addressing a player are exercised. Output is
+deterministic for a given game number.
+"""
+
+import csv
+import random
+from datetime import date, timedelta
+
+PITCHES_PER_GAME = 300
+
+PITCHERS = [
+    ('Smith, John', '1001', 'Right', 'MEX'),
+    ('Doe, Jim', '', 'Left', 'MEX'),
+    ('Lee, Al', '1003', 'Left', 'TIJ'),
+]
+BATTERS = [
+    ('Bat, One', '2001', 'Right', 'TIJ'),
+    ('Bat, Two', '', 'Left', 'TIJ'),
+    ('Bat, Three', '2003', 'Switch', 'MEX'),
+]
+
+CALLS = ['BallCalled', 'StrikeCalled', 'StrikeSwinging', 'FoulBall', 'InPlay',
+         'FoulBallNotFieldable', 'HitByPitch']
+PITCH_TYPES = ['Four-Seam', 'Slider', 'Changeup', 'Curveball', 'Sinker', 'Undefined', '']
+RESULTS = ['Single', 'Double', 'Triple', 'HomeRun', 'Out', 'Sacrifice', 'Error']
+
+COLUMNS = [
+    'PitchNo', 'Date', 'Time', 'PAofInning', 'PitchofPA', 'Pitcher', 'PitcherId',
+    'PitcherThrows', 'PitcherTeam', 'Batter', 'BatterId', 'BatterSide', 'BatterTeam',
+    'PitcherSet', 'Inning', 'Top/Bottom', 'Outs', 'Balls', 'Strikes', 'TaggedPitchType',
+    'AutoPitchType', 'PitchCall', 'KorBB', 'TaggedHitType', 'PlayResult', 'RelSpeed',
+    'SpinRate', 'InducedVertBreak', 'HorzBreak', 'Extension', 'RelHeight',
+    'PlateLocHeight', 'PlateLocSide', 'ExitSpeed', 'Angle', 'HomeTeam', 'AwayTeam',
+    'Stadium', 'Level', 'League', 'GameID', 'PitchUID', 'Catcher', 'CatcherId',
+    'CatcherThrows', 'CatcherTeam',
+]
+
+
+def game_id(game_no):
+    return f'G{game_no:04d}'
+
+
+def game_rows(game_no, pitches=PITCHES_PER_GAME):
+    """CSV rows (dicts keyed by COLUMNS) for one game."""
+    rng = random.Random(game_no)
+    day = date(2026, 4, 1) + timedelta(days=game_no)
+    rows = []
+    for i in range(pitches):
+        pitcher = rng.choice(PITCHERS)
+        batter = rng.choice(BATTERS)
+        call = rng.choice(CALLS)
+        in_play = call == 'InPlay'
+        side = batter[2]
+        if side == 'Switch':
+            side = 'Left' if pitcher[2] == 'Right' else 'Right'
+        k_or_bb = ''
+        if call in ('StrikeSwinging', 'BallCalled', 'StrikeCalled'):
+            k_or_bb = rng.choice(['Strikeout', 'Walk', '', '', '', ''])
+        rows.append(dict(zip(COLUMNS, [
+            i + 1, day.isoformat(), '12:00', 1, 1,
+            pitcher[0], pitcher[1], pitcher[2], pitcher[3],
+            batter[0], batter[1], side, batter[3],
+            rng.choice(['Windup', 'Stretch']), rng.randint(1, 9),
+            rng.choice(['Top', 'Bottom']), rng.randint(0, 2), rng.randint(0, 3),
+            rng.randint(0, 2), rng.choice(PITCH_TYPES), rng.choice(PITCH_TYPES[:5]),
+            call, k_or_bb,
+            rng.choice(['GroundBall', 'FlyBall', 'LineDrive']) if in_play else '',
+            rng.choice(RESULTS) if in_play else '',
+            round(rng.uniform(78, 97), 1), round(rng.uniform(1800, 2600)),
+            round(rng.uniform(-5, 18), 1), round(rng.uniform(-15, 15), 1), 6.1, 5.8,
+            round(rng.uniform(0.5, 4.5), 2), round(rng.uniform(-2, 2), 2),
+            round(rng.uniform(60, 110), 1) if in_play else '',
+            round(rng.uniform(-20, 40), 1) if in_play else '',
+            'MEX', 'TIJ', 'Stadium', 'Pro', 'LMB', game_id(game_no),
+            f'UID-{game_no}-{i}', 'Catch, Er', '3001' if i % 2 else '', 'Right', 'MEX',
+        ])))
+    return rows
+
+
+def write_csv(path, rows):
+    """Write rows (dicts keyed by COLUMNS) as a Trackman CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def write_game_csv(path, game_no, pitches=PITCHES_PER_GAME):
+    """Write one synthetic game to path."""
+    return write_csv(path, game_rows(game_no, pitches))